@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
-import uuid
+import time
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from enum import Enum
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from shared.utils import from_ns, new_id
+
+if TYPE_CHECKING:
+    from datetime import datetime
 
 
 class AnomalySeverity(Enum):
@@ -23,6 +29,9 @@ class AnomalyAlgorithm(Enum):
     MOVING_AVERAGE = "MOVING_AVERAGE"
 
 
+_ACTIONABLE = frozenset({AnomalySeverity.CRITICAL, AnomalySeverity.HIGH})
+
+
 @dataclass
 class AnomalyEvent:
     """Detected anomaly with scoring and classification."""
@@ -35,13 +44,19 @@ class AnomalyEvent:
     threshold: float
     description: str
 
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
-    detected_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    id: str = field(default_factory=new_id)
+    detected_at_ns: int = field(default_factory=time.time_ns)
 
     @property
-    def is_actionable(self) -> bool:
-        return self.severity in (AnomalySeverity.CRITICAL, AnomalySeverity.HIGH)
+    def detected_at(self) -> datetime:
+        """Detection time as an aware UTC datetime, built on demand."""
+        return from_ns(self.detected_at_ns)
 
     @property
+    def is_actionable(self) -> bool:
+        return self.severity in _ACTIONABLE
+
+    @cached_property
     def exceeds_threshold(self) -> bool:
+        # Score and threshold are fixed once the anomaly is recorded
         return abs(self.score) > self.threshold
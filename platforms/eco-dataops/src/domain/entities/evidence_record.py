@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import hashlib
-import uuid
+import time
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
+
+from shared.utils import canonical_json, from_ns, new_id
+
+if TYPE_CHECKING:
+    from datetime import datetime
 
 
 class EvidenceState(Enum):
@@ -19,6 +23,9 @@ class EvidenceState(Enum):
     REJECTED = "REJECTED"
 
 
+# Fields the evidence hash covers; reassigning any of them drops the cache.
+_HASHED_FIELDS = frozenset({"id", "payload"})
+
 @dataclass
 class EvidenceRecord:
     """Immutable evidence record with hash-chain binding."""
@@ -26,20 +33,37 @@ class EvidenceRecord:
     source: str
     payload: dict[str, Any]
 
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_id)
     state: EvidenceState = EvidenceState.INGESTED
     hash_value: str = ""
     chain_parent_hash: Optional[str] = None
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at_ns: int = field(default_factory=time.time_ns)
     sealed_at: Optional[datetime] = None
+    _cached_hash: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _HASHED_FIELDS:
+            object.__setattr__(self, "_cached_hash", None)
+        object.__setattr__(self, name, value)
+
+    @property
+    def created_at(self) -> datetime:
+        """Creation time as an aware UTC datetime, built on demand."""
+        return from_ns(self.created_at_ns)
 
     @property
     def evidence_hash(self) -> str:
-        """Compute SHA3-512 hash of record content."""
-        import json
+        """SHA-256 hash of record content, computed once and cached.
 
-        data = f"{self.id}:{json.dumps(self.payload, sort_keys=True, default=str)}"
-        return hashlib.sha3_512(data.encode("utf-8")).hexdigest()
+        The payload is treated as immutable: in-place edits to the dict are
+        not detected, only reassignment of ``id`` or ``payload``.
+        """
+        digest = self._cached_hash
+        if digest is None:
+            data = self.id.encode("utf-8") + b":" + canonical_json(self.payload, default=str)
+            digest = hashlib.sha256(data).hexdigest()
+            object.__setattr__(self, "_cached_hash", digest)
+        return digest
 
     @property
     def is_sealed(self) -> bool:
@@ -3,11 +3,15 @@
 from __future__ import annotations
 
 import hashlib
-import uuid
+import time
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
+
+from shared.utils import from_ns, new_id
+
+if TYPE_CHECKING:
+    from datetime import datetime
 
 
 class ReplayMode(Enum):
@@ -23,6 +27,10 @@ class ReplayStatus(Enum):
     FAILED = "FAILED"
 
 
+# Fields the session hash covers; reassigning any of them drops the cache.
+_HASHED_FIELDS = frozenset({"id", "mode", "start_sequence", "end_sequence"})
+
+
 @dataclass
 class ReplaySession:
     """Replay session tracking state reconstruction lifecycle."""
@@ -31,18 +39,33 @@ class ReplaySession:
     start_sequence: int
     end_sequence: Optional[int] = None
 
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=new_id)
     status: ReplayStatus = ReplayStatus.ACTIVE
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at_ns: int = field(default_factory=time.time_ns)
     completed_at: Optional[datetime] = None
     events_replayed: int = 0
     reconstructed_state: dict[str, Any] = field(default_factory=dict)
+    _cached_hash: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _HASHED_FIELDS:
+            object.__setattr__(self, "_cached_hash", None)
+        object.__setattr__(self, name, value)
+
+    @property
+    def created_at(self) -> datetime:
+        """Creation time as an aware UTC datetime, built on demand."""
+        return from_ns(self.created_at_ns)
 
     @property
     def session_hash(self) -> str:
-        """Compute session integrity hash."""
-        data = f"{self.id}:{self.mode.value}:{self.start_sequence}:{self.end_sequence}"
-        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+        """Session integrity hash, computed once and cached until a hashed field changes."""
+        digest = self._cached_hash
+        if digest is None:
+            data = f"{self.id}:{self.mode.value}:{self.start_sequence}:{self.end_sequence}"
+            digest = hashlib.sha256(data.encode("utf-8")).hexdigest()
+            object.__setattr__(self, "_cached_hash", digest)
+        return digest
 
     @property
     def is_complete(self) -> bool:
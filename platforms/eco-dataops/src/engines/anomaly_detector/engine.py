@@ -12,18 +12,25 @@ Status: ENFORCED
 """
 
 import hashlib
+import itertools
 import json
 import logging
 import math
 import sys
+import threading
 import time
-import uuid
+from bisect import bisect_left, insort
+from collections import Counter, deque
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from shared.utils import new_id
 
 # Configure logging with CRITICAL-only default
 logging.basicConfig(
@@ -32,6 +39,32 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Per-metric state is guarded by one of this many locks, keyed by metric name
+SHARD_COUNT = 32
+
+# Running variances below this fraction of the mean square are recomputed
+# exactly, since sum-of-squares cancellation cannot resolve them
+VARIANCE_CANCELLATION_EPS = 1e-9
+
+# Default number of detected anomalies retained for reports
+MAX_ANOMALY_HISTORY = 10_000
+
+# Ingests between recomputations of a metric's median absolute deviation
+MAD_REFRESH_INTERVAL = 16
+
+# Scales MAD to the standard deviation of a normal distribution (Iglewicz-Hoaglin)
+MODIFIED_Z_SCALE = 0.6745
+
+# Up to this many values, exact moments are cheaper in pure Python than
+# through NumPy's per-call dispatch
+SMALL_WINDOW_MAX = 128
+
+# Detectors stay silent until a metric has buffered this many points
+MIN_DETECTION_POINTS = 10
+
+# Values per vectorized pass in ingest_many; bounds the (chunk x window) temporaries
+INGEST_MANY_CHUNK = 4_096
+
 
 # ============================================
 # ENUMS
@@ -44,6 +77,7 @@ class AnomalyAlgorithm(Enum):
     ISOLATION_FOREST = "isolation_forest"
     MOVING_AVERAGE = "moving_average"
     CUMSUM = "cumsum"
+    HAMPEL = "hampel"
 
 
 class AnomalySeverity(Enum):
@@ -55,11 +89,36 @@ class AnomalySeverity(Enum):
     INFO = "info"
 
 
+# Enum values in declaration order, for ordering report breakdowns
+_SEVERITY_VALUES = tuple(sev.value for sev in AnomalySeverity)
+_ALGORITHM_VALUES = tuple(algo.value for algo in AnomalyAlgorithm)
+
+# Percentiles reported by get_metric_summary, as quantiles
+_SUMMARY_QUANTILES = (0.25, 0.5, 0.75, 0.99)
+
+# Rank used to pick the worst anomaly; lower is more severe
+_SEVERITY_RANK: Dict[AnomalySeverity, int] = {
+    AnomalySeverity.CRITICAL: 0,
+    AnomalySeverity.HIGH: 1,
+    AnomalySeverity.MEDIUM: 2,
+    AnomalySeverity.LOW: 3,
+    AnomalySeverity.INFO: 4,
+}
+
+# Minimum score/threshold ratio for each severity, most severe first
+_SEVERITY_THRESHOLDS: Tuple[Tuple[float, AnomalySeverity], ...] = (
+    (4.0, AnomalySeverity.CRITICAL),
+    (3.0, AnomalySeverity.HIGH),
+    (2.0, AnomalySeverity.MEDIUM),
+    (1.5, AnomalySeverity.LOW),
+)
+
+
 # ============================================
 # DATA STRUCTURES
 # ============================================
 
-@dataclass
+@dataclass(slots=True)
 class DataPoint:
     """A single metric data point with labels."""
     timestamp: float = field(default_factory=time.time)
@@ -68,10 +127,215 @@ class DataPoint:
     labels: Dict[str, str] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
+class _WindowStats:
+    """Running sums over a metric's window and its moving-average span."""
+    total: float = 0.0
+    total_sq: float = 0.0
+    ma_span: int = 0
+    ma_count: int = 0
+    ma_total: float = 0.0
+    ma_total_sq: float = 0.0
+    updates: int = 0
+    mad: Optional[float] = None
+    mad_age: int = 0
+
+
+def _running_moments(total: float, total_sq: float, n: int) -> Optional[Tuple[float, float]]:
+    """Return (mean, population std) from running sums, or None if imprecise.
+
+    Args:
+        total: Sum of the values.
+        total_sq: Sum of the squared values.
+        n: Number of values.
+
+    Returns:
+        The mean and standard deviation, or None when the variance is too
+        small relative to the values to be trusted.
+    """
+    mean = total / n
+    mean_sq = total_sq / n
+    variance = mean_sq - mean * mean
+    if variance <= VARIANCE_CANCELLATION_EPS * mean_sq:
+        return None
+    return mean, math.sqrt(variance)
+
+
+def _exact_moments(values: np.ndarray) -> Tuple[float, float]:
+    """Return the two-pass mean and population std of a 1-D float array.
+
+    Args:
+        values: Non-empty 1-D float array.
+
+    Returns:
+        The mean and standard deviation.
+    """
+    if values.size > SMALL_WINDOW_MAX:
+        return float(values.mean()), float(values.std())
+    items = values.tolist()
+    n = len(items)
+    # Built-in sum, not math.fsum, which raises on inf + -inf
+    mean = sum(items) / n
+    variance = sum([(v - mean) * (v - mean) for v in items]) / n
+    return mean, math.sqrt(variance)
+
+
+def _rolling_mean_std(values: np.ndarray, width: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the mean and population std of every length-`width` window.
+
+    Uses differences of cumulative sums (and sums of squares), so the cost is
+    O(N) rather than O(N * width). Values are centred first to limit
+    cancellation, and windows whose variance is within rounding noise of the
+    cumulative sums are recomputed exactly, so constant windows still report
+    a zero std.
+
+    Args:
+        values: 1-D float array.
+        width: Window length.
+
+    Returns:
+        Means and standard deviations, one per window (len(values) - width + 1).
+    """
+    view = sliding_window_view(values, width)
+    if not np.isfinite(values).all():
+        # NaN/inf would poison every later cumulative sum
+        return view.mean(axis=1), view.std(axis=1)
+
+    shift = values.mean()
+    centred = values - shift
+    c1 = np.concatenate(([0.0], np.cumsum(centred)))
+    c2 = np.concatenate(([0.0], np.cumsum(centred * centred)))
+    mean_c = (c1[width:] - c1[:-width]) / width
+    variance = (c2[width:] - c2[:-width]) / width - mean_c * mean_c
+    means = mean_c + shift
+    stds = np.sqrt(np.maximum(variance, 0.0))
+
+    imprecise = variance <= VARIANCE_CANCELLATION_EPS * c2[width:] / width
+    if imprecise.any():
+        means[imprecise] = view[imprecise].mean(axis=1)
+        stds[imprecise] = view[imprecise].std(axis=1)
+    return means, stds
+
+
+@lru_cache(maxsize=256)
+def _quantile_plan(
+    n: int, quantiles: Tuple[float, ...],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Precompute partition indices and weights for linear-interpolated quantiles.
+
+    Args:
+        n: Number of values.
+        quantiles: Quantiles in [0, 1].
+
+    Returns:
+        The lower and upper neighbour indices, the interpolation weights, and
+        the kth indices to partition on (the last slot is included so NaNs
+        surface there).
+    """
+    virtual = (n - 1) * np.asarray(quantiles, dtype=np.float64)
+    lower = np.floor(virtual)
+    upper = lower + 1
+    gamma = virtual - lower
+    upper[virtual >= n - 1] = n - 1
+    lower = lower.astype(np.intp)
+    upper = upper.astype(np.intp)
+    kth = np.unique(np.concatenate((lower, upper, [n - 1])))
+    return lower, upper, gamma, kth
+
+
+def _quantiles(values: np.ndarray, quantiles: Tuple[float, ...]) -> np.ndarray:
+    """Return quantiles identical to ``np.quantile``'s linear method.
+
+    A single ``np.partition`` (introselect, O(N)) places every neighbour the
+    interpolation needs, instead of sorting the array.
+
+    Args:
+        values: 1-D float array; it is not modified.
+        quantiles: Quantiles in [0, 1].
+
+    Returns:
+        One value per requested quantile.
+    """
+    lower, upper, gamma, kth = _quantile_plan(values.size, quantiles)
+    part = np.partition(values, kth)
+    if np.isnan(part[-1]):
+        return np.full(gamma.size, np.nan)
+    a = part[lower]
+    b = part[upper]
+    diff = b - a
+    # Same two-sided lerp as NumPy, so results match it bit for bit
+    result = a + diff * gamma
+    np.subtract(b, diff * (1 - gamma), out=result, where=gamma >= 0.5)
+    return result
+
+
+@lru_cache(maxsize=256)
+def _interpolation_steps(
+    n: int, quantiles: Tuple[float, ...],
+) -> Tuple[Tuple[int, int, float], ...]:
+    """Return (lower, upper, weight) per quantile as plain Python scalars."""
+    lower, upper, gamma, _ = _quantile_plan(n, quantiles)
+    return tuple(zip(lower.tolist(), upper.tolist(), gamma.tolist(), strict=True))
+
+
+def _sorted_quantiles(ordered: List[float], quantiles: Tuple[float, ...]) -> List[float]:
+    """Return linear-interpolated quantiles of an already sorted list.
+
+    Args:
+        ordered: Values in ascending order.
+        quantiles: Quantiles in [0, 1].
+
+    Returns:
+        One value per requested quantile, matching :func:`_quantiles`.
+    """
+    result = []
+    for lower, upper, gamma in _interpolation_steps(len(ordered), quantiles):
+        a = ordered[lower]
+        b = ordered[upper]
+        diff = b - a
+        result.append(b - diff * (1 - gamma) if gamma >= 0.5 else a + diff * gamma)
+    return result
+
+
+@dataclass(slots=True)
+class _AnomalyTally:
+    """Counts of the anomalies currently held in the detector's history."""
+    by_severity: Counter = field(default_factory=Counter)
+    by_algorithm: Counter = field(default_factory=Counter)
+    by_metric: Counter = field(default_factory=Counter)
+
+    def add(self, anomaly: "AnomalyEvent") -> None:
+        """Count an anomaly entering the history."""
+        self.by_severity[anomaly.severity_str] += 1
+        self.by_algorithm[anomaly.algorithm_str] += 1
+        self.by_metric[anomaly.data_point.metric_name] += 1
+
+    def discard(self, anomaly: "AnomalyEvent") -> None:
+        """Uncount an anomaly leaving the history, dropping emptied keys."""
+        for counter, key in (
+            (self.by_severity, anomaly.severity_str),
+            (self.by_algorithm, anomaly.algorithm_str),
+            (self.by_metric, anomaly.data_point.metric_name),
+        ):
+            counter[key] -= 1
+            if counter[key] <= 0:
+                del counter[key]
+
+
+@dataclass(slots=True)
+class _Hit:
+    """A detector result whose description is only formatted if it is reported."""
+    algorithm: AnomalyAlgorithm
+    severity: AnomalySeverity
+    score: float
+    threshold: float
+    describe: Callable[[], str]
+
+
+@dataclass(slots=True)
 class AnomalyEvent:
     """A detected anomaly event with full context."""
-    event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    event_id: str = field(default_factory=new_id)
     data_point: DataPoint = field(default_factory=DataPoint)
     algorithm: AnomalyAlgorithm = AnomalyAlgorithm.Z_SCORE
     severity: AnomalySeverity = AnomalySeverity.INFO
@@ -79,6 +343,14 @@ class AnomalyEvent:
     threshold: float = 0.0
     description: str = ""
     detected_at: float = field(default_factory=time.time)
+    # Enum .value goes through a descriptor on every access; the strings are
+    # resolved once here for logging, counters and serialization
+    severity_str: str = field(init=False, repr=False, compare=False)
+    algorithm_str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.severity_str = self.severity.value
+        self.algorithm_str = self.algorithm.value
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to a serializable dictionary."""
@@ -86,8 +358,8 @@ class AnomalyEvent:
             "event_id": self.event_id,
             "metric_name": self.data_point.metric_name,
             "value": self.data_point.value,
-            "algorithm": self.algorithm.value,
-            "severity": self.severity.value,
+            "algorithm": self.algorithm_str,
+            "severity": self.severity_str,
             "score": self.score,
             "threshold": self.threshold,
             "description": self.description,
@@ -115,8 +387,21 @@ class AnomalyDetectorEngine:
             z_threshold: Z-score threshold for anomaly detection.
             iqr_multiplier: IQR multiplier for outlier fencing.
         """
-        self.metric_buffers: Dict[str, List[DataPoint]] = {}
-        self.detected_anomalies: List[AnomalyEvent] = []
+        # Per-metric float ring buffers: detectors read values from here. The
+        # newest point's fields are kept column-wise, and a DataPoint is only
+        # built when an AnomalyEvent or summary needs one.
+        self._last_value: Dict[str, float] = {}
+        self._last_timestamp: Dict[str, float] = {}
+        self._last_labels: Dict[str, Dict[str, str]] = {}
+        self._values: Dict[str, np.ndarray] = {}
+        self._head: Dict[str, int] = {}
+        self._count: Dict[str, int] = {}
+        # Running sums make mean/std O(1) per ingest; resynced every window
+        self._stats: Dict[str, _WindowStats] = {}
+        # Sorted copy of each window, kept by bisection, for O(1) quartiles
+        self._sorted: Dict[str, List[float]] = {}
+        # Per-metric buffer that unwrapped window views are written into
+        self._scratch: Dict[str, np.ndarray] = {}
         self.config: Dict[str, Any] = {
             "window_size": window_size,
             "z_threshold": z_threshold,
@@ -125,8 +410,25 @@ class AnomalyDetectorEngine:
             "moving_avg_deviation": 2.0,
             "cumsum_drift": 0.5,
             "cumsum_threshold": 5.0,
+            "hampel_enabled": False,
+            "hampel_threshold": 3.5,
+            # INFO-log one in every N reported anomalies; 1 or less logs all of them
+            "info_log_sample_rate": 1,
+            "max_history": MAX_ANOMALY_HISTORY,
         }
+        # Oldest anomalies are evicted, and uncounted, once the history is full
+        self.detected_anomalies: Deque[AnomalyEvent] = deque(
+            maxlen=self.config["max_history"]
+        )
+        self._history_lock = threading.Lock()
+        self._tally = _AnomalyTally()
         self._cumsum_state: Dict[str, Dict[str, float]] = {}
+        # Calls for the same metric serialize on its shard; unrelated metrics
+        # proceed concurrently.
+        self._shard_locks = tuple(threading.Lock() for _ in range(SHARD_COUNT))
+        # Per-shard mutation counters, each bumped under its own shard lock
+        self._shard_versions: List[int] = [0] * SHARD_COUNT
+        self._log_sequence = itertools.count()
         logger.info(
             "AnomalyDetectorEngine initialized: window=%d z_thresh=%.1f iqr_mult=%.1f",
             window_size, z_threshold, iqr_multiplier,
@@ -136,6 +438,11 @@ class AnomalyDetectorEngine:
     # PUBLIC API
     # ------------------------------------------
 
+    @property
+    def report_version(self) -> int:
+        """Monotonic counter that changes whenever ingested state changes."""
+        return sum(self._shard_versions)
+
     def ingest(
         self,
         metric_name: str,
@@ -144,8 +451,8 @@ class AnomalyDetectorEngine:
     ) -> Optional[AnomalyEvent]:
         """Ingest a metric data point and run anomaly detection.
 
-        Adds the data point to the appropriate metric buffer, trims to
-        window_size, and runs all detection algorithms. Returns the
+        Writes the value into the metric's ring buffer, overwriting the
+        oldest once window_size is reached, and runs all detection algorithms. Returns the
         highest-severity anomaly if any are detected.
 
         Args:
@@ -156,118 +463,269 @@ class AnomalyDetectorEngine:
         Returns:
             The highest-severity AnomalyEvent detected, or None.
         """
-        point = DataPoint(
-            metric_name=metric_name,
-            value=value,
-            labels=labels or {},
-        )
+        with self._shard_lock(metric_name):
+            return self._ingest_point(metric_name, value, labels)
 
-        # Initialize buffer if needed
-        if metric_name not in self.metric_buffers:
-            self.metric_buffers[metric_name] = []
+    def ingest_many(
+        self,
+        metric_name: str,
+        values: Sequence[float],
+        labels: Optional[Dict[str, str]] = None,
+    ) -> List[Optional[AnomalyEvent]]:
+        """Ingest a batch of data points for one metric, in order.
 
-        self.metric_buffers[metric_name].append(point)
+        Equivalent to calling :meth:`ingest` for each value, but once the
+        metric's window is full the detectors run vectorized over the whole
+        batch, which suits replays and backfills. Windows smaller than
+        MIN_DETECTION_POINTS never detect, so they are always ingested
+        point by point. Values in a batch share one
+        timestamp and one labels dict.
 
-        # Trim buffer to window size
+        Args:
+            metric_name: Name of the metric.
+            values: Numeric values of the data points, oldest first.
+            labels: Optional key-value labels for every data point.
+
+        Returns:
+            One entry per value: the highest-severity AnomalyEvent detected
+            for it, or None.
+        """
+        batch = np.asarray(values, dtype=np.float64).ravel()
         window = self.config["window_size"]
-        if len(self.metric_buffers[metric_name]) > window:
-            self.metric_buffers[metric_name] = self.metric_buffers[metric_name][-window:]
+        results: List[Optional[AnomalyEvent]] = []
+        with self._shard_lock(metric_name):
+            # Windows are ragged until the ring fills, and too-small windows
+            # never detect, so go point by point
+            start = 0
+            while start < batch.size and (
+                window < MIN_DETECTION_POINTS or self._count.get(metric_name, 0) < window
+            ):
+                results.append(self._ingest_point(metric_name, float(batch[start]), labels))
+                start += 1
+            for offset in range(start, batch.size, INGEST_MANY_CHUNK):
+                block = batch[offset:offset + INGEST_MANY_CHUNK]
+                results.extend(self._ingest_block(metric_name, block, labels))
+        return results
+
+    def detect_zscore(
+        self,
+        metric_name: str,
+        values: Optional[np.ndarray] = None,
+    ) -> Optional[AnomalyEvent]:
+        """Run Z-score anomaly detection on the latest data point.
 
-        # Need minimum data points for detection
-        if len(self.metric_buffers[metric_name]) < 10:
-            return None
+        Args:
+            metric_name: Name of the metric to analyze.
+            values: The metric's buffered values, oldest first; read from the
+                ring buffer when omitted.
 
-        # Run all detection algorithms and collect anomalies
-        anomalies: List[AnomalyEvent] = []
+        Returns:
+            An AnomalyEvent if the latest point is anomalous, else None.
+        """
+        hit = self._zscore_hit(metric_name, values)
+        return self._materialize(metric_name, hit) if hit is not None else None
 
-        zscore_result = self.detect_zscore(metric_name)
-        if zscore_result:
-            anomalies.append(zscore_result)
+    def detect_iqr(
+        self,
+        metric_name: str,
+        values: Optional[np.ndarray] = None,
+    ) -> Optional[AnomalyEvent]:
+        """Run IQR-based anomaly detection on the latest data point.
 
-        iqr_result = self.detect_iqr(metric_name)
-        if iqr_result:
-            anomalies.append(iqr_result)
+        Args:
+            metric_name: Name of the metric to analyze.
+            values: The metric's buffered values, oldest first; read from the
+                ring buffer when omitted.
 
-        mavg_result = self.detect_moving_average(metric_name)
-        if mavg_result:
-            anomalies.append(mavg_result)
+        Returns:
+            An AnomalyEvent if the latest point is an outlier, else None.
+        """
+        hit = self._iqr_hit(metric_name, values)
+        return self._materialize(metric_name, hit) if hit is not None else None
 
-        # Return highest severity anomaly
-        if anomalies:
-            severity_order = [
-                AnomalySeverity.CRITICAL,
-                AnomalySeverity.HIGH,
-                AnomalySeverity.MEDIUM,
-                AnomalySeverity.LOW,
-                AnomalySeverity.INFO,
-            ]
-            anomalies.sort(key=lambda a: severity_order.index(a.severity))
-            worst = anomalies[0]
-            self.detected_anomalies.append(worst)
-            logger.info(
-                "Anomaly detected: metric=%s value=%.4f severity=%s algo=%s",
-                metric_name, value, worst.severity.value, worst.algorithm.value,
-            )
-            return worst
+    def detect_moving_average(
+        self,
+        metric_name: str,
+        values: Optional[np.ndarray] = None,
+    ) -> Optional[AnomalyEvent]:
+        """Run moving average deviation detection on the latest data point.
 
-        return None
+        Args:
+            metric_name: Name of the metric to analyze.
+            values: The metric's buffered values, oldest first; read from the
+                ring buffer when omitted.
 
-    def detect_zscore(self, metric_name: str) -> Optional[AnomalyEvent]:
-        """Run Z-score anomaly detection on the latest data point.
+        Returns:
+            An AnomalyEvent if the latest point deviates from the moving average, else None.
+        """
+        hit = self._moving_average_hit(metric_name, values)
+        return self._materialize(metric_name, hit) if hit is not None else None
+
+    def detect_hampel(
+        self,
+        metric_name: str,
+        values: Optional[np.ndarray] = None,
+    ) -> Optional[AnomalyEvent]:
+        """Run Hampel (median/MAD) outlier detection on the latest data point.
+
+        Unlike the Z-score, the median and MAD are not dragged along by
+        outliers already in the window. The median comes from the sorted
+        window; the MAD drifts slowly and is refreshed every
+        MAD_REFRESH_INTERVAL ingests.
 
         Args:
             metric_name: Name of the metric to analyze.
+            values: The metric's buffered values, oldest first; read from the
+                ring buffer when omitted.
 
         Returns:
-            An AnomalyEvent if the latest point is anomalous, else None.
+            An AnomalyEvent if the latest point's modified Z-score exceeds the
+            threshold, else None.
+        """
+        hit = self._hampel_hit(metric_name, values)
+        return self._materialize(metric_name, hit) if hit is not None else None
+
+    def get_anomaly_report(self) -> Dict[str, Any]:
+        """Generate a summary report of all detected anomalies.
+
+        Returns:
+            Dictionary with anomaly counts, severity breakdown, algorithm breakdown.
+        """
+        with self._history_lock:
+            severities = self._tally.by_severity.copy()
+            algorithms = self._tally.by_algorithm.copy()
+            by_metric = dict(self._tally.by_metric)
+        counts = tuple(self._count.values())
+
+        by_severity = {
+            value: severities[value] for value in _SEVERITY_VALUES if severities[value] > 0
+        }
+        by_algorithm = {
+            value: algorithms[value] for value in _ALGORITHM_VALUES if algorithms[value] > 0
+        }
+
+        return {
+            "total_anomalies": sum(by_severity.values()),
+            "by_severity": by_severity,
+            "by_algorithm": by_algorithm,
+            "by_metric": by_metric,
+            "total_metrics_tracked": len(counts),
+            "total_data_points": sum(counts),
+            "config": dict(self.config),
+        }
+
+    def get_metric_summary(self, metric_name: str) -> Dict[str, Any]:
+        """Return statistical summary for a specific metric.
+
+        Args:
+            metric_name: Name of the metric.
+
+        Returns:
+            Dictionary with count, mean, std, min, max, percentiles, and anomaly count.
         """
-        buffer = self.metric_buffers.get(metric_name)
-        if not buffer or len(buffer) < 10:
+        with self._shard_lock(metric_name):
+            if metric_name not in self._last_value:
+                return {"error": f"No data for metric '{metric_name}'"}
+
+            values = self._window_view(metric_name)
+            with self._history_lock:
+                anomaly_count = self._tally.by_metric[metric_name]
+            ordered = self._sorted[metric_name]
+            if len(ordered) == values.size:
+                # The sorted window answers min, max and percentiles directly
+                low, high = ordered[0], ordered[-1]
+                p25, p50, p75, p99 = _sorted_quantiles(ordered, _SUMMARY_QUANTILES)
+            else:
+                low, high = values.min(), values.max()
+                p25, p50, p75, p99 = _quantiles(values, _SUMMARY_QUANTILES)
+
+            return {
+                "metric_name": metric_name,
+                "count": self._count[metric_name],
+                "mean": float(values.mean()),
+                "std": float(values.std()),
+                "min": float(low),
+                "max": float(high),
+                "p25": float(p25),
+                "p50": float(p50),
+                "p75": float(p75),
+                "p99": float(p99),
+                "anomaly_count": anomaly_count,
+                "latest_value": float(values[-1]),
+                "latest_timestamp": self._last_timestamp[metric_name],
+            }
+
+    # ------------------------------------------
+    # INTERNAL METHODS
+    # ------------------------------------------
+
+    def _zscore_hit(
+        self,
+        metric_name: str,
+        values: Optional[np.ndarray],
+    ) -> Optional[_Hit]:
+        """Body of :meth:`detect_zscore`, deferring the AnomalyEvent."""
+        count = self._count.get(metric_name, 0)
+        if count < MIN_DETECTION_POINTS:
             return None
 
-        values = np.array([p.value for p in buffer])
-        mean = np.mean(values)
-        std = np.std(values)
+        stats = self._stats[metric_name]
+        moments = _running_moments(stats.total, stats.total_sq, count)
+        if moments is not None:
+            mean, std = moments
+        else:
+            if values is None:
+                # Order is irrelevant for mean/std, so read the ring in place
+                values = self._values[metric_name][:count]
+            mean, std = _exact_moments(values)
+
+        return self._zscore_verdict(self._last_value[metric_name], mean, std)
 
+    def _zscore_verdict(self, latest: float, mean: float, std: float) -> Optional[_Hit]:
+        """Judge a value against its window's mean and standard deviation."""
         if std == 0:
             return None
 
-        latest = buffer[-1]
-        z_score = abs((latest.value - mean) / std)
+        z_score = abs((latest - mean) / std)
         threshold = self.config["z_threshold"]
 
         if z_score > threshold:
             severity = self._classify_severity(z_score, threshold)
-            return AnomalyEvent(
-                data_point=latest,
+            return _Hit(
                 algorithm=AnomalyAlgorithm.Z_SCORE,
                 severity=severity,
                 score=float(z_score),
                 threshold=threshold,
-                description=(
-                    f"Z-score anomaly: value={latest.value:.4f}, "
+                describe=lambda: (
+                    f"Z-score anomaly: value={latest:.4f}, "
                     f"z={z_score:.2f}, mean={mean:.4f}, std={std:.4f}"
                 ),
             )
 
         return None
 
-    def detect_iqr(self, metric_name: str) -> Optional[AnomalyEvent]:
-        """Run IQR-based anomaly detection on the latest data point.
-
-        Args:
-            metric_name: Name of the metric to analyze.
-
-        Returns:
-            An AnomalyEvent if the latest point is an outlier, else None.
-        """
-        buffer = self.metric_buffers.get(metric_name)
-        if not buffer or len(buffer) < 10:
+    def _iqr_hit(
+        self,
+        metric_name: str,
+        values: Optional[np.ndarray],
+    ) -> Optional[_Hit]:
+        """Body of :meth:`detect_iqr`, deferring the AnomalyEvent."""
+        count = self._count.get(metric_name, 0)
+        if count < MIN_DETECTION_POINTS:
             return None
 
-        values = np.array([p.value for p in buffer])
-        q1 = np.percentile(values, 25)
-        q3 = np.percentile(values, 75)
+        ordered = self._sorted[metric_name]
+        if len(ordered) == count:
+            q1, q3 = _sorted_quantiles(ordered, (0.25, 0.75))
+        else:
+            # The window holds NaNs, which only a full selection propagates
+            if values is None:
+                values = self._values[metric_name][:count]
+            q1, q3 = _quantiles(values, (0.25, 0.75))
+        return self._iqr_verdict(self._last_value[metric_name], q1, q3)
+
+    def _iqr_verdict(self, latest: float, q1: float, q3: float) -> Optional[_Hit]:
+        """Judge a value against its window's quartile fences."""
         iqr = q3 - q1
 
         if iqr == 0:
@@ -277,23 +735,21 @@ class AnomalyDetectorEngine:
         lower_fence = q1 - multiplier * iqr
         upper_fence = q3 + multiplier * iqr
 
-        latest = buffer[-1]
-        if latest.value < lower_fence or latest.value > upper_fence:
+        if latest < lower_fence or latest > upper_fence:
             # Compute a normalized score: how far outside the fences
-            if latest.value < lower_fence:
-                deviation = (lower_fence - latest.value) / iqr
+            if latest < lower_fence:
+                deviation = (lower_fence - latest) / iqr
             else:
-                deviation = (latest.value - upper_fence) / iqr
+                deviation = (latest - upper_fence) / iqr
 
             severity = self._classify_severity(deviation, 1.0)
-            return AnomalyEvent(
-                data_point=latest,
+            return _Hit(
                 algorithm=AnomalyAlgorithm.IQR,
                 severity=severity,
                 score=float(deviation),
                 threshold=float(multiplier),
-                description=(
-                    f"IQR outlier: value={latest.value:.4f}, "
+                describe=lambda: (
+                    f"IQR outlier: value={latest:.4f}, "
                     f"Q1={q1:.4f}, Q3={q3:.4f}, IQR={iqr:.4f}, "
                     f"fences=[{lower_fence:.4f}, {upper_fence:.4f}]"
                 ),
@@ -301,45 +757,50 @@ class AnomalyDetectorEngine:
 
         return None
 
-    def detect_moving_average(self, metric_name: str) -> Optional[AnomalyEvent]:
-        """Run moving average deviation detection on the latest data point.
-
-        Args:
-            metric_name: Name of the metric to analyze.
-
-        Returns:
-            An AnomalyEvent if the latest point deviates from the moving average, else None.
-        """
-        buffer = self.metric_buffers.get(metric_name)
-        if not buffer or len(buffer) < 10:
+    def _moving_average_hit(
+        self,
+        metric_name: str,
+        values: Optional[np.ndarray],
+    ) -> Optional[_Hit]:
+        """Body of :meth:`detect_moving_average`, deferring the AnomalyEvent."""
+        count = self._count.get(metric_name, 0)
+        if count < MIN_DETECTION_POINTS:
             return None
 
-        ma_window = min(self.config["moving_avg_window"], len(buffer) - 1)
+        ma_window = min(self.config["moving_avg_window"], count - 1)
         if ma_window < 5:
             return None
 
         # Compute moving average over the window (excluding the latest point)
-        window_values = np.array([p.value for p in buffer[-(ma_window + 1):-1]])
-        ma = np.mean(window_values)
-        ma_std = np.std(window_values)
+        stats = self._stats[metric_name]
+        moments = None
+        if stats.ma_count == ma_window:
+            moments = _running_moments(stats.ma_total, stats.ma_total_sq, ma_window)
+        if moments is not None:
+            ma, ma_std = moments
+        else:
+            if values is None:
+                values = self._window_view(metric_name)
+            ma, ma_std = _exact_moments(values[-(ma_window + 1):-1])
+        return self._moving_average_verdict(self._last_value[metric_name], ma, ma_std)
 
+    def _moving_average_verdict(self, latest: float, ma: float, ma_std: float) -> Optional[_Hit]:
+        """Judge a value against the moving average of the points before it."""
         if ma_std == 0:
             return None
 
-        latest = buffer[-1]
         deviation_factor = self.config["moving_avg_deviation"]
-        deviation = abs(latest.value - ma) / ma_std
+        deviation = abs(latest - ma) / ma_std
 
         if deviation > deviation_factor:
             severity = self._classify_severity(deviation, deviation_factor)
-            return AnomalyEvent(
-                data_point=latest,
+            return _Hit(
                 algorithm=AnomalyAlgorithm.MOVING_AVERAGE,
                 severity=severity,
                 score=float(deviation),
                 threshold=float(deviation_factor),
-                description=(
-                    f"Moving average anomaly: value={latest.value:.4f}, "
+                describe=lambda: (
+                    f"Moving average anomaly: value={latest:.4f}, "
                     f"ma={ma:.4f}, ma_std={ma_std:.4f}, "
                     f"deviation={deviation:.2f}x"
                 ),
@@ -347,77 +808,360 @@ class AnomalyDetectorEngine:
 
         return None
 
-    def get_anomaly_report(self) -> Dict[str, Any]:
-        """Generate a summary report of all detected anomalies.
+    def _hampel_hit(
+        self,
+        metric_name: str,
+        values: Optional[np.ndarray],
+    ) -> Optional[_Hit]:
+        """Body of :meth:`detect_hampel`, deferring the AnomalyEvent."""
+        count = self._count.get(metric_name, 0)
+        if count < MIN_DETECTION_POINTS:
+            return None
+
+        ordered = self._sorted[metric_name]
+        if values is None:
+            values = self._values[metric_name][:count]
+        if len(ordered) == count:
+            (median,) = _sorted_quantiles(ordered, (0.5,))
+        else:
+            (median,) = _quantiles(values, (0.5,))
+
+        stats = self._stats[metric_name]
+        if stats.mad is None or stats.mad_age >= MAD_REFRESH_INTERVAL:
+            (mad,) = _quantiles(np.abs(values - median), (0.5,))
+            stats.mad = float(mad)
+            stats.mad_age = 0
+        return self._hampel_verdict(self._last_value[metric_name], median, stats.mad)
+
+    def _hampel_verdict(self, latest: float, median: float, mad: float) -> Optional[_Hit]:
+        """Judge a value against its window's median and MAD."""
+        if not mad > 0:
+            return None
+
+        modified_z = abs(MODIFIED_Z_SCALE * (latest - median) / mad)
+        threshold = self.config["hampel_threshold"]
+
+        if modified_z > threshold:
+            severity = self._classify_severity(modified_z, threshold)
+            return _Hit(
+                algorithm=AnomalyAlgorithm.HAMPEL,
+                severity=severity,
+                score=float(modified_z),
+                threshold=float(threshold),
+                describe=lambda: (
+                    f"Hampel outlier: value={latest:.4f}, "
+                    f"median={median:.4f}, MAD={mad:.4f}, "
+                    f"modified_z={modified_z:.2f}"
+                ),
+            )
+
+        return None
+
+    def _materialize(
+        self,
+        metric_name: str,
+        hit: _Hit,
+        data_point: Optional[DataPoint] = None,
+    ) -> AnomalyEvent:
+        """Build the AnomalyEvent for a detector hit, formatting its description.
+
+        Args:
+            metric_name: Name of the metric the hit was found on.
+            hit: The detector hit.
+            data_point: The point the hit refers to; defaults to the metric's
+                latest data point.
 
         Returns:
-            Dictionary with anomaly counts, severity breakdown, algorithm breakdown.
+            An AnomalyEvent for the data point.
         """
-        by_severity: Dict[str, int] = {}
-        for sev in AnomalySeverity:
-            count = sum(1 for a in self.detected_anomalies if a.severity == sev)
-            if count > 0:
-                by_severity[sev.value] = count
-
-        by_algorithm: Dict[str, int] = {}
-        for algo in AnomalyAlgorithm:
-            count = sum(1 for a in self.detected_anomalies if a.algorithm == algo)
-            if count > 0:
-                by_algorithm[algo.value] = count
-
-        by_metric: Dict[str, int] = {}
-        for anomaly in self.detected_anomalies:
-            name = anomaly.data_point.metric_name
-            by_metric[name] = by_metric.get(name, 0) + 1
+        if data_point is None:
+            data_point = DataPoint(
+                timestamp=self._last_timestamp[metric_name],
+                metric_name=metric_name,
+                value=self._last_value[metric_name],
+                labels=self._last_labels[metric_name],
+            )
+        return AnomalyEvent(
+            data_point=data_point,
+            algorithm=hit.algorithm,
+            severity=hit.severity,
+            score=hit.score,
+            threshold=hit.threshold,
+            description=hit.describe(),
+        )
 
-        return {
-            "total_anomalies": len(self.detected_anomalies),
-            "by_severity": by_severity,
-            "by_algorithm": by_algorithm,
-            "by_metric": by_metric,
-            "total_metrics_tracked": len(self.metric_buffers),
-            "total_data_points": sum(len(b) for b in self.metric_buffers.values()),
-            "config": dict(self.config),
-        }
+    def _shard_index(self, metric_name: str) -> int:
+        """Return the shard owning a metric's buffers."""
+        return hash(metric_name) % len(self._shard_locks)
 
-    def get_metric_summary(self, metric_name: str) -> Dict[str, Any]:
-        """Return statistical summary for a specific metric.
+    def _shard_lock(self, metric_name: str) -> threading.Lock:
+        """Return the lock guarding a metric's buffers."""
+        return self._shard_locks[self._shard_index(metric_name)]
+
+    def _ingest_point(
+        self,
+        metric_name: str,
+        value: float,
+        labels: Optional[Dict[str, str]],
+    ) -> Optional[AnomalyEvent]:
+        """Buffer one data point and run detection; caller holds the shard lock.
 
         Args:
             metric_name: Name of the metric.
+            value: Numeric value of the data point.
+            labels: Optional key-value labels for the data point.
 
         Returns:
-            Dictionary with count, mean, std, min, max, percentiles, and anomaly count.
+            The highest-severity AnomalyEvent detected, or None.
         """
-        buffer = self.metric_buffers.get(metric_name)
-        if not buffer:
-            return {"error": f"No data for metric '{metric_name}'"}
-
-        values = np.array([p.value for p in buffer])
-        anomaly_count = sum(
-            1 for a in self.detected_anomalies
-            if a.data_point.metric_name == metric_name
-        )
+        # Initialize buffer if needed
+        window = self.config["window_size"]
+        if metric_name not in self._values:
+            self._values[metric_name] = np.empty(window, dtype=np.float64)
+            self._head[metric_name] = 0
+            self._count[metric_name] = 0
+            self._stats[metric_name] = _WindowStats()
+            self._sorted[metric_name] = []
+            self._scratch[metric_name] = np.empty(window, dtype=np.float64)
+
+        self._last_value[metric_name] = value
+        self._last_timestamp[metric_name] = time.time()
+        self._last_labels[metric_name] = labels or {}
+        self._shard_versions[self._shard_index(metric_name)] += 1
+
+        # Write into the ring buffer in O(1), overwriting the oldest value
+        values = self._values[metric_name]
+        head = self._head[metric_name]
+        count = self._count[metric_name]
+        stats = self._stats[metric_name]
+        ordered = self._sorted[metric_name]
+        span = min(self.config["moving_avg_window"], window - 1)
+        if stats.ma_span == span and count:
+            # The moving-average span gains the previous latest value and,
+            # once full, loses the one `span` slots before it
+            previous = float(values[head - 1])
+            stats.ma_total += previous
+            stats.ma_total_sq += previous * previous
+            if stats.ma_count == span:
+                dropped = float(values[(head - 1 - span) % window])
+                stats.ma_total -= dropped
+                stats.ma_total_sq -= dropped * dropped
+            else:
+                stats.ma_count += 1
+        if count == window:
+            evicted = float(values[head])
+            stats.total -= evicted
+            stats.total_sq -= evicted * evicted
+            if evicted == evicted:  # NaNs are never inserted
+                del ordered[bisect_left(ordered, evicted)]
+
+        values[head] = value
+        stats.total += value
+        stats.total_sq += value * value
+        if value == value:
+            insort(ordered, value)
+        self._head[metric_name] = (head + 1) % window
+        count = min(count + 1, window)
+        self._count[metric_name] = count
+
+        stats.updates += 1
+        stats.mad_age += 1
+        # Non-finite sums cannot recover by subtraction once the value leaves
+        if (
+            stats.updates >= window
+            or stats.ma_span != span
+            or not math.isfinite(stats.total + stats.ma_total)
+        ):
+            self._resync_stats(metric_name, span)
 
-        return {
-            "metric_name": metric_name,
-            "count": len(buffer),
-            "mean": float(np.mean(values)),
-            "std": float(np.std(values)),
-            "min": float(np.min(values)),
-            "max": float(np.max(values)),
-            "p25": float(np.percentile(values, 25)),
-            "p50": float(np.percentile(values, 50)),
-            "p75": float(np.percentile(values, 75)),
-            "p99": float(np.percentile(values, 99)),
-            "anomaly_count": anomaly_count,
-            "latest_value": float(values[-1]),
-            "latest_timestamp": buffer[-1].timestamp,
+        # Need minimum data points for detection
+        if count < MIN_DETECTION_POINTS:
+            return None
+
+        # Run all detection algorithms; only the worst hit is turned into an
+        # AnomalyEvent and has its description formatted. The detectors work
+        # from running sums and the sorted window, so no array is built
+        # unless one falls back to exact NumPy statistics.
+        hits = [
+            hit
+            for hit in (
+                self._zscore_hit(metric_name, None),
+                self._iqr_hit(metric_name, None),
+                self._moving_average_hit(metric_name, None),
+                self._hampel_hit(metric_name, None) if self.config["hampel_enabled"] else None,
+            )
+            if hit is not None
+        ]
+
+        # Return highest severity anomaly
+        if hits:
+            # min keeps the first of equally severe anomalies, like a stable sort
+            worst = self._materialize(
+                metric_name, min(hits, key=lambda h: _SEVERITY_RANK[h.severity]),
+            )
+            self._record(worst)
+            return worst
+
+        return None
+
+    def _ingest_block(
+        self,
+        metric_name: str,
+        block: np.ndarray,
+        labels: Optional[Dict[str, str]],
+    ) -> List[Optional[AnomalyEvent]]:
+        """Ingest values into a full window with vectorized detection.
+
+        Every value's window is a row of a sliding-window view over the
+        buffered values followed by the block, so each detector's statistics
+        for the whole block come from one NumPy reduction along the rows.
+        Only values flagged by a vectorized pre-check go through the scalar
+        verdicts, which stay the single source of scores and descriptions.
+        Caller holds the shard lock and has already filled the window.
+
+        Args:
+            metric_name: Name of the metric.
+            block: Values to ingest, oldest first.
+            labels: Key-value labels shared by every value in the block.
+
+        Returns:
+            One entry per value: the highest-severity AnomalyEvent, or None.
+        """
+        window = self.config["window_size"]
+        span = min(self.config["moving_avg_window"], window - 1)
+        hampel = self.config["hampel_enabled"]
+        full = np.concatenate((self._window_view(metric_name), block))
+        rows = sliding_window_view(full, window)[1:]
+
+        stats: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        flagged = np.zeros(block.size, dtype=bool)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean, std = _rolling_mean_std(full[1:], window)
+            flagged |= np.abs((block - mean) / std) > self.config["z_threshold"]
+            stats["zscore"] = (mean, std)
+
+            q1, q3 = np.quantile(rows, (0.25, 0.75), axis=1)
+            iqr = q3 - q1
+            multiplier = self.config["iqr_multiplier"]
+            flagged |= (block < q1 - multiplier * iqr) | (block > q3 + multiplier * iqr)
+            stats["iqr"] = (q1, q3)
+
+            if span >= 5:
+                ma, ma_std = _rolling_mean_std(full[window - span:-1], span)
+                flagged |= np.abs(block - ma) / ma_std > self.config["moving_avg_deviation"]
+                stats["moving_average"] = (ma, ma_std)
+
+            if hampel:
+                median = np.median(rows, axis=1)
+                mad = np.median(np.abs(rows - median[:, None]), axis=1)
+                modified_z = np.abs(MODIFIED_Z_SCALE * (block - median) / mad)
+                flagged |= modified_z > self.config["hampel_threshold"]
+                stats["hampel"] = (median, mad)
+
+        verdicts = {
+            "zscore": self._zscore_verdict,
+            "iqr": self._iqr_verdict,
+            "moving_average": self._moving_average_verdict,
+            "hampel": self._hampel_verdict,
         }
+        timestamp = time.time()
+        point_labels = labels or {}
+        results: List[Optional[AnomalyEvent]] = [None] * block.size
+        for k in np.flatnonzero(flagged).tolist():
+            latest = float(block[k])
+            hits = [
+                hit
+                for name, (first, second) in stats.items()
+                if (hit := verdicts[name](latest, first[k], second[k])) is not None
+            ]
+            if hits:
+                worst = self._materialize(
+                    metric_name,
+                    min(hits, key=lambda h: _SEVERITY_RANK[h.severity]),
+                    DataPoint(
+                        timestamp=timestamp,
+                        metric_name=metric_name,
+                        value=latest,
+                        labels=point_labels,
+                    ),
+                )
+                self._record(worst)
+                results[k] = worst
+
+        # Leave the buffers exactly as per-point ingestion would have
+        tail = full[-window:]
+        self._values[metric_name][:] = tail
+        self._head[metric_name] = 0
+        self._count[metric_name] = window
+        self._sorted[metric_name] = sorted(v for v in tail.tolist() if v == v)
+        self._last_value[metric_name] = float(block[-1])
+        self._last_timestamp[metric_name] = timestamp
+        self._last_labels[metric_name] = point_labels
+        self._resync_stats(metric_name, span)
+        self._stats[metric_name].mad = None
+        self._shard_versions[self._shard_index(metric_name)] += block.size
+        return results
+
+    def _record(self, anomaly: AnomalyEvent) -> None:
+        """Store a reported anomaly and count it; caller holds the shard lock."""
+        metric_name = anomaly.data_point.metric_name
+        # History and counts span shards, so they share one short-held lock
+        with self._history_lock:
+            history = self.detected_anomalies
+            if len(history) == history.maxlen:
+                self._tally.discard(history[0])
+            history.append(anomaly)
+            self._tally.add(anomaly)
+        # Skip argument packing and enum lookups entirely when INFO is off
+        sample_rate = self.config["info_log_sample_rate"]
+        if logger.isEnabledFor(logging.INFO) and (
+            sample_rate <= 1 or next(self._log_sequence) % sample_rate == 0
+        ):
+            logger.info(
+                "Anomaly detected: metric=%s value=%.4f severity=%s algo=%s",
+                metric_name, anomaly.data_point.value,
+                anomaly.severity_str, anomaly.algorithm_str,
+            )
 
-    # ------------------------------------------
-    # INTERNAL METHODS
-    # ------------------------------------------
+    def _resync_stats(self, metric_name: str, span: int) -> None:
+        """Recompute a metric's running sums exactly to shed rounding drift.
+
+        Args:
+            metric_name: Name of the metric.
+            span: Moving-average span the sums should cover.
+        """
+        values = self._window_view(metric_name)
+        ma_values = values[-(span + 1):-1] if values.size > span else values[:-1]
+        stats = self._stats[metric_name]
+        stats.total = float(values.sum())
+        stats.total_sq = float(values @ values)
+        stats.ma_span = span
+        stats.ma_count = ma_values.size
+        stats.ma_total = float(ma_values.sum())
+        stats.ma_total_sq = float(ma_values @ ma_values)
+        stats.updates = 0
+
+    def _window_view(self, metric_name: str) -> np.ndarray:
+        """Return the metric's buffered values in arrival order.
+
+        Until the ring wraps this is a zero-copy slice; afterwards the two
+        halves are joined into the metric's scratch buffer so the newest
+        value is last, without allocating. The scratch is overwritten by the
+        next call, so callers use the view under the shard lock and copy it if
+        they keep it.
+
+        Args:
+            metric_name: Name of the metric.
+
+        Returns:
+            A 1-D float64 array of the buffered values, oldest first.
+        """
+        values = self._values[metric_name]
+        count = self._count[metric_name]
+        head = self._head[metric_name]
+        if count < values.size or head == 0:
+            return values[:count]
+        return np.concatenate((values[head:], values[:head]), out=self._scratch[metric_name])
 
     def _classify_severity(self, score: float, threshold: float) -> AnomalySeverity:
         """Classify anomaly severity based on how far the score exceeds the threshold.
@@ -431,16 +1175,10 @@ class AnomalyDetectorEngine:
         """
         ratio = score / threshold if threshold > 0 else score
 
-        if ratio >= 4.0:
-            return AnomalySeverity.CRITICAL
-        elif ratio >= 3.0:
-            return AnomalySeverity.HIGH
-        elif ratio >= 2.0:
-            return AnomalySeverity.MEDIUM
-        elif ratio >= 1.5:
-            return AnomalySeverity.LOW
-        else:
-            return AnomalySeverity.INFO
+        for minimum, severity in _SEVERITY_THRESHOLDS:
+            if ratio >= minimum:
+                return severity
+        return AnomalySeverity.INFO
 
 
 # ============================================
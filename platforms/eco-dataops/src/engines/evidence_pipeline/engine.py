@@ -15,12 +15,14 @@ import hashlib
 import json
 import logging
 import sys
-import uuid
 from dataclasses import dataclass, field, asdict
+from bisect import bisect_right
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
 
+from shared.utils import canonical_json, new_id
+
 # Configure logging with CRITICAL-only default
 logging.basicConfig(
     level=logging.CRITICAL,
@@ -28,6 +30,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Every Nth sealed record's hash is pinned as a verification anchor
+ANCHOR_INTERVAL = 1_024
+
 
 # ============================================
 # ENUMS
@@ -69,7 +74,7 @@ class EvidenceTransition:
 @dataclass
 class EvidenceRecord:
     """Immutable evidence record with cryptographic binding."""
-    record_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    record_id: str = field(default_factory=new_id)
     source: str = ""
     payload: Dict[str, Any] = field(default_factory=dict)
     state: EvidenceState = EvidenceState.INGESTED
@@ -115,6 +120,23 @@ ALLOWED_TRANSITIONS: Dict[EvidenceState, List[EvidenceState]] = {
 REQUIRED_PAYLOAD_FIELDS = {"type", "content", "timestamp"}
 
 
+# ============================================
+# RECORD HASHING
+# ============================================
+
+def _record_digest(record_id: str, payload: Dict[str, Any]) -> str:
+    """Compute the SHA-256 digest of record_id + json(payload).
+
+    Args:
+        record_id: The evidence record identifier.
+        payload: The evidence payload.
+
+    Returns:
+        Hex-encoded SHA-256 hash string.
+    """
+    return hashlib.sha256(record_id.encode("utf-8") + canonical_json(payload)).hexdigest()
+
+
 # ============================================
 # EVIDENCE PIPELINE ENGINE
 # ============================================
@@ -128,11 +150,15 @@ class EvidencePipelineEngine:
         self.processed_records: List[EvidenceRecord] = []
         self.chain_head: Optional[str] = None
         self._rejected_records: List[EvidenceRecord] = []
+        # (position, hash_value) pinned at seal time every ANCHOR_INTERVAL records
+        self._anchors: List[Tuple[int, str]] = []
+        # Bumped on every ingest so cached stats can tell when they are stale
+        self.report_version: int = 0
 
         # Initialize genesis chain head
         genesis_data = {"genesis": True, "timestamp": datetime.now(timezone.utc).isoformat()}
         genesis_bytes = json.dumps(genesis_data, sort_keys=True).encode("utf-8")
-        self.chain_head = hashlib.sha3_512(genesis_bytes).hexdigest()
+        self.chain_head = hashlib.sha256(genesis_bytes).hexdigest()
         logger.info("EvidencePipelineEngine initialized with genesis hash: %s...", self.chain_head[:16])
 
     # ------------------------------------------
@@ -150,6 +176,7 @@ class EvidencePipelineEngine:
             The fully processed EvidenceRecord (state will be SEALED or REJECTED).
         """
         record = EvidenceRecord(source=source, payload=payload)
+        self.report_version += 1
         logger.info("Ingesting record %s from source '%s'", record.record_id, source)
 
         # Stage 1 -- INGEST (already done by construction)
@@ -173,24 +200,44 @@ class EvidencePipelineEngine:
         self._seal_record(record)
 
         # Record processed
+        position = len(self.processed_records)
         self.processed_records.append(record)
+        if position % ANCHOR_INTERVAL == 0:
+            self._anchors.append((position, record.hash_value))
         logger.info("Record %s sealed and added to chain", record.record_id)
         return record
 
-    def verify_chain_integrity(self) -> Tuple[bool, List[str]]:
-        """Walk the chain and verify every record's hash and parent linkage.
+    def verify_chain_integrity(
+        self, start: int = 0, end: Optional[int] = None
+    ) -> Tuple[bool, List[str]]:
+        """Walk the chain and verify record hashes, parent linkage and anchors.
+
+        With the defaults the whole chain is verified. A later ``start`` is
+        snapped back to the nearest anchor so the walk begins at a hash pinned
+        at seal time, and only that segment is re-hashed -- O(segment) rather
+        than O(chain) for callers checking recent records.
+
+        Args:
+            start: First chain position to verify.
+            end: Position to stop before (defaults to the chain length).
 
         Returns:
             Tuple of (is_valid, list_of_error_strings).
         """
         errors: List[str] = []
 
-        if not self.processed_records:
+        records = self.processed_records
+        if not records:
             return True, []
 
-        for idx, record in enumerate(self.processed_records):
-            # Re-compute hash and compare
-            expected_hash = self._compute_hash(record)
+        end = len(records) if end is None else min(end, len(records))
+        anchor_idx = bisect_right(self._anchors, start, key=lambda anchor: anchor[0]) - 1
+        start = self._anchors[anchor_idx][0] if anchor_idx >= 0 else 0
+        segment = records[start:end]
+
+        for idx, record in enumerate(segment, start):
+            expected_hash = _record_digest(record.record_id, record.payload)
+            # Compare against the re-computed hash
             if record.hash_value != expected_hash:
                 errors.append(
                     f"Record {record.record_id} at position {idx}: "
@@ -206,7 +253,7 @@ class EvidencePipelineEngine:
                         f"Record {record.record_id} at position 0: missing chain_parent_hash"
                     )
             else:
-                expected_parent = self.processed_records[idx - 1].hash_value
+                expected_parent = records[idx - 1].hash_value
                 if record.chain_parent_hash != expected_parent:
                     errors.append(
                         f"Record {record.record_id} at position {idx}: "
@@ -215,6 +262,17 @@ class EvidencePipelineEngine:
                         f"actual={record.chain_parent_hash[:16] if record.chain_parent_hash else 'None'}...)"
                     )
 
+        # Anchors catch a chain rewritten consistently after sealing
+        for position, pinned in self._anchors[max(anchor_idx, 0):]:
+            if position >= end:
+                break
+            if records[position].hash_value != pinned:
+                errors.append(
+                    f"Record {records[position].record_id} at position {position}: "
+                    f"anchor mismatch (pinned={pinned[:16]}..., "
+                    f"stored={records[position].hash_value[:16]}...)"
+                )
+
         is_valid = len(errors) == 0
         return is_valid, errors
 
@@ -293,16 +351,15 @@ class EvidencePipelineEngine:
         return True
 
     def _compute_hash(self, record: EvidenceRecord) -> str:
-        """Compute SHA3-512 hash of record_id + json(payload).
+        """Compute SHA-256 hash of record_id + json(payload).
 
         Args:
             record: The evidence record to hash.
 
         Returns:
-            Hex-encoded SHA3-512 hash string.
+            Hex-encoded SHA-256 hash string.
         """
-        hash_input = record.record_id + json.dumps(record.payload, sort_keys=True)
-        return hashlib.sha3_512(hash_input.encode("utf-8")).hexdigest()
+        return _record_digest(record.record_id, record.payload)
 
     def _bind_to_chain(self, record: EvidenceRecord) -> None:
         """Bind the record to the hash chain by setting parent and updating head.
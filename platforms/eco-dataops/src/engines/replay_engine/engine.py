@@ -12,15 +12,22 @@ Status: ENFORCED
 """
 
 import hashlib
+import heapq
 import json
 import logging
 import sys
 import time
-import uuid
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict, deque
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from shared.utils import canonical_json, new_id
 
 # Configure logging with CRITICAL-only default
 logging.basicConfig(
@@ -29,6 +36,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Number of most recent replay sessions retained in ReplayEngine.sessions
+MAX_SESSION_HISTORY = 10_000
+
+# Deferred event hashes are computed once this many are pending
+HASH_BATCH_SIZE = 1_024
+
 
 # ============================================
 # ENUMS
@@ -49,7 +62,7 @@ class ReplayMode(Enum):
 @dataclass
 class TimelineEvent:
     """An immutable event on the timeline with cryptographic binding."""
-    event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    event_id: str = field(default_factory=new_id)
     timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
     event_type: str = ""
     actor: str = ""
@@ -58,7 +71,11 @@ class TimelineEvent:
     hash_value: str = ""
 
     def to_bytes(self) -> bytes:
-        """Convert core fields to bytes for hashing."""
+        """Convert core fields to canonical sorted-key JSON bytes for hashing.
+
+        JSON encoding dominates the per-event cost of hashing and
+        verification, far ahead of SHA-256 itself; see canonical_json.
+        """
         data = {
             "event_id": self.event_id,
             "timestamp": self.timestamp,
@@ -67,17 +84,22 @@ class TimelineEvent:
             "payload": self.payload,
             "sequence_number": self.sequence_number,
         }
-        return json.dumps(data, sort_keys=True).encode("utf-8")
+        return canonical_json(data)
 
     def compute_hash(self) -> str:
-        """Compute SHA3-512 hash of this event."""
-        return hashlib.sha3_512(self.to_bytes()).hexdigest()
+        """Compute SHA-256 hash of this event.
+
+        SHA-256 is served by OpenSSL's SHA-NI/ARMv8 code paths where the CPU
+        supports them, which keeps per-event hashing off the critical path of
+        ingest and full-timeline verification.
+        """
+        return hashlib.sha256(self.to_bytes()).hexdigest()
 
 
 @dataclass
 class StateSnapshot:
     """A point-in-time snapshot of reconstructed state."""
-    snapshot_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    snapshot_id: str = field(default_factory=new_id)
     timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
     state: Dict[str, Any] = field(default_factory=dict)
     hash_value: str = ""
@@ -97,7 +119,7 @@ class StateSnapshot:
 @dataclass
 class ReplaySession:
     """Tracks a replay operation from start to completion."""
-    session_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    session_id: str = field(default_factory=new_id)
     mode: ReplayMode = ReplayMode.FULL
     start_time: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
     end_time: Optional[str] = None
@@ -106,6 +128,45 @@ class ReplaySession:
     status: str = "active"  # "active" | "completed" | "failed"
 
 
+def _verify_events(events: List[TimelineEvent]) -> List[str]:
+    """Recompute hashes for timeline events.
+
+    Verification stays in-process: shipping events to worker processes costs
+    more in pickling than the hashing it would offload.
+
+    Args:
+        events: Timeline events to verify.
+
+    Returns:
+        Hash mismatch error strings, in event order.
+    """
+    errors: List[str] = []
+    for event in events:
+        computed_hash = event.compute_hash()
+        if event.hash_value != computed_hash:
+            errors.append(
+                f"Hash mismatch at seq={event.sequence_number}: "
+                f"stored={event.hash_value[:16]}..., "
+                f"computed={computed_hash[:16]}..."
+            )
+    return errors
+
+
+def _timeline_arrow_schema() -> Any:
+    """Build the Arrow schema used by ReplayEngine.export_arrow."""
+    import pyarrow as pa
+
+    return pa.schema([
+        ("sequence_number", pa.int64()),
+        ("event_id", pa.string()),
+        ("timestamp", pa.timestamp("us", tz="UTC")),
+        ("event_type", pa.dictionary(pa.int32(), pa.string())),
+        ("actor", pa.dictionary(pa.int32(), pa.string())),
+        ("payload", pa.binary()),
+        ("hash_value", pa.binary(32)),
+    ])
+
+
 # ============================================
 # REPLAY ENGINE
 # ============================================
@@ -113,12 +174,28 @@ class ReplaySession:
 class ReplayEngine:
     """Replay Engine -- state reconstruction, timeline management, snapshot/restore."""
 
+    # Event types replayed in PARTIAL mode (events that modify state)
+    _MUTATION_TYPES: frozenset = frozenset(
+        {"state_change", "mutation", "update", "create", "delete"}
+    )
+
     def __init__(self) -> None:
         """Initialize the replay engine with empty timeline and snapshot stores."""
         self.timeline: List[TimelineEvent] = []
         self.snapshots: List[StateSnapshot] = []
-        self.sessions: List[ReplaySession] = []
+        self.sessions: Deque[ReplaySession] = deque(maxlen=MAX_SESSION_HISTORY)
+        self._session_status_counts: Counter = Counter()
         self._sequence_counter: int = 0
+        self._pending_hash: List[TimelineEvent] = []
+        # Secondary index: event_type -> positions in self.timeline (ascending)
+        self._type_index: Dict[str, List[int]] = defaultdict(list)
+        self._type_counter: Counter = Counter()
+        # Columnar copies of hot scan fields, parallel to self.timeline / self.snapshots
+        self._seq_column: array = array("q")
+        self._timestamp_column: List[str] = []
+        self._snapshot_seq_column: array = array("q")
+        # Bumped on every event, snapshot and session so cached stats can tell when they are stale
+        self.report_version: int = 0
         logger.info("ReplayEngine initialized")
 
     # ------------------------------------------
@@ -126,7 +203,11 @@ class ReplayEngine:
     # ------------------------------------------
 
     def record_event(
-        self, event_type: str, actor: str, payload: Dict[str, Any]
+        self,
+        event_type: str,
+        actor: str,
+        payload: Dict[str, Any],
+        defer_hash: bool = False,
     ) -> TimelineEvent:
         """Append a new event to the timeline with an auto-incremented sequence number.
 
@@ -134,25 +215,52 @@ class ReplayEngine:
             event_type: Category or type identifier for the event.
             actor: The entity that triggered the event.
             payload: Arbitrary data associated with the event.
+            defer_hash: Leave hash_value empty and compute it with the next
+                batch of HASH_BATCH_SIZE pending events (or on
+                flush_pending_hashes) instead of on the ingest path.
 
         Returns:
             The newly created TimelineEvent.
         """
         self._sequence_counter += 1
+        self.report_version += 1
         event = TimelineEvent(
             event_type=event_type,
             actor=actor,
             payload=payload,
             sequence_number=self._sequence_counter,
         )
-        event.hash_value = event.compute_hash()
+        self._type_index[event_type].append(len(self.timeline))
+        self._type_counter[event_type] += 1
+        self._seq_column.append(event.sequence_number)
+        self._timestamp_column.append(event.timestamp)
         self.timeline.append(event)
+        if defer_hash:
+            self._pending_hash.append(event)
+            if len(self._pending_hash) >= HASH_BATCH_SIZE:
+                self.flush_pending_hashes()
+        else:
+            event.hash_value = event.compute_hash()
         logger.info(
             "Recorded event seq=%d type=%s actor=%s",
             event.sequence_number, event.event_type, event.actor,
         )
         return event
 
+    def flush_pending_hashes(self) -> int:
+        """Compute hashes for all events recorded with defer_hash=True.
+
+        Returns:
+            Number of events hashed.
+        """
+        pending = self._pending_hash
+        if not pending:
+            return 0
+        self._pending_hash = []
+        for event in pending:
+            event.hash_value = event.compute_hash()
+        return len(pending)
+
     def create_snapshot(self, state: Dict[str, Any]) -> StateSnapshot:
         """Capture a state snapshot at the current point in the timeline.
 
@@ -167,6 +275,8 @@ class ReplayEngine:
             sequence_number=self._sequence_counter,
         )
         snapshot.hash_value = snapshot.compute_hash()
+        self.report_version += 1
+        self._snapshot_seq_column.append(snapshot.sequence_number)
         self.snapshots.append(snapshot)
         logger.info(
             "Created snapshot %s at seq=%d",
@@ -200,31 +310,22 @@ class ReplayEngine:
         )
 
         try:
-            # Select events within the sequence range
-            selected_events = [
-                e for e in self.timeline
-                if start_seq <= e.sequence_number <= end_seq
-            ]
-
             if mode == ReplayMode.FULL:
-                session.events = selected_events
+                session.events = self._select_range(start_seq, end_seq)
             elif mode == ReplayMode.PARTIAL:
                 # Partial replay: only include events that modify state
-                session.events = [
-                    e for e in selected_events
-                    if e.event_type in ("state_change", "mutation", "update", "create", "delete")
-                ]
+                session.events = self._select_by_types(
+                    self._MUTATION_TYPES, start_seq, end_seq
+                )
             elif mode == ReplayMode.POINT_IN_TIME:
                 # All events up to end_seq
-                session.events = [
-                    e for e in self.timeline if e.sequence_number <= end_seq
-                ]
+                session.events = self.timeline[:bisect_right(self._seq_column, end_seq)]
             elif mode == ReplayMode.DIFFERENTIAL:
                 # Find nearest snapshot before start_seq and replay from there
                 base_snapshot = self._find_nearest_snapshot(start_seq)
                 if base_snapshot:
                     session.snapshots.append(base_snapshot)
-                session.events = selected_events
+                session.events = self._select_range(start_seq, end_seq)
 
             # Build reconstructed state from events
             reconstructed_state = self._reconstruct_state(session.events)
@@ -247,7 +348,7 @@ class ReplayEngine:
             session.end_time = datetime.now(timezone.utc).isoformat()
             logger.error("Replay session %s failed: %s", session.session_id[:8], exc)
 
-        self.sessions.append(session)
+        self._record_session(session)
         return session
 
     def point_in_time_query(self, timestamp: str) -> Dict[str, Any]:
@@ -260,7 +361,9 @@ class ReplayEngine:
             Reconstructed state dictionary at the given point in time.
         """
         events_at_time = [
-            e for e in self.timeline if e.timestamp <= timestamp
+            e
+            for e, ts in zip(self.timeline, self._timestamp_column, strict=True)
+            if ts <= timestamp
         ]
         return self._reconstruct_state(events_at_time)
 
@@ -275,24 +378,21 @@ class ReplayEngine:
         if not self.timeline:
             return True, []
 
-        # Check sequence continuity
-        expected_seq = self.timeline[0].sequence_number
-        for idx, event in enumerate(self.timeline):
-            if event.sequence_number != expected_seq:
-                errors.append(
-                    f"Sequence gap at index {idx}: expected {expected_seq}, "
-                    f"got {event.sequence_number}"
-                )
-            expected_seq = event.sequence_number + 1
-
-            # Verify hash integrity
-            computed_hash = event.compute_hash()
-            if event.hash_value != computed_hash:
-                errors.append(
-                    f"Hash mismatch at seq={event.sequence_number}: "
-                    f"stored={event.hash_value[:16]}..., "
-                    f"computed={computed_hash[:16]}..."
-                )
+        # Check sequence continuity; only gap positions are visited in Python
+        seqs = np.fromiter(
+            (e.sequence_number for e in self.timeline),
+            dtype=np.int64,
+            count=len(self.timeline),
+        )
+        for gap in np.flatnonzero(np.diff(seqs) != 1):
+            errors.append(
+                f"Sequence gap at index {gap + 1}: expected {seqs[gap] + 1}, "
+                f"got {seqs[gap + 1]}"
+            )
+
+        # Verify hash integrity
+        self.flush_pending_hashes()
+        errors.extend(_verify_events(self.timeline))
 
         is_valid = len(errors) == 0
         return is_valid, errors
@@ -303,13 +403,9 @@ class ReplayEngine:
         Returns:
             Dictionary with event counts, session counts, snapshot counts, etc.
         """
-        event_types: Dict[str, int] = {}
-        for event in self.timeline:
-            event_types[event.event_type] = event_types.get(event.event_type, 0) + 1
+        event_types: Dict[str, int] = dict(self._type_counter)
 
-        session_statuses: Dict[str, int] = {}
-        for session in self.sessions:
-            session_statuses[session.status] = session_statuses.get(session.status, 0) + 1
+        session_statuses: Dict[str, int] = dict(self._session_status_counts)
 
         return {
             "total_events": len(self.timeline),
@@ -324,6 +420,70 @@ class ReplayEngine:
             },
         }
 
+    def export_arrow(
+        self,
+        path: str,
+        start_seq: int = 1,
+        end_seq: Optional[int] = None,
+        batch_size: int = 65_536,
+    ) -> int:
+        """Stream a range of the timeline to an Arrow IPC file.
+
+        Events are written as columnar record batches: event_type and actor
+        are dictionary-encoded, payloads are stored as canonical JSON bytes,
+        and hashes as 32-byte binary. The file can be memory-mapped with
+        ``pyarrow.ipc.open_file`` for out-of-core scans. Requires the
+        optional ``arrow`` extra.
+
+        Args:
+            path: Destination file path.
+            start_seq: Starting sequence number (inclusive).
+            end_seq: Ending sequence number (inclusive). Defaults to latest.
+            batch_size: Maximum number of events per record batch.
+
+        Returns:
+            Number of events written.
+        """
+        import pyarrow as pa
+
+        if end_seq is None:
+            end_seq = self._sequence_counter
+
+        schema = _timeline_arrow_schema()
+        self.flush_pending_hashes()
+        events = self._select_range(start_seq, end_seq)
+        # The IPC file format needs one dictionary per column across all batches
+        type_codes = {t: i for i, t in enumerate(self._type_counter)}
+        actor_codes = {a: i for i, a in enumerate(dict.fromkeys(e.actor for e in events))}
+        type_dictionary = pa.array(list(type_codes), pa.string())
+        actor_dictionary = pa.array(list(actor_codes), pa.string())
+        with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, schema) as writer:
+            for offset in range(0, len(events), batch_size):
+                chunk = events[offset:offset + batch_size]
+                writer.write_batch(pa.record_batch(
+                    [
+                        pa.array([e.sequence_number for e in chunk], pa.int64()),
+                        pa.array([e.event_id for e in chunk], pa.string()),
+                        pa.array(
+                            [datetime.fromisoformat(e.timestamp) for e in chunk],
+                            pa.timestamp("us", tz="UTC"),
+                        ),
+                        pa.DictionaryArray.from_arrays(
+                            pa.array([type_codes[e.event_type] for e in chunk], pa.int32()),
+                            type_dictionary,
+                        ),
+                        pa.DictionaryArray.from_arrays(
+                            pa.array([actor_codes[e.actor] for e in chunk], pa.int32()),
+                            actor_dictionary,
+                        ),
+                        pa.array([canonical_json(e.payload) for e in chunk], pa.binary()),
+                        pa.array([bytes.fromhex(e.hash_value) for e in chunk], pa.binary(32)),
+                    ],
+                    schema=schema,
+                ))
+        logger.info("Exported %d events to %s", len(events), path)
+        return len(events)
+
     # ------------------------------------------
     # INTERNAL METHODS
     # ------------------------------------------
@@ -337,12 +497,60 @@ class ReplayEngine:
         Returns:
             The nearest StateSnapshot, or None if no snapshots precede the target.
         """
-        candidates = [
-            s for s in self.snapshots if s.sequence_number <= target_seq
-        ]
-        if not candidates:
+        # Snapshots are appended in non-decreasing sequence order
+        seqs = self._snapshot_seq_column
+        hi = bisect_right(seqs, target_seq)
+        if hi == 0:
             return None
-        return max(candidates, key=lambda s: s.sequence_number)
+        # Earliest snapshot among those sharing the nearest sequence number
+        return self.snapshots[bisect_left(seqs, seqs[hi - 1], 0, hi)]
+
+    def _record_session(self, session: ReplaySession) -> None:
+        """Append a finished session to the bounded history, keeping status counts live."""
+        if len(self.sessions) == self.sessions.maxlen:
+            evicted = self.sessions[0]
+            self._session_status_counts[evicted.status] -= 1
+            if not self._session_status_counts[evicted.status]:
+                del self._session_status_counts[evicted.status]
+        self.sessions.append(session)
+        self._session_status_counts[session.status] += 1
+        self.report_version += 1
+
+    def _select_range(self, start_seq: int, end_seq: int) -> List[TimelineEvent]:
+        """Select events within a sequence range (inclusive on both ends)."""
+        lo = bisect_left(self._seq_column, start_seq)
+        hi = bisect_right(self._seq_column, end_seq)
+        return self.timeline[lo:hi]
+
+    def _select_by_types(
+        self, event_types: frozenset, start_seq: int, end_seq: int
+    ) -> List[TimelineEvent]:
+        """Select events of the given types within a sequence range via the type index.
+
+        Each per-type position list is bisected on sequence number so only
+        matching events are touched; the slices are then merged back into
+        timeline order.
+
+        Args:
+            event_types: Event types to include.
+            start_seq: Starting sequence number (inclusive).
+            end_seq: Ending sequence number (inclusive).
+
+        Returns:
+            Matching events in timeline order.
+        """
+        seq_of = self._seq_column.__getitem__
+        slices: List[List[int]] = []
+        for event_type in event_types:
+            positions = self._type_index.get(event_type)
+            if not positions:
+                continue
+            lo = bisect_left(positions, start_seq, key=seq_of)
+            hi = bisect_right(positions, end_seq, key=seq_of)
+            if lo < hi:
+                slices.append(positions[lo:hi])
+        timeline = self.timeline
+        return [timeline[pos] for pos in heapq.merge(*slices)]
 
     def _reconstruct_state(self, events: List[TimelineEvent]) -> Dict[str, Any]:
         """Reconstruct state by folding events in sequence order.
@@ -360,8 +568,7 @@ class ReplayEngine:
         sorted_events = sorted(events, key=lambda e: e.sequence_number)
         for event in sorted_events:
             # Merge event payload into state
-            for key, value in event.payload.items():
-                state[key] = value
+            state.update(event.payload)
             # Track metadata
             state["_last_event_type"] = event.event_type
             state["_last_actor"] = event.actor
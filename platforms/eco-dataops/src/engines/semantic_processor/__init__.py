@@ -4,6 +4,7 @@ from .engine import (
     SemanticCategory,
     SemanticClassification,
     CanonicalizationRule,
+    CategoryPatternSet,
 )
 
 __all__ = [
@@ -11,4 +12,5 @@ __all__ = [
     "SemanticCategory",
     "SemanticClassification",
     "CanonicalizationRule",
+    "CategoryPatternSet",
 ]
@@ -11,16 +11,19 @@ Governance Stage: S5-VERIFIED
 Status: ENFORCED
 """
 
+import functools
 import hashlib
 import json
 import logging
 import re
 import sys
-import uuid
+import threading
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from shared.utils import new_id
 
 # Configure logging with CRITICAL-only default
 logging.basicConfig(
@@ -29,6 +32,115 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Optional accelerator: google-re2 matches in linear time without backtracking
+try:
+    import re2
+except ImportError:  # pragma: no cover - exercised only without the extra
+    re2 = None
+
+
+# ASCII characters that re's \s treats as whitespace but RE2's does not
+_RE2_DIVERGENT_CHARS = frozenset("\x0b\x1c\x1d\x1e\x1f")
+
+
+def _compile_re2(pattern: str) -> Any:
+    """Compile a case-insensitive detection pattern with RE2, if available.
+
+    Args:
+        pattern: The raw regex pattern.
+
+    Returns:
+        The RE2 pattern, or None when google-re2 is not installed or the
+        pattern is not RE2-compatible.
+    """
+    if re2 is None:
+        return None
+    options = re2.Options()
+    options.case_sensitive = False
+    try:
+        return re2.compile(pattern, options)
+    except re2.error:
+        logger.debug("Pattern not RE2-compatible, using re: %s", pattern)
+        return None
+
+
+def _re2_matches_re(text: str) -> bool:
+    """Return True if RE2 and re are guaranteed to match identically on *text*.
+
+    RE2's word boundaries, word and space classes, and case folding are
+    ASCII-only while re's are Unicode-aware, so RE2 is only used on ASCII
+    text without the control characters the two engines classify differently.
+    """
+    return text.isascii() and _RE2_DIVERGENT_CHARS.isdisjoint(text)
+
+
+# Score assigned to NARRATIVE when any narrative pattern matches
+NARRATIVE_SCORE = 0.8
+
+# Canonicalized texts memoized per engine (repeated log templates), per rule set
+CANONICALIZE_CACHE_SIZE = 8192
+
+# Fused form of the default canonicalization rules (see _load_default_rules),
+# used only while an engine's rules still match the defaults.
+# Control characters that re's \s treats as whitespace (\x0b, \x0c, \x1c-\x1f)
+# are left to the whitespace branch so they collapse to a space as before.
+_CANON_TRANSLATION: Dict[int, Optional[str]] = str.maketrans(
+    {
+        **{ch: "-" for ch in "\u2013\u2014\u2015"},
+        **{ch: "'" for ch in "\u201c\u201d\u2018\u2019"},
+        **{chr(cp): None for cp in (*range(0x00, 0x09), *range(0x0e, 0x1c), 0x7f)},
+    }
+)
+_CANON_PATTERN: re.Pattern = re.compile(r"(?P<ws>\s+)|(?P<ellipsis>\.{3,})|(?P<punct>[!?]{2,})")
+# The rules collapse whitespace before removing control characters, so text
+# that loses control characters takes this two-pass form instead
+_CANON_WHITESPACE: re.Pattern = re.compile(r"\s+")
+_CANON_PUNCT_PATTERN: re.Pattern = re.compile(r"(?P<ellipsis>\.{3,})|(?P<punct>[!?]{2,})")
+
+
+def _canon_replacement(match: re.Match) -> str:
+    """Return the replacement for one match of the fused canonicalization regex."""
+    kind = match.lastgroup
+    if kind == "ws":
+        return " "
+    if kind == "ellipsis":
+        return "..."
+    # Repeated punctuation collapses to the last character of the run
+    return match.group()[-1]
+
+
+def _canonicalize(text: str) -> str:
+    """Canonicalize text with the fused form of the default rules."""
+    translated = text.translate(_CANON_TRANSLATION)
+    if len(translated) != len(text):
+        # Removed control characters must not merge the whitespace around them
+        translated = _CANON_WHITESPACE.sub(" ", text).translate(_CANON_TRANSLATION)
+        return _CANON_PUNCT_PATTERN.sub(_canon_replacement, translated).strip()
+    return _CANON_PATTERN.sub(_canon_replacement, translated).strip()
+
+
+def _rules_key(rules: List["CanonicalizationRule"]) -> Tuple[Tuple[str, str], ...]:
+    """Return the (pattern, replacement) pairs that determine a rule list's behavior."""
+    return tuple((rule.pattern, rule.replacement) for rule in rules)
+
+
+def _compile_rules(rules: List["CanonicalizationRule"]) -> List[Tuple[re.Pattern, str]]:
+    """Compile canonicalization rules in order, skipping (and logging) invalid patterns."""
+    compiled: List[Tuple[re.Pattern, str]] = []
+    for rule in rules:
+        try:
+            compiled.append((re.compile(rule.pattern), rule.replacement))
+        except re.error as exc:
+            logger.warning("Rule '%s' regex error: %s", rule.name, exc)
+    return compiled
+
+
+def _apply_rules(compiled: List[Tuple[re.Pattern, str]], text: str) -> str:
+    """Canonicalize text by applying precompiled rules one after another."""
+    for pattern, replacement in compiled:
+        text = pattern.sub(replacement, text)
+    return text.strip()
+
 
 # ============================================
 # ENUMS
@@ -50,7 +162,7 @@ class SemanticCategory(Enum):
 @dataclass
 class CanonicalizationRule:
     """A single canonicalization transformation rule."""
-    rule_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    rule_id: str = field(default_factory=new_id)
     name: str = ""
     pattern: str = ""
     replacement: str = ""
@@ -67,6 +179,86 @@ class SemanticClassification:
     is_narrative_free: bool = True
 
 
+@dataclass
+class CategoryPatternSet:
+    """Detection patterns for one category, compiled once into a single alternation."""
+    category: SemanticCategory = SemanticCategory.UNKNOWN
+    label: str = ""
+    weight: float = 0.0
+    patterns: List[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        self._compiled: List[re.Pattern] = [re.compile(p, re.IGNORECASE) for p in self.patterns]
+        self._group_names: List[str] = [f"g{i}" for i in range(len(self.patterns))]
+        union = "|".join(
+            f"(?P<{g}>{p})" for g, p in zip(self._group_names, self.patterns, strict=True)
+        )
+        self._union: re.Pattern = re.compile(union, re.IGNORECASE)
+        # RE2 counterparts, used only where _re2_matches_re holds so results
+        # never depend on whether the optional backend is installed
+        re2_compiled = [_compile_re2(p) for p in self.patterns]
+        re2_union = _compile_re2(union)
+        if re2_union is None or any(c is None for c in re2_compiled):
+            self._re2: Optional[Tuple[Any, List[Any]]] = None
+        else:
+            self._re2 = (re2_union, re2_compiled)
+
+    @property
+    def max_score(self) -> float:
+        """Highest score this set can contribute (every pattern matching)."""
+        return self.weight * len(self.patterns)
+
+    @property
+    def compiled(self) -> List[re.Pattern]:
+        """The individually compiled patterns, in declaration order."""
+        return self._compiled
+
+    def first_matches(self, text: str) -> List[Tuple[str, str]]:
+        """Return each matching pattern with the text it matched, in declaration order.
+
+        One scan of the union regex identifies most matching alternatives and
+        proves the no-match case outright. Alternatives shadowed by an earlier
+        overlapping match are confirmed with their own precompiled pattern.
+
+        Args:
+            text: The text to scan.
+
+        Returns:
+            List of (raw pattern, first matched text) tuples.
+        """
+        union: Any = self._union
+        compiled_patterns: List[Any] = self._compiled
+        if self._re2 is not None and _re2_matches_re(text):
+            union, compiled_patterns = self._re2
+        first: Dict[str, str] = {}
+        for m in union.finditer(text):
+            first.setdefault(m.lastgroup, m.group())
+        if not first:
+            return []
+        matches: List[Tuple[str, str]] = []
+        for pattern, group, compiled in zip(
+            self.patterns, self._group_names, compiled_patterns, strict=True
+        ):
+            if group in first:
+                matches.append((pattern, first[group]))
+            else:
+                m = compiled.search(text)
+                if m:
+                    matches.append((pattern, m.group()))
+        return matches
+
+    def matching_patterns(self, text: str) -> List[str]:
+        """Return the patterns that match anywhere in the text, in declaration order.
+
+        Args:
+            text: The text to scan.
+
+        Returns:
+            List of raw pattern strings that match.
+        """
+        return [pattern for pattern, _ in self.first_matches(text)]
+
+
 # ============================================
 # SEMANTIC PROCESSOR ENGINE
 # ============================================
@@ -77,10 +269,20 @@ class SemanticProcessorEngine:
     def __init__(self) -> None:
         """Initialize the semantic processor with default rules and narrative patterns."""
         self.canonicalization_rules: List[CanonicalizationRule] = self._load_default_rules()
-        self.narrative_patterns: List[re.Pattern] = self._load_narrative_patterns()
+        self._default_rules_key = _rules_key(self.canonicalization_rules)
+        # (rules key, memoized canonicalizer) for the rules currently in effect,
+        # swapped as one value so a rule change also drops the old cache
+        self._canonicalizer: Tuple[Tuple[Tuple[str, str], ...], Callable[[str], str]] = (
+            self._default_rules_key,
+            functools.lru_cache(maxsize=CANONICALIZE_CACHE_SIZE)(_canonicalize),
+        )
+        self._narrative_set: CategoryPatternSet = self._load_narrative_patterns()
+        self.narrative_patterns: List[re.Pattern] = self._narrative_set.compiled
+        self.category_patterns: List[CategoryPatternSet] = self._load_category_patterns()
         self._processed_count: int = 0
         self._narrative_violations: int = 0
         self._classification_counts: Dict[str, int] = {cat.value: 0 for cat in SemanticCategory}
+        self._stats_lock = threading.Lock()
         logger.info(
             "SemanticProcessorEngine initialized: %d rules, %d narrative patterns",
             len(self.canonicalization_rules), len(self.narrative_patterns),
@@ -93,8 +295,13 @@ class SemanticProcessorEngine:
     def canonicalize(self, text: str) -> str:
         """Apply all canonicalization rules to the input text.
 
-        Rules are applied in order: whitespace normalization, case normalization,
-        punctuation cleanup, and category-specific transformations.
+        While ``canonicalization_rules`` match the defaults, they run as a
+        single fused pass: character-level rules (dash and quote normalization,
+        control-character removal) are applied with one ``str.translate``, and
+        whitespace collapsing, ellipsis normalization, and repeated-punctuation
+        collapsing share one alternation regex. Added or edited rules are
+        compiled once and applied in order. Leading and trailing whitespace is
+        stripped last. Results are memoized per engine until the rules change.
 
         Args:
             text: The raw input text.
@@ -102,15 +309,18 @@ class SemanticProcessorEngine:
         Returns:
             The canonicalized text string.
         """
-        result = text
-        for rule in self.canonicalization_rules:
-            try:
-                result = re.sub(rule.pattern, rule.replacement, result)
-            except re.error as exc:
-                logger.warning(
-                    "Rule '%s' regex error: %s", rule.name, exc,
+        key = _rules_key(self.canonicalization_rules)
+        cached_key, canonicalizer = self._canonicalizer
+        if key != cached_key:
+            if key == self._default_rules_key:
+                canonicalize: Callable[[str], str] = _canonicalize
+            else:
+                canonicalize = functools.partial(
+                    _apply_rules, _compile_rules(self.canonicalization_rules)
                 )
-        return result.strip()
+            canonicalizer = functools.lru_cache(maxsize=CANONICALIZE_CACHE_SIZE)(canonicalize)
+            self._canonicalizer = (key, canonicalizer)
+        return canonicalizer(text)
 
     def classify(self, text: str) -> SemanticClassification:
         """Classify text into a semantic category with confidence scoring.
@@ -121,7 +331,6 @@ class SemanticProcessorEngine:
         Returns:
             A SemanticClassification with category, confidence, and matched rules.
         """
-        self._processed_count += 1
         canonicalized = self.canonicalize(text)
         is_narrative_free, violations = self.check_narrative_free(canonicalized)
         matched_rules: List[str] = []
@@ -129,45 +338,23 @@ class SemanticProcessorEngine:
         # Score each category
         scores: Dict[SemanticCategory, float] = {cat: 0.0 for cat in SemanticCategory}
 
-        # COMMAND detection: imperative verbs, action keywords
-        command_patterns = [
-            r"\b(run|execute|deploy|start|stop|restart|delete|create|update|set|get)\b",
-            r"\b(install|remove|configure|enable|disable|migrate|rollback)\b",
-        ]
-        for pat in command_patterns:
-            if re.search(pat, canonicalized, re.IGNORECASE):
-                scores[SemanticCategory.COMMAND] += 0.3
-                matched_rules.append(f"command_pattern:{pat}")
-
-        # METADATA detection: key-value structures, timestamps, identifiers
-        metadata_patterns = [
-            r"\b[a-z_]+\s*[:=]\s*\S+",
-            r"\b\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}",
-            r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b",
-            r"\bversion\s*[:=]?\s*\d+\.\d+",
-        ]
-        for pat in metadata_patterns:
-            if re.search(pat, canonicalized, re.IGNORECASE):
-                scores[SemanticCategory.METADATA] += 0.25
-                matched_rules.append(f"metadata_pattern:{pat}")
-
-        # FACTUAL detection: declarative statements, measurements, data
-        factual_patterns = [
-            r"\b\d+\.?\d*\s*(ms|seconds|bytes|KB|MB|GB|%|requests|errors)\b",
-            r"\b(total|count|sum|average|mean|median|max|min)\b",
-            r"\b(passed|failed|succeeded|completed|verified)\b",
-        ]
-        for pat in factual_patterns:
-            if re.search(pat, canonicalized, re.IGNORECASE):
-                scores[SemanticCategory.FACTUAL] += 0.3
-                matched_rules.append(f"factual_pattern:{pat}")
+        # Narrative language carries a fixed score; categories whose best
+        # possible score cannot beat it are not scanned
+        narrative_score = 0.0 if is_narrative_free else NARRATIVE_SCORE
+
+        # COMMAND / METADATA / FACTUAL detection
+        for pattern_set in self.category_patterns:
+            if pattern_set.max_score < narrative_score:
+                continue
+            for pat in pattern_set.matching_patterns(canonicalized):
+                scores[pattern_set.category] += pattern_set.weight
+                matched_rules.append(f"{pattern_set.label}:{pat}")
 
         # NARRATIVE detection: subjective/editorial language
         if not is_narrative_free:
-            scores[SemanticCategory.NARRATIVE] += 0.8
+            scores[SemanticCategory.NARRATIVE] += narrative_score
             for v in violations:
                 matched_rules.append(f"narrative_violation:{v}")
-            self._narrative_violations += 1
 
         # Determine winner
         best_category = SemanticCategory.UNKNOWN
@@ -185,7 +372,11 @@ class SemanticProcessorEngine:
             best_category = SemanticCategory.UNKNOWN
             confidence = 0.0
 
-        self._classification_counts[best_category.value] += 1
+        with self._stats_lock:
+            self._processed_count += 1
+            if not is_narrative_free:
+                self._narrative_violations += 1
+            self._classification_counts[best_category.value] += 1
 
         return SemanticClassification(
             text=canonicalized,
@@ -204,13 +395,10 @@ class SemanticProcessorEngine:
         Returns:
             Tuple of (is_narrative_free, list_of_violation_descriptions).
         """
-        violations: List[str] = []
-        for pattern in self.narrative_patterns:
-            match = pattern.search(text)
-            if match:
-                violations.append(
-                    f"Narrative pattern matched: '{match.group()}' (pattern: {pattern.pattern})"
-                )
+        violations: List[str] = [
+            f"Narrative pattern matched: '{matched}' (pattern: {pattern})"
+            for pattern, matched in self._narrative_set.first_matches(text)
+        ]
 
         is_clean = len(violations) == 0
         return is_clean, violations
@@ -224,9 +412,7 @@ class SemanticProcessorEngine:
         Returns:
             List of SemanticClassification results in the same order.
         """
-        results: List[SemanticClassification] = []
-        for text in texts:
-            results.append(self.classify(text))
+        results = [self.classify(text) for text in texts]
         logger.info("Batch processed: %d texts", len(texts))
         return results
 
@@ -306,11 +492,53 @@ class SemanticProcessorEngine:
             ),
         ]
 
-    def _load_narrative_patterns(self) -> List[re.Pattern]:
-        """Return compiled regex patterns that detect narrative/subjective language.
+    def _load_category_patterns(self) -> List[CategoryPatternSet]:
+        """Return the scored detection patterns for COMMAND, METADATA, and FACTUAL text.
+
+        Returns:
+            List of CategoryPatternSet instances, in scoring order.
+        """
+        return [
+            # COMMAND detection: imperative verbs, action keywords
+            CategoryPatternSet(
+                category=SemanticCategory.COMMAND,
+                label="command_pattern",
+                weight=0.3,
+                patterns=[
+                    r"\b(run|execute|deploy|start|stop|restart|delete|create|update|set|get)\b",
+                    r"\b(install|remove|configure|enable|disable|migrate|rollback)\b",
+                ],
+            ),
+            # METADATA detection: key-value structures, timestamps, identifiers
+            CategoryPatternSet(
+                category=SemanticCategory.METADATA,
+                label="metadata_pattern",
+                weight=0.25,
+                patterns=[
+                    r"\b[a-z_]+\s*[:=]\s*\S+",
+                    r"\b\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}",
+                    r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b",
+                    r"\bversion\s*[:=]?\s*\d+\.\d+",
+                ],
+            ),
+            # FACTUAL detection: declarative statements, measurements, data
+            CategoryPatternSet(
+                category=SemanticCategory.FACTUAL,
+                label="factual_pattern",
+                weight=0.3,
+                patterns=[
+                    r"\b\d+\.?\d*\s*(ms|seconds|bytes|KB|MB|GB|%|requests|errors)\b",
+                    r"\b(total|count|sum|average|mean|median|max|min)\b",
+                    r"\b(passed|failed|succeeded|completed|verified)\b",
+                ],
+            ),
+        ]
+
+    def _load_narrative_patterns(self) -> CategoryPatternSet:
+        """Return the patterns that detect narrative/subjective language.
 
         Returns:
-            List of compiled re.Pattern objects.
+            CategoryPatternSet scanned as a single alternation.
         """
         raw_patterns = [
             r"\bvery\s+important\b",
@@ -342,7 +570,12 @@ class SemanticProcessorEngine:
             r"\bfrankly\b",
             r"\bhonestly\b",
         ]
-        return [re.compile(p, re.IGNORECASE) for p in raw_patterns]
+        return CategoryPatternSet(
+            category=SemanticCategory.NARRATIVE,
+            label="narrative_violation",
+            weight=NARRATIVE_SCORE,
+            patterns=raw_patterns,
+        )
 
 
 # ============================================
@@ -0,0 +1,39 @@
+"""Shared FastAPI dependencies — worker pool for CPU-bound engine calls."""
+
+import asyncio
+from concurrent.futures import Executor
+from contextlib import AbstractContextManager
+from typing import Any, Callable, TypeVar
+
+from fastapi import Request
+
+T = TypeVar("T")
+
+
+async def get_executor(request: Request) -> Executor | None:
+    """Dependency: the app's CPU worker pool (None falls back to the loop default)."""
+    return getattr(request.app.state, "cpu_executor", None)
+
+
+async def run_in_pool(
+    executor: Executor | None,
+    lock: AbstractContextManager[Any] | None,
+    func: Callable[..., T],
+    /,
+    *args: Any,
+    **kwargs: Any,
+) -> T:
+    """Run a blocking engine call on the worker pool, keeping the event loop free.
+
+    Engines hold unsynchronized in-memory state (sequence counters, chain
+    heads), so calls into the same engine are serialized by its lock. Pass
+    ``None`` for engines that synchronize internally.
+    """
+
+    def call() -> T:
+        if lock is None:
+            return func(*args, **kwargs)
+        with lock:
+            return func(*args, **kwargs)
+
+    return await asyncio.get_running_loop().run_in_executor(executor, call)
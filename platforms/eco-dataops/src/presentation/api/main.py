@@ -3,20 +3,27 @@ DataOps Platform — FastAPI Application Entry Point
 Data & Evidence Operations Platform API
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from presentation.api.responses import ORJSONResponse
 from presentation.api.routes import health, evidence, replay, anomaly, quality
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifecycle manager."""
-    # Startup
+    # Startup: bounded pool for CPU-bound engine work (hashing, detection)
+    app.state.cpu_executor = ThreadPoolExecutor(
+        max_workers=os.cpu_count(), thread_name_prefix="dataops-cpu"
+    )
     yield
     # Shutdown
+    app.state.cpu_executor.shutdown(wait=True)
 
 
 app = FastAPI(
@@ -26,6 +33,7 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -0,0 +1,98 @@
+"""Response classes shared by the DataOps API."""
+
+import gzip
+import os
+from typing import Any, Optional, Tuple
+
+import orjson
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+
+# Bodies smaller than this are sent uncompressed; gzip framing would outweigh the saving
+GZIP_MIN_SIZE = 1_024
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Return True if an Accept-Encoding header allows a gzip response.
+
+    An explicit ``gzip`` (or ``x-gzip``) entry decides; otherwise a ``*``
+    entry does. Entries weighted ``q=0`` -- or with an unparsable weight --
+    refuse the coding.
+    """
+    weights = {}
+    for entry in accept_encoding.split(","):
+        coding, _, params = entry.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        weight = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    weight = float(value.strip())
+                except ValueError:
+                    weight = 0.0
+        weights[coding] = weight
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in weights:
+            return weights[coding] > 0
+    return False
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered by orjson instead of the stdlib encoder.
+
+    Non-string dict keys and NumPy scalars/arrays are serialized natively, so
+    engine results can be returned without a conversion pass.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=_ORJSON_OPTIONS)
+
+
+class ReportCache:
+    """Serialized engine report, reused until the engine's state changes.
+
+    Entries are keyed by the engine object and its monotonically increasing
+    ``report_version``. A hit serves the stored orjson bytes -- gzip-encoded
+    for clients that accept it -- and polls carrying a matching
+    ``If-None-Match`` get ``304 Not Modified`` with no body at all.
+    """
+
+    def __init__(self) -> None:
+        self._key: Optional[Tuple[int, int]] = None
+        self._body = b""
+        self._gzipped: Optional[bytes] = None
+        self._etag = ""
+        # Distinguishes ETags across processes and restarts
+        self._token = os.urandom(4).hex()
+
+    def is_current(self, engine: Any) -> bool:
+        """Return True if the cached report reflects the engine's current version."""
+        return self._key == (id(engine), engine.report_version)
+
+    def store(self, engine: Any, version: int, report: Any) -> None:
+        """Serialize a report built at ``version`` and make it the cached entry.
+
+        Args:
+            engine: The engine the report was built from.
+            version: The engine's ``report_version`` read before building.
+            report: The report content.
+        """
+        self._body = orjson.dumps(report, option=_ORJSON_OPTIONS)
+        self._gzipped = gzip.compress(self._body, 4) if len(self._body) >= GZIP_MIN_SIZE else None
+        self._etag = f'"{self._token}-{id(engine):x}-{version}"'
+        self._key = (id(engine), version)
+
+    def respond(self, request: Request) -> Response:
+        """Answer a request from the cached entry."""
+        headers = {"ETag": self._etag, "Vary": "Accept-Encoding"}
+        if request.headers.get("if-none-match") == self._etag:
+            return Response(status_code=304, headers=headers)
+        if self._gzipped is not None and _accepts_gzip(request.headers.get("accept-encoding", "")):
+            headers["Content-Encoding"] = "gzip"
+            return Response(content=self._gzipped, media_type="application/json", headers=headers)
+        return Response(content=self._body, media_type="application/json", headers=headers)
@@ -1,13 +1,32 @@
 """Anomaly API — Anomaly detection and alerting endpoints."""
 
-from fastapi import APIRouter
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from functools import lru_cache
+
+import orjson
+from fastapi import APIRouter, Depends, Request, Response
 from pydantic import BaseModel
 
 from engines.anomaly_detector.engine import AnomalyDetectorEngine
+from presentation.api.dependencies import get_executor, run_in_pool
+from presentation.api.responses import ORJSONResponse, ReportCache
+from presentation.api.routing import ORJSONRoute
+
+router = APIRouter(route_class=ORJSONRoute)
+
+_report_cache = ReportCache()
 
-router = APIRouter()
+# The detector locks per metric shard internally, so its calls take no
+# route-level lock and unrelated metrics are ingested concurrently.
+@lru_cache(maxsize=1)
+def _build_detector() -> AnomalyDetectorEngine:
+    return AnomalyDetectorEngine()
 
-_detector = AnomalyDetectorEngine()
+
+async def get_detector() -> AnomalyDetectorEngine:
+    """Dependency: the process-wide anomaly detector, built on first request."""
+    return _build_detector()
 
 
 class IngestMetricRequest(BaseModel):
@@ -18,33 +37,104 @@ class IngestMetricRequest(BaseModel):
     labels: dict[str, str] = {}
 
 
+@dataclass(slots=True, kw_only=True)
+class AnomalyHit:
+    """Response for a detected anomaly; orjson encodes its slots directly."""
+
+    anomaly_detected: bool = True
+    event_id: str
+    severity: str
+    algorithm: str
+    score: float
+    description: str
+
+
+_NO_ANOMALY = orjson.dumps({"anomaly_detected": False})
+
+
 @router.post("/ingest")
-async def ingest_metric(request: IngestMetricRequest):
+async def ingest_metric(
+    request: IngestMetricRequest,
+    detector: AnomalyDetectorEngine = Depends(get_detector),
+    executor: Executor | None = Depends(get_executor),
+):
     """Ingest a metric data point and check for anomalies."""
-    anomaly = _detector.ingest(
+    anomaly = await run_in_pool(
+        executor,
+        None,
+        detector.ingest,
         metric_name=request.metric_name,
         value=request.value,
         labels=request.labels,
     )
     if anomaly:
-        return {
-            "anomaly_detected": True,
-            "event_id": anomaly.event_id,
-            "severity": anomaly.severity.value,
-            "algorithm": anomaly.algorithm.value,
-            "score": anomaly.score,
-            "description": anomaly.description,
-        }
-    return {"anomaly_detected": False}
+        # Returning the response directly skips jsonable_encoder's dict pass
+        return ORJSONResponse(
+            AnomalyHit(
+                event_id=anomaly.event_id,
+                severity=anomaly.severity_str,
+                algorithm=anomaly.algorithm_str,
+                score=anomaly.score,
+                description=anomaly.description,
+            )
+        )
+    return Response(content=_NO_ANOMALY, media_type="application/json")
+
+
+class BatchIngestRequest(BaseModel):
+    """Request to ingest many metric data points in one round-trip."""
+
+    metrics: list[IngestMetricRequest]
+
+
+@router.post("/ingest/batch")
+async def ingest_metric_batch(
+    request: BatchIngestRequest,
+    detector: AnomalyDetectorEngine = Depends(get_detector),
+    executor: Executor | None = Depends(get_executor),
+):
+    """Ingest a batch of metric data points, preserving their order."""
+
+    def ingest_all():
+        return [
+            detector.ingest(metric_name=m.metric_name, value=m.value, labels=m.labels)
+            for m in request.metrics
+        ]
+
+    anomalies = await run_in_pool(executor, None, ingest_all)
+    results = [
+        {"anomaly_detected": True, "event_id": a.event_id} if a else {"anomaly_detected": False}
+        for a in anomalies
+    ]
+    return {
+        "ingested": len(results),
+        "anomalies_detected": sum(1 for a in anomalies if a),
+        "results": results,
+    }
 
 
 @router.get("/report")
-async def anomaly_report():
-    """Get anomaly detection report."""
-    return _detector.get_anomaly_report()
+async def anomaly_report(
+    request: Request,
+    detector: AnomalyDetectorEngine = Depends(get_detector),
+    executor: Executor | None = Depends(get_executor),
+):
+    """Get anomaly detection report, served from cache until new data arrives."""
+    if not _report_cache.is_current(detector):
+        version, report = await run_in_pool(
+            executor, None, lambda: (detector.report_version, detector.get_anomaly_report())
+        )
+        _report_cache.store(detector, version, report)
+    return _report_cache.respond(request)
 
 
 @router.get("/metrics/{metric_name}")
-async def metric_summary(metric_name: str):
+async def metric_summary(
+    metric_name: str,
+    detector: AnomalyDetectorEngine = Depends(get_detector),
+    executor: Executor | None = Depends(get_executor),
+):
     """Get summary statistics for a specific metric."""
-    return _detector.get_metric_summary(metric_name)
+    return await run_in_pool(
+        executor, None, detector.get_metric_summary, metric_name
+    )
@@ -1,15 +1,32 @@
 """Evidence API — Evidence pipeline lifecycle management endpoints."""
 
+import threading
+from concurrent.futures import Executor
+from functools import lru_cache
 from typing import Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Query, Request
 from pydantic import BaseModel
 
 from engines.evidence_pipeline.engine import EvidencePipelineEngine
+from presentation.api.dependencies import get_executor, run_in_pool
+from presentation.api.responses import ReportCache
+from presentation.api.routing import ORJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
-_pipeline = EvidencePipelineEngine()
+_pipeline_lock = threading.Lock()
+_stats_cache = ReportCache()
+
+
+@lru_cache(maxsize=1)
+def _build_pipeline() -> EvidencePipelineEngine:
+    return EvidencePipelineEngine()
+
+
+async def get_pipeline() -> EvidencePipelineEngine:
+    """Dependency: the process-wide evidence pipeline, built on first request."""
+    return _build_pipeline()
 
 
 class IngestRequest(BaseModel):
@@ -29,9 +46,19 @@ class IngestResponse(BaseModel):
 
 
 @router.post("/ingest", response_model=IngestResponse)
-async def ingest_evidence(request: IngestRequest):
+async def ingest_evidence(
+    request: IngestRequest,
+    pipeline: EvidencePipelineEngine = Depends(get_pipeline),
+    executor: Executor | None = Depends(get_executor),
+):
     """Ingest new evidence into the pipeline."""
-    record = _pipeline.ingest(source=request.source, payload=request.payload)
+    record = await run_in_pool(
+        executor,
+        _pipeline_lock,
+        pipeline.ingest,
+        source=request.source,
+        payload=request.payload,
+    )
     return IngestResponse(
         record_id=record.record_id,
         state=record.state.value,
@@ -41,17 +68,37 @@ async def ingest_evidence(request: IngestRequest):
 
 
 @router.get("/chain/integrity")
-async def verify_chain():
-    """Verify evidence chain integrity."""
-    is_valid, errors = _pipeline.verify_chain_integrity()
+async def verify_chain(
+    start: int = Query(0, ge=0),
+    end: int | None = Query(None, ge=0),
+    pipeline: EvidencePipelineEngine = Depends(get_pipeline),
+    executor: Executor | None = Depends(get_executor),
+):
+    """Verify evidence chain integrity, optionally only from ``start`` onwards."""
+    is_valid, errors, chain_length = await run_in_pool(
+        executor,
+        _pipeline_lock,
+        lambda: (*pipeline.verify_chain_integrity(start, end), len(pipeline.processed_records)),
+    )
     return {
         "valid": is_valid,
         "errors": errors,
-        "chain_length": len(_pipeline.processed_records),
+        "chain_length": chain_length,
     }
 
 
 @router.get("/stats")
-async def pipeline_stats():
-    """Get evidence pipeline statistics."""
-    return _pipeline.get_pipeline_stats()
+async def pipeline_stats(
+    request: Request,
+    pipeline: EvidencePipelineEngine = Depends(get_pipeline),
+    executor: Executor | None = Depends(get_executor),
+):
+    """Get evidence pipeline statistics, served from cache until new evidence arrives."""
+    if not _stats_cache.is_current(pipeline):
+        version, stats = await run_in_pool(
+            executor,
+            _pipeline_lock,
+            lambda: (pipeline.report_version, pipeline.get_pipeline_stats()),
+        )
+        _stats_cache.store(pipeline, version, stats)
+    return _stats_cache.respond(request)
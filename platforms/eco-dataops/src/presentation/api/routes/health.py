@@ -1,17 +1,22 @@
 """Health check endpoints."""
 
-from fastapi import APIRouter
+import orjson
+from fastapi import APIRouter, Response
 
 router = APIRouter()
 
+# Probe bodies never change; serialize them once
+_HEALTHZ = orjson.dumps({"status": "ok", "service": "dataops-platform"})
+_LIVEZ = orjson.dumps({"status": "alive"})
+
 
 @router.get("/healthz")
 async def healthz():
     """Readiness probe."""
-    return {"status": "ok", "service": "dataops-platform"}
+    return Response(content=_HEALTHZ, media_type="application/json")
 
 
 @router.get("/livez")
 async def livez():
     """Liveness probe."""
-    return {"status": "alive"}
+    return Response(content=_LIVEZ, media_type="application/json")
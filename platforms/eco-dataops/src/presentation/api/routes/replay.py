@@ -1,15 +1,32 @@
 """Replay API — State reconstruction and timeline management endpoints."""
 
+import threading
+from concurrent.futures import Executor
+from functools import lru_cache
 from typing import Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends, Request
 from pydantic import BaseModel
 
 from engines.replay_engine.engine import ReplayEngine, ReplayMode
+from presentation.api.dependencies import get_executor, run_in_pool
+from presentation.api.responses import ReportCache
+from presentation.api.routing import ORJSONRoute
 
-router = APIRouter()
+router = APIRouter(route_class=ORJSONRoute)
 
-_replay = ReplayEngine()
+_engine_lock = threading.Lock()
+_stats_cache = ReportCache()
+
+
+@lru_cache(maxsize=1)
+def _build_engine() -> ReplayEngine:
+    return ReplayEngine()
+
+
+async def get_replay_engine() -> ReplayEngine:
+    """Dependency: the process-wide replay engine, built on first request."""
+    return _build_engine()
 
 
 class RecordEventRequest(BaseModel):
@@ -29,9 +46,16 @@ class ReplayRequest(BaseModel):
 
 
 @router.post("/events")
-async def record_event(request: RecordEventRequest):
+async def record_event(
+    request: RecordEventRequest,
+    engine: ReplayEngine = Depends(get_replay_engine),
+    executor: Executor | None = Depends(get_executor),
+):
     """Record a new timeline event."""
-    event = _replay.record_event(
+    event = await run_in_pool(
+        executor,
+        _engine_lock,
+        engine.record_event,
         event_type=request.event_type,
         actor=request.actor,
         payload=request.payload,
@@ -44,10 +68,17 @@ async def record_event(request: RecordEventRequest):
 
 
 @router.post("/sessions")
-async def create_replay_session(request: ReplayRequest):
+async def create_replay_session(
+    request: ReplayRequest,
+    engine: ReplayEngine = Depends(get_replay_engine),
+    executor: Executor | None = Depends(get_executor),
+):
     """Create a new replay session."""
     mode = ReplayMode[request.mode]
-    session = _replay.replay(
+    session = await run_in_pool(
+        executor,
+        _engine_lock,
+        engine.replay,
         mode=mode,
         start_seq=request.start_sequence,
         end_seq=request.end_sequence,
@@ -61,17 +92,35 @@ async def create_replay_session(request: ReplayRequest):
 
 
 @router.get("/timeline/integrity")
-async def verify_timeline():
+async def verify_timeline(
+    engine: ReplayEngine = Depends(get_replay_engine),
+    executor: Executor | None = Depends(get_executor),
+):
     """Verify timeline integrity."""
-    is_valid, errors = _replay.verify_timeline_integrity()
+    is_valid, errors, timeline_length = await run_in_pool(
+        executor,
+        _engine_lock,
+        lambda: (*engine.verify_timeline_integrity(), len(engine.timeline)),
+    )
     return {
         "valid": is_valid,
         "errors": errors,
-        "timeline_length": len(_replay.timeline),
+        "timeline_length": timeline_length,
     }
 
 
 @router.get("/stats")
-async def replay_stats():
-    """Get replay engine statistics."""
-    return _replay.get_timeline_stats()
+async def replay_stats(
+    request: Request,
+    engine: ReplayEngine = Depends(get_replay_engine),
+    executor: Executor | None = Depends(get_executor),
+):
+    """Get replay engine statistics, served from cache until the timeline changes."""
+    if not _stats_cache.is_current(engine):
+        version, stats = await run_in_pool(
+            executor,
+            _engine_lock,
+            lambda: (engine.report_version, engine.get_timeline_stats()),
+        )
+        _stats_cache.store(engine, version, stats)
+    return _stats_cache.respond(request)
@@ -0,0 +1,68 @@
+"""Shared utility functions — identifiers, timestamps and canonical JSON."""
+from __future__ import annotations
+
+import json
+import math
+import os
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# --- ID Generation ---
+
+def new_id() -> str:
+    """Return a random 128-bit identifier as 32 hex characters."""
+    return os.urandom(16).hex()
+
+
+# --- DateTime ---
+
+def from_ns(ns: int) -> datetime:
+    """Convert a nanosecond UNIX timestamp to an aware UTC datetime."""
+    seconds, nanos = divmod(ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds, tz=timezone.utc).replace(microsecond=nanos // 1_000)
+
+
+# --- Serialization ---
+
+_CANONICAL_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+
+
+def has_non_finite(value: Any) -> bool:
+    """Return True if *value* holds a NaN or infinite float at any depth."""
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(has_non_finite(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(has_non_finite(v) for v in value)
+    return False
+
+
+def canonical_json(obj: Any, default: Callable[[Any], Any] | None = None) -> bytes:
+    """Serialize *obj* to sorted-key JSON bytes for hashing.
+
+    orjson covers every value the stdlib encoder does except integers
+    beyond 64 bits, which fall back to ``json.dumps``. orjson also writes
+    NaN and infinities as ``null``, which would hash them like ``None``;
+    values holding them (searched for only when ``null`` was emitted) use
+    ``json.dumps`` too, which spells them out.
+
+    Args:
+        obj: The value to serialize.
+        default: Optional converter for values neither encoder handles.
+
+    Returns:
+        UTF-8 encoded JSON bytes.
+    """
+    try:
+        canonical = orjson.dumps(obj, default=default, option=_CANONICAL_OPTIONS)
+    except orjson.JSONEncodeError:
+        return json.dumps(obj, sort_keys=True, default=default).encode("utf-8")
+    if b"null" in canonical and has_non_finite(obj):
+        return json.dumps(obj, sort_keys=True, default=default).encode("utf-8")
+    return canonical
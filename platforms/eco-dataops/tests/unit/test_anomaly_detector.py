@@ -0,0 +1,334 @@
+"""Test anomaly detector engine ring buffer and detection algorithms."""
+
+import numpy as np
+
+from engines.anomaly_detector.engine import (
+    AnomalyAlgorithm,
+    AnomalyDetectorEngine,
+    _exact_moments,
+    _quantiles,
+    _rolling_mean_std,
+    _sorted_quantiles,
+)
+
+
+def _engine_with(values, window_size=20):
+    engine = AnomalyDetectorEngine(window_size=window_size)
+    for value in values:
+        engine.ingest("cpu", float(value))
+    return engine
+
+
+def test_ring_buffer_keeps_latest_window_in_order():
+    engine = _engine_with(range(45), window_size=20)
+    assert engine._count["cpu"] == 20
+    assert engine._last_value["cpu"] == 44.0
+    assert engine._window_view("cpu").tolist() == [float(v) for v in range(25, 45)]
+    assert engine._window_view("cpu") is engine._scratch["cpu"]  # unwrapped without allocating
+
+    summary = engine.get_metric_summary("cpu")
+    assert summary["count"] == 20
+    assert summary["latest_value"] == 44.0
+    assert summary["min"] == 25.0
+
+
+def test_statistics_match_numpy_over_wrapped_window():
+    rng = np.random.default_rng(7)
+    values = rng.normal(100.0, 5.0, size=57)
+    engine = _engine_with(values, window_size=20)
+
+    summary = engine.get_metric_summary("cpu")
+    window = values[-20:]
+    assert summary["mean"] == np.mean(window)
+    assert summary["p25"] == np.percentile(window, 25)
+    assert summary["p99"] == np.percentile(window, 99)
+
+
+def test_spike_after_wrap_is_detected():
+    engine = _engine_with([100.0, 101.0, 99.0, 100.5] * 10, window_size=16)
+    anomaly = engine.ingest("cpu", 500.0)
+    assert anomaly is not None
+    assert anomaly.algorithm in (AnomalyAlgorithm.Z_SCORE, AnomalyAlgorithm.IQR)
+    assert anomaly.data_point.value == 500.0
+
+
+def test_detection_waits_for_minimum_points():
+    engine = _engine_with([1.0, 2.0] * 4)
+    assert engine.ingest("cpu", 1000.0) is None
+
+
+def test_concurrent_ingest_across_metrics_keeps_windows_consistent():
+    from concurrent.futures import ThreadPoolExecutor
+
+    engine = AnomalyDetectorEngine(window_size=50)
+    names = [f"m{i}" for i in range(8)]
+
+    def feed(name):
+        for i in range(200):
+            engine.ingest(name, float(i % 7))
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(feed, names * 2))
+
+    report = engine.get_anomaly_report()
+    assert report["total_metrics_tracked"] == 8
+    assert report["total_data_points"] == 8 * 50
+    for name in names:
+        assert engine.get_metric_summary(name)["count"] == 50
+
+
+def test_detectors_accept_a_shared_values_array():
+    engine = _engine_with([100.0, 101.0, 99.0, 100.5] * 10 + [500.0], window_size=16)
+    values = engine._window_view("cpu")
+    for detect in (engine.detect_zscore, engine.detect_iqr, engine.detect_moving_average):
+        shared, own = detect("cpu", values), detect("cpu")
+        assert (shared is None) == (own is None)
+        if shared is not None:
+            assert shared.score == own.score
+
+
+def test_running_sums_track_window_and_moving_average_span():
+    rng = np.random.default_rng(3)
+    values = rng.normal(50.0, 4.0, size=131)
+    engine = _engine_with(values, window_size=24)
+
+    stats = engine._stats["cpu"]
+    window = values[-24:]
+    span = values[-21:-1]  # moving_avg_window=20, excluding the latest point
+    assert np.isclose(stats.total, window.sum())
+    assert np.isclose(stats.total_sq, window @ window)
+    assert stats.ma_count == 20
+    assert np.isclose(stats.ma_total, span.sum())
+    assert np.isclose(stats.ma_total_sq, span @ span)
+
+
+def test_constant_window_falls_back_to_exact_moments():
+    engine = _engine_with([0.1] * 37 + [7.3] * 40, window_size=32)
+    assert engine.ingest("cpu", 7.3) is None
+
+
+def test_partition_quantiles_match_numpy_percentile():
+    rng = np.random.default_rng(11)
+    quantiles = (0.25, 0.75, 0.5, 0.99, 0.0, 1.0)
+    for n in (1, 2, 3, 10, 37, 100):
+        for values in (rng.normal(0.0, 1.0, n), rng.integers(0, 4, n).astype(float)):
+            expected = np.quantile(values, quantiles)
+            assert np.array_equal(_quantiles(values, quantiles), expected)
+
+
+def test_sorted_window_tracks_ring_and_skips_nan():
+    rng = np.random.default_rng(5)
+    values = [float(v) for v in rng.normal(10.0, 2.0, size=70)]
+    values[40] = float("nan")
+
+    engine = _engine_with(values[:40], window_size=25)
+    window = engine._window_view("cpu")
+    assert engine._sorted["cpu"] == sorted(window.tolist())
+    assert _sorted_quantiles(engine._sorted["cpu"], (0.25, 0.75)) == list(
+        np.percentile(window, (25, 75))
+    )
+
+    engine = _engine_with(values, window_size=25)
+    assert engine._sorted["cpu"] == sorted(engine._window_view("cpu").tolist())
+    engine = _engine_with(values[:50], window_size=25)
+    assert len(engine._sorted["cpu"]) == 24  # the NaN is still in the window
+
+
+def test_classify_severity_boundaries():
+    engine = AnomalyDetectorEngine()
+    ratios = (4.0, 3.99, 3.0, 2.0, 1.5, 1.49)
+    assert [engine._classify_severity(r * 2.0, 2.0).value for r in ratios] == [
+        "critical", "high", "high", "medium", "low", "info",
+    ]
+    assert engine._classify_severity(5.0, 0.0).value == "critical"
+
+
+def test_only_reported_anomaly_is_materialized(monkeypatch):
+    from engines.anomaly_detector import engine as engine_module
+
+    engine = _engine_with([100.0, 101.0, 99.0, 100.5] * 10, window_size=16)
+    built = []
+    original = engine_module.AnomalyEvent
+    monkeypatch.setattr(
+        engine_module, "AnomalyEvent", lambda **kw: built.append(kw) or original(**kw)
+    )
+
+    anomaly = engine.ingest("cpu", 500.0)
+    assert len(built) == 1
+    assert anomaly.description.startswith(("Z-score anomaly", "IQR outlier"))
+    assert "value=500.0000" in anomaly.description
+
+
+def test_report_counts_match_detected_anomalies():
+    engine = AnomalyDetectorEngine(window_size=16)
+    for name in ("cpu", "mem"):
+        for value in [100.0, 101.0, 99.0, 100.5] * 5 + [500.0, -300.0]:
+            engine.ingest(name, value)
+
+    detected = engine.detected_anomalies
+    report = engine.get_anomaly_report()
+    assert report["total_anomalies"] == len(detected) > 0
+    assert report["by_metric"] == {
+        "cpu": sum(a.data_point.metric_name == "cpu" for a in detected),
+        "mem": sum(a.data_point.metric_name == "mem" for a in detected),
+    }
+    assert sum(report["by_algorithm"].values()) == len(detected)
+    assert engine.get_metric_summary("cpu")["anomaly_count"] == report["by_metric"]["cpu"]
+
+
+def test_anomaly_data_point_carries_latest_labels_and_timestamp():
+    engine = _engine_with([100.0, 101.0, 99.0, 100.5] * 10, window_size=16)
+    anomaly = engine.ingest("cpu", 500.0, labels={"host": "db-1"})
+    point = anomaly.data_point
+    assert (point.metric_name, point.value, point.labels) == ("cpu", 500.0, {"host": "db-1"})
+    assert point.timestamp == engine.get_metric_summary("cpu")["latest_timestamp"]
+
+
+def test_hampel_detects_outlier_in_contaminated_window():
+    rng = np.random.default_rng(9)
+    values = rng.normal(100.0, 2.0, size=40)
+    values[::5] = 180.0  # heavy contamination inflates the z-score's std
+    engine = _engine_with(values, window_size=40)
+
+    engine.ingest("cpu", 130.0)
+    assert engine.detect_zscore("cpu") is None
+    anomaly = engine.detect_hampel("cpu")
+    assert anomaly is not None
+    assert anomaly.algorithm is AnomalyAlgorithm.HAMPEL
+    window = engine._window_view("cpu")
+    median = np.median(window)
+    mad = np.median(np.abs(window - median))
+    assert np.isclose(anomaly.score, abs(0.6745 * (130.0 - median) / mad))
+
+
+def test_hampel_runs_in_ingest_only_when_enabled():
+    engine = _engine_with([100.0, 101.0, 99.0, 100.5, 100.2] * 8, window_size=40)
+    engine.config["hampel_enabled"] = True
+    engine.config["z_threshold"] = engine.config["iqr_multiplier"] = 1e9
+    engine.config["moving_avg_deviation"] = 1e9
+    anomaly = engine.ingest("cpu", 104.0)
+    assert anomaly is not None and anomaly.algorithm is AnomalyAlgorithm.HAMPEL
+
+
+def test_ingest_many_matches_point_by_point_ingest():
+    rng = np.random.default_rng(4)
+    values = rng.normal(100.0, 5.0, size=120)
+    values[::17] *= 3.0
+    streamed = AnomalyDetectorEngine(window_size=24)
+    batched = AnomalyDetectorEngine(window_size=24)
+
+    expected = [streamed.ingest("cpu", float(v)) for v in values]
+    results = batched.ingest_many("cpu", values[:5]) + batched.ingest_many("cpu", values[5:])
+
+    assert len(results) == len(values)
+    for want, got in zip(expected, results, strict=True):
+        assert (want is None) == (got is None)
+        if want is not None:
+            assert (got.algorithm, got.severity) == (want.algorithm, want.severity)
+            assert np.isclose(got.score, want.score)
+            assert got.data_point.value == want.data_point.value
+    assert batched._window_view("cpu").tolist() == streamed._window_view("cpu").tolist()
+    assert batched._sorted["cpu"] == streamed._sorted["cpu"]
+    assert batched.get_anomaly_report() == streamed.get_anomaly_report()
+
+
+def test_ingest_many_matches_ingest_below_minimum_detection_window():
+    rng = np.random.default_rng(6)
+    values = rng.normal(100.0, 5.0, size=300)
+    values[::13] *= 3.0
+    streamed = AnomalyDetectorEngine(window_size=8)
+    batched = AnomalyDetectorEngine(window_size=8)
+
+    expected = [streamed.ingest("cpu", float(v)) for v in values]
+    results = batched.ingest_many("cpu", values)
+
+    assert expected == [None] * len(values)
+    assert results == expected
+    assert batched._window_view("cpu").tolist() == streamed._window_view("cpu").tolist()
+    assert batched.get_anomaly_report() == streamed.get_anomaly_report()
+
+
+def test_rolling_mean_std_matches_windows_and_keeps_constant_runs_exact():
+    from numpy.lib.stride_tricks import sliding_window_view
+
+    rng = np.random.default_rng(8)
+    values = rng.normal(1_000.0, 3.0, size=300)
+    values[100:140] = 1_000.0
+    means, stds = _rolling_mean_std(values, 20)
+    view = sliding_window_view(values, 20)
+    assert np.allclose(means, view.mean(axis=1), rtol=1e-12)
+    assert np.allclose(stds, view.std(axis=1), rtol=1e-9)
+    assert (stds[100:121] == 0.0).all()
+
+    values[50] = float("nan")
+    means, _ = _rolling_mean_std(values, 20)
+    assert np.isnan(means[31:51]).all() and not np.isnan(means[51:]).any()
+
+
+def test_anomaly_logging_is_gated_and_sampled(caplog):
+    import logging
+
+    engine = _engine_with([100.0, 101.0, 99.0, 100.5] * 5, window_size=16)
+    engine.config["info_log_sample_rate"] = 2
+    with caplog.at_level(logging.CRITICAL, logger="engines.anomaly_detector.engine"):
+        engine.ingest("cpu", 500.0)
+    assert caplog.records == []
+
+    with caplog.at_level(logging.INFO, logger="engines.anomaly_detector.engine"):
+        for value in (-400.0, 900.0, -800.0, 1500.0):
+            assert engine.ingest("cpu", value) is not None
+    assert len(caplog.records) == 2
+
+
+def test_sample_rates_below_one_log_every_anomaly(caplog):
+    import logging
+
+    values = [100.0, 101.0, 99.0, 100.5] * 4 + [-400.0, 900.0, -800.0, 1500.0]
+    for sample_rate in (0, -3):
+        engine = AnomalyDetectorEngine(window_size=16)
+        engine.config["info_log_sample_rate"] = sample_rate
+        caplog.clear()
+        with caplog.at_level(logging.INFO, logger="engines.anomaly_detector.engine"):
+            results = engine.ingest_many("cpu", values)
+        reported = [r for r in results if r is not None]
+        assert len(reported) == 4
+        assert len(caplog.records) == 4
+        assert engine._window_view("cpu").tolist() == values[-16:]
+
+
+def test_anomaly_history_is_bounded_and_counts_follow_evictions(monkeypatch):
+    from engines.anomaly_detector import engine as engine_module
+
+    monkeypatch.setattr(engine_module, "MAX_ANOMALY_HISTORY", 3)
+    engine = AnomalyDetectorEngine(window_size=16)
+    for name in ("cpu", "mem"):
+        for value in [100.0, 101.0, 99.0, 100.5] * 4:
+            engine.ingest(name, value)
+    for name, spike in (("cpu", 500.0), ("mem", 600.0), ("mem", -900.0), ("mem", 2000.0)):
+        assert engine.ingest(name, spike) is not None
+
+    assert len(engine.detected_anomalies) == 3
+    report = engine.get_anomaly_report()
+    assert report["total_anomalies"] == 3
+    assert report["by_metric"] == {"mem": 3}
+    assert engine.get_metric_summary("cpu")["anomaly_count"] == 0
+
+
+def test_exact_moments_small_window_fast_path_matches_numpy():
+    rng = np.random.default_rng(12)
+    for n in (1, 10, 128, 129, 400):
+        values = rng.normal(20.0, 3.0, size=n)
+        mean, std = _exact_moments(values)
+        assert np.isclose(mean, values.mean(), rtol=1e-13)
+        assert np.isclose(std, values.std(), rtol=1e-12)
+    assert _exact_moments(np.full(40, 7.0)) == (7.0, 0.0)
+
+
+def test_events_and_points_are_slotted():
+    from engines.anomaly_detector.engine import AnomalyEvent, DataPoint
+
+    event = AnomalyEvent(data_point=DataPoint(metric_name="cpu", value=1.0))
+    assert not hasattr(event, "__dict__")
+    assert not hasattr(event.data_point, "__dict__")
+    assert event.to_dict()["metric_name"] == "cpu"
+    assert (event.severity_str, event.algorithm_str) == ("info", "z_score")
@@ -110,3 +110,19 @@ def test_anomaly_algorithm_enum_values():
     assert AnomalyAlgorithm.IQR.value == "IQR"
     assert AnomalyAlgorithm.ISOLATION_FOREST.value == "ISOLATION_FOREST"
     assert AnomalyAlgorithm.MOVING_AVERAGE.value == "MOVING_AVERAGE"
+
+
+def test_detected_at_derived_from_nanosecond_timestamp():
+    from datetime import datetime, timezone
+
+    e = AnomalyEvent(
+        metric_name="m",
+        metric_value=1.0,
+        algorithm=AnomalyAlgorithm.Z_SCORE,
+        severity=AnomalySeverity.LOW,
+        score=1.0,
+        threshold=2.0,
+        description="test",
+        detected_at_ns=1_700_000_000_123_456_789,
+    )
+    assert e.detected_at == datetime(2023, 11, 14, 22, 13, 20, 123456, tzinfo=timezone.utc)
@@ -0,0 +1,87 @@
+"""Test evidence pipeline ingestion and hash-chain verification."""
+
+from engines.evidence_pipeline.engine import EvidencePipelineEngine, EvidenceState
+
+
+def _payload(i):
+    return {"type": "log", "content": f"entry-{i}", "timestamp": "2024-01-01T00:00:00Z"}
+
+
+def _pipeline_with(count):
+    pipeline = EvidencePipelineEngine()
+    for i in range(count):
+        pipeline.ingest("collector", _payload(i))
+    return pipeline
+
+
+def test_ingest_seals_and_links_records():
+    pipeline = _pipeline_with(3)
+    records = pipeline.processed_records
+    assert [r.state for r in records] == [EvidenceState.SEALED] * 3
+    assert records[1].chain_parent_hash == records[0].hash_value
+    assert pipeline.chain_head == records[-1].hash_value
+    assert len(records[0].hash_value) == 64  # SHA-256 hex digest
+
+
+def test_verify_chain_integrity_detects_tampering():
+    pipeline = _pipeline_with(3)
+    assert pipeline.verify_chain_integrity() == (True, [])
+
+    pipeline.processed_records[1].payload["content"] = "tampered"
+    is_valid, errors = pipeline.verify_chain_integrity()
+    assert is_valid is False
+    assert len(errors) == 1
+    assert "at position 1: hash mismatch" in errors[0]
+
+
+def test_verify_chain_integrity_reports_hash_and_linkage():
+    pipeline = _pipeline_with(4)
+    assert pipeline.verify_chain_integrity() == (True, [])
+
+    pipeline.processed_records[3].payload["content"] = "tampered"
+    pipeline.processed_records[2].chain_parent_hash = "0" * 64
+    is_valid, errors = pipeline.verify_chain_integrity()
+    assert is_valid is False
+    assert ["parent" in e for e in errors] == [True, False]
+
+
+def test_segment_verification_starts_at_nearest_anchor(monkeypatch):
+    from engines.evidence_pipeline import engine as engine_module
+
+    monkeypatch.setattr(engine_module, "ANCHOR_INTERVAL", 4)
+    pipeline = _pipeline_with(10)
+    assert [position for position, _ in pipeline._anchors] == [0, 4, 8]
+
+    # Tampering before the anchor at 4 is outside the verified segment
+    pipeline.processed_records[1].payload["content"] = "tampered"
+    assert pipeline.verify_chain_integrity(start=6) == (True, [])
+    assert pipeline.verify_chain_integrity()[0] is False
+
+    pipeline.processed_records[5].payload["content"] = "tampered"
+    is_valid, errors = pipeline.verify_chain_integrity(start=6)
+    assert is_valid is False
+    assert "at position 5: hash mismatch" in errors[0]
+
+
+def test_anchor_detects_consistently_rewritten_chain(monkeypatch):
+    from engines.evidence_pipeline import engine as engine_module
+
+    monkeypatch.setattr(engine_module, "ANCHOR_INTERVAL", 4)
+    pipeline = _pipeline_with(6)
+    records = pipeline.processed_records
+
+    # Rewrite record 4 and re-link its successor so hashes and links agree
+    records[4].payload = {**records[4].payload, "content": "forged"}
+    records[4].hash_value = pipeline._compute_hash(records[4])
+    records[5].chain_parent_hash = records[4].hash_value
+    is_valid, errors = pipeline.verify_chain_integrity()
+    assert is_valid is False
+    assert len(errors) == 1
+    assert "at position 4: anchor mismatch" in errors[0]
+
+
+def test_record_digest_distinguishes_nan_from_null():
+    from engines.evidence_pipeline.engine import _record_digest
+
+    assert _record_digest("r", {"v": float("nan")}) != _record_digest("r", {"v": None})
+    assert _record_digest("r", {"v": None}) == _record_digest("r", {"v": None})
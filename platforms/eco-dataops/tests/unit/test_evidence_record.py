@@ -24,7 +24,7 @@ def test_evidence_hash_deterministic():
     hash1 = r.evidence_hash
     hash2 = r.evidence_hash
     assert hash1 == hash2
-    assert len(hash1) == 128  # SHA3-512 hex digest
+    assert len(hash1) == 64  # SHA-256 hex digest
 
 
 def test_evidence_hash_differs_by_id():
@@ -60,3 +60,28 @@ def test_evidence_state_enum_values():
     assert EvidenceState.SEALED.value == "SEALED"
     assert EvidenceState.ARCHIVED.value == "ARCHIVED"
     assert EvidenceState.REJECTED.value == "REJECTED"
+
+
+def test_evidence_hash_cached_until_hashed_field_reassigned():
+    r = EvidenceRecord(id="id-a", source="s", payload={"x": 1})
+    first = r.evidence_hash
+    assert r.evidence_hash is first
+
+    r.state = EvidenceState.SEALED
+    assert r.evidence_hash is first
+
+    r.payload = {"x": 2}
+    assert r.evidence_hash != first
+    assert r.evidence_hash == EvidenceRecord(id="id-a", source="s", payload={"x": 2}).evidence_hash
+
+
+def test_evidence_hash_distinguishes_non_finite_floats_from_none():
+    hashes = {
+        EvidenceRecord(id="r", source="s", payload={"v": value}).evidence_hash
+        for value in (None, float("nan"), float("inf"), float("-inf"))
+    }
+    assert len(hashes) == 4
+    nested = EvidenceRecord(id="r", source="s", payload={"v": [{"x": float("nan")}]})
+    assert nested.evidence_hash != EvidenceRecord(
+        id="r", source="s", payload={"v": [{"x": None}]}
+    ).evidence_hash
@@ -0,0 +1,155 @@
+"""Test replay engine timeline management and replay modes."""
+
+import pytest
+
+from engines.replay_engine.engine import ReplayEngine, ReplayMode
+
+
+def _engine_with(event_types):
+    engine = ReplayEngine()
+    for i, event_type in enumerate(event_types):
+        engine.record_event(event_type, "tester", {f"k{i}": i})
+    return engine
+
+
+def test_partial_replay_selects_mutations_in_range():
+    engine = _engine_with(["create", "read", "update", "read", "delete", "audit"])
+    session = engine.replay(ReplayMode.PARTIAL, start_seq=2, end_seq=5)
+    assert session.status == "completed"
+    assert [e.sequence_number for e in session.events] == [3, 5]
+    assert [e.event_type for e in session.events] == ["update", "delete"]
+
+
+def test_partial_replay_interleaves_types_in_sequence_order():
+    engine = _engine_with(["update", "create", "update", "create"])
+    session = engine.replay(ReplayMode.PARTIAL, start_seq=1)
+    assert [e.sequence_number for e in session.events] == [1, 2, 3, 4]
+
+
+def test_full_replay_reconstructs_state():
+    engine = _engine_with(["create", "update"])
+    session = engine.replay(ReplayMode.FULL, start_seq=1, end_seq=2)
+    state = session.snapshots[-1].state
+    assert state["k0"] == 0
+    assert state["k1"] == 1
+    assert state["_last_sequence"] == 2
+    assert state["_last_event_type"] == "update"
+
+
+def test_timeline_stats_counts_event_types():
+    engine = _engine_with(["create", "read", "read"])
+    engine.replay(ReplayMode.FULL, start_seq=1)
+    stats = engine.get_timeline_stats()
+    assert stats["total_events"] == 3
+    assert stats["event_types"] == {"create": 1, "read": 2}
+    assert stats["session_statuses"] == {"completed": 1}
+
+
+def test_verify_timeline_integrity_detects_tampering():
+    engine = _engine_with(["create", "update", "delete"])
+    assert engine.verify_timeline_integrity() == (True, [])
+
+    engine.timeline[1].payload["k1"] = "tampered"
+    is_valid, errors = engine.verify_timeline_integrity()
+    assert is_valid is False
+    assert len(errors) == 1
+    assert errors[0].startswith("Hash mismatch at seq=2")
+
+
+def test_event_hash_is_sha256():
+    engine = _engine_with(["create"])
+    event = engine.timeline[0]
+    assert len(event.hash_value) == 64  # SHA-256 hex digest
+    assert event.hash_value == event.compute_hash()
+
+
+def test_verify_timeline_integrity_reports_each_mismatch():
+    engine = _engine_with(["create", "update", "delete", "audit"])
+    engine.timeline[3].actor = "intruder"
+    is_valid, errors = engine.verify_timeline_integrity()
+    assert is_valid is False
+    assert [e.split(":")[0] for e in errors] == ["Hash mismatch at seq=4"]
+
+
+def test_verify_timeline_integrity_reports_sequence_gap():
+    engine = _engine_with(["create", "update", "delete"])
+    del engine.timeline[1]
+    is_valid, errors = engine.verify_timeline_integrity()
+    assert is_valid is False
+    assert errors == ["Sequence gap at index 1: expected 2, got 3"]
+
+
+def test_point_in_time_replay_and_nearest_snapshot():
+    engine = _engine_with(["create", "update"])
+    first = engine.create_snapshot({"v": 1})
+    engine.create_snapshot({"v": 2})
+    engine.record_event("delete", "tester", {"k2": 2})
+
+    session = engine.replay(ReplayMode.POINT_IN_TIME, start_seq=1, end_seq=2)
+    assert [e.sequence_number for e in session.events] == [1, 2]
+
+    diff = engine.replay(ReplayMode.DIFFERENTIAL, start_seq=3, end_seq=3)
+    assert diff.snapshots[0] is first
+    assert [e.sequence_number for e in diff.events] == [3]
+    assert engine.replay(ReplayMode.DIFFERENTIAL, start_seq=1).snapshots[0] is not first
+
+
+def test_export_arrow_writes_columnar_timeline(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    engine = _engine_with(["create", "update", "create"])
+    path = tmp_path / "timeline.arrow"
+    assert engine.export_arrow(str(path), start_seq=2) == 2
+
+    with pa.memory_map(str(path)) as source:
+        table = pa.ipc.open_file(source).read_all()
+    assert table.column("sequence_number").to_pylist() == [2, 3]
+    assert table.column("event_type").to_pylist() == ["update", "create"]
+    assert table.column("actor").to_pylist() == ["tester", "tester"]
+    assert table.column("hash_value")[0].as_py() == bytes.fromhex(engine.timeline[1].hash_value)
+    assert table.column("payload").to_pylist() == [b'{"k1":1}', b'{"k2":2}']
+
+
+def test_session_history_is_bounded(monkeypatch):
+    from engines.replay_engine import engine as engine_module
+
+    monkeypatch.setattr(engine_module, "MAX_SESSION_HISTORY", 2)
+    engine = _engine_with(["create"])
+    engine.replay(ReplayMode.FULL, start_seq=1)
+    engine.replay(ReplayMode.PARTIAL, start_seq=1)
+    engine.replay(ReplayMode.POINT_IN_TIME, start_seq=1)
+    assert [s.mode for s in engine.sessions] == [ReplayMode.PARTIAL, ReplayMode.POINT_IN_TIME]
+    stats = engine.get_timeline_stats()
+    assert stats["total_sessions"] == 2
+    assert stats["session_statuses"] == {"completed": 2}
+
+
+def test_deferred_hashes_are_flushed_in_batches(monkeypatch):
+    from engines.replay_engine import engine as engine_module
+
+    monkeypatch.setattr(engine_module, "HASH_BATCH_SIZE", 3)
+    engine = ReplayEngine()
+    events = [engine.record_event("create", "tester", {"i": i}, defer_hash=True) for i in range(4)]
+    assert [bool(e.hash_value) for e in events] == [True, True, True, False]
+
+    assert engine.verify_timeline_integrity() == (True, [])
+    assert events[3].hash_value == events[3].compute_hash()
+    assert engine.flush_pending_hashes() == 0
+
+
+def test_event_encoding_keeps_non_finite_floats_distinct_from_null(tmp_path):
+    from engines.replay_engine.engine import TimelineEvent
+
+    def digest(value):
+        return TimelineEvent(event_id="e", timestamp="t", payload={"v": value}).compute_hash()
+
+    values = [None, float("nan"), float("inf"), float("-inf")]
+    assert len({digest(v) for v in values}) == 4
+
+    pa = pytest.importorskip("pyarrow")
+    engine = ReplayEngine()
+    engine.record_event("update", "tester", {"v": float("nan")})
+    path = tmp_path / "timeline.arrow"
+    engine.export_arrow(str(path))
+    with pa.memory_map(str(path)) as source:
+        table = pa.ipc.open_file(source).read_all()
+    assert table.column("payload").to_pylist() == [b'{"v": NaN}']
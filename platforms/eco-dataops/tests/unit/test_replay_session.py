@@ -54,3 +54,16 @@ def test_replay_status_enum_values():
     assert ReplayStatus.ACTIVE.value == "ACTIVE"
     assert ReplayStatus.COMPLETED.value == "COMPLETED"
     assert ReplayStatus.FAILED.value == "FAILED"
+
+
+def test_replay_session_hash_cached_until_hashed_field_reassigned():
+    s = ReplaySession(id="s1", mode=ReplayMode.FULL, start_sequence=0)
+    first = s.session_hash
+    s.events_replayed = 5
+    assert s.session_hash is first
+
+    s.end_sequence = 10
+    assert s.session_hash == ReplaySession(
+        id="s1", mode=ReplayMode.FULL, start_sequence=0, end_sequence=10
+    ).session_hash
+    assert s.session_hash != first
@@ -0,0 +1,63 @@
+"""Test versioned report caching for polled API endpoints."""
+
+import gzip
+
+import orjson
+from starlette.requests import Request
+
+from presentation.api.responses import ReportCache
+
+
+class _Engine:
+    report_version = 0
+
+
+def _request(**headers):
+    raw = [(k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+def test_cache_tracks_engine_version():
+    engine, cache = _Engine(), ReportCache()
+    assert cache.is_current(engine) is False
+
+    cache.store(engine, engine.report_version, {"total": 1})
+    assert cache.is_current(engine) is True
+    assert cache.is_current(_Engine()) is False
+
+    engine.report_version += 1
+    assert cache.is_current(engine) is False
+
+
+def test_respond_serves_etag_304_and_gzip():
+    engine, cache = _Engine(), ReportCache()
+    report = {"by_metric": {f"metric-{i}": i for i in range(200)}}
+    cache.store(engine, 0, report)
+
+    plain = cache.respond(_request())
+    assert orjson.loads(plain.body) == report
+    assert "content-encoding" not in plain.headers
+
+    zipped = cache.respond(_request(accept_encoding="gzip, br"))
+    assert zipped.headers["content-encoding"] == "gzip"
+    assert orjson.loads(gzip.decompress(zipped.body)) == report
+
+    etag = plain.headers["etag"]
+    assert cache.respond(_request(if_none_match=etag)).status_code == 304
+
+
+def test_respond_honors_accept_encoding_weights():
+    engine, cache = _Engine(), ReportCache()
+    cache.store(engine, 0, {"by_metric": {f"metric-{i}": i for i in range(200)}})
+
+    def encoding(accept_encoding):
+        response = cache.respond(_request(accept_encoding=accept_encoding))
+        return response.headers.get("content-encoding")
+
+    assert encoding("gzip;q=0.5, br") == "gzip"
+    assert encoding("*") == "gzip"
+    assert encoding("gzip;q=0") is None
+    assert encoding("gzip; q=0.0, identity") is None
+    assert encoding("br, *;q=0") is None
+    assert encoding("gzip;q=0, *") is None
+    assert encoding("deflate") is None
@@ -0,0 +1,42 @@
+"""Test orjson request decoding on the high-rate routes."""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from presentation.api.routing import ORJSONRoute
+
+
+class _Point(BaseModel):
+    name: str
+    value: float
+
+
+def _client():
+    app = FastAPI()
+    app.router.route_class = ORJSONRoute
+
+    @app.post("/points")
+    async def post_point(point: _Point):
+        return {"name": point.name, "value": point.value}
+
+    return TestClient(app)
+
+
+def test_body_is_decoded_and_validated():
+    client = _client()
+    assert client.post("/points", json={"name": "cpu", "value": 1}).json() == {
+        "name": "cpu",
+        "value": 1.0,
+    }
+    missing = client.post("/points", json={"name": "cpu"})
+    assert missing.status_code == 422
+    assert missing.json()["detail"][0]["type"] == "missing"
+
+
+def test_malformed_body_is_json_invalid():
+    response = _client().post(
+        "/points", content=b"{bad", headers={"content-type": "application/json"}
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["type"] == "json_invalid"
@@ -0,0 +1,122 @@
+"""Test semantic processor classification and pattern matching."""
+
+from engines.semantic_processor.engine import (
+    CategoryPatternSet,
+    SemanticCategory,
+    SemanticProcessorEngine,
+)
+
+
+def test_classify_command():
+    engine = SemanticProcessorEngine()
+    result = engine.classify("run database migration and restart the application server")
+    assert result.category == SemanticCategory.COMMAND
+    assert result.is_narrative_free is True
+    assert any(r.startswith("command_pattern:") for r in result.matched_rules)
+
+
+def test_classify_metadata_counts_overlapping_patterns():
+    engine = SemanticProcessorEngine()
+    result = engine.classify("version: 2.5")
+    metadata_rules = [r for r in result.matched_rules if r.startswith("metadata_pattern:")]
+    # Both the key-value and the version pattern match the same span
+    assert len(metadata_rules) == 2
+
+
+def test_pattern_set_reports_shadowed_alternatives():
+    pattern_set = CategoryPatternSet(
+        category=SemanticCategory.METADATA,
+        label="metadata_pattern",
+        weight=0.25,
+        patterns=[r"\bkey\s*=\s*\S+", r"\bkey\b", r"\bmissing\b"],
+    )
+    assert pattern_set.matching_patterns("KEY=value") == [r"\bkey\s*=\s*\S+", r"\bkey\b"]
+    assert pattern_set.matching_patterns("nothing here") == []
+
+
+def test_classify_unknown_for_plain_text():
+    engine = SemanticProcessorEngine()
+    result = engine.classify("hello world")
+    assert result.category == SemanticCategory.UNKNOWN
+    assert result.confidence == 0.0
+
+
+def test_canonicalize_applies_all_rules():
+    engine = SemanticProcessorEngine()
+    raw = "  This   has\textra—space “quotes” wait..... what?!?  "
+    assert engine.canonicalize(raw) == "This has extra-space 'quotes' wait... what?"
+
+
+def test_canonicalize_removes_control_chars_and_collapses_whitespace():
+    engine = SemanticProcessorEngine()
+    assert engine.canonicalize("a\x0bb\x01c \x00 d") == "a bc  d"
+
+
+def test_canonicalize_honors_custom_and_edited_rules():
+    from engines.semantic_processor.engine import CanonicalizationRule
+
+    engine = SemanticProcessorEngine()
+    engine.canonicalization_rules.append(
+        CanonicalizationRule(name="mask_digits", pattern=r"\d", replacement="#")
+    )
+    assert engine.canonicalize("  build  42 — ok!!  ") == "build ## - ok!"
+
+    engine.canonicalization_rules[-1].replacement = "0"
+    assert engine.canonicalize("build 42") == "build 00"
+
+    engine.canonicalization_rules.pop()
+    assert engine.canonicalize("build 42") == "build 42"
+    assert SemanticProcessorEngine().canonicalize("build 42") == "build 42"
+
+
+def test_canonicalize_cache_is_per_engine_and_rule_set():
+    from engines.semantic_processor.engine import CanonicalizationRule
+
+    engine = SemanticProcessorEngine()
+    other = SemanticProcessorEngine()
+    engine.canonicalize("a  b")
+    engine.canonicalize("a  b")
+    assert engine._canonicalizer[1].cache_info().hits == 1
+    assert other._canonicalizer[1].cache_info().currsize == 0
+
+    engine.canonicalization_rules.append(
+        CanonicalizationRule(name="upper_b", pattern="b", replacement="B")
+    )
+    assert engine.canonicalize("a  b") == "a B"
+    assert engine._canonicalizer[1].cache_info().currsize == 1
+
+
+def test_classify_narrative_skips_categories_that_cannot_win():
+    engine = SemanticProcessorEngine()
+    result = engine.classify("honestly just run the deploy and restart it")
+    assert result.category == SemanticCategory.NARRATIVE
+    assert result.confidence == 0.8
+    assert result.is_narrative_free is False
+    # COMMAND tops out at 0.6 < 0.8, so its patterns are never scanned
+    assert not any(r.startswith("command_pattern:") for r in result.matched_rules)
+
+
+def test_classify_narrative_still_loses_to_stronger_factual_signal():
+    engine = SemanticProcessorEngine()
+    result = engine.classify("honestly the total was 12ms and it passed")
+    assert result.category == SemanticCategory.FACTUAL
+    assert result.confidence > 0.8
+
+
+def test_process_batch_preserves_order_and_counts():
+    engine = SemanticProcessorEngine()
+    texts = ["deploy the service", "honestly it broke", "hello world"] * 20
+    results = engine.process_batch(texts)
+    assert [r.text for r in results] == texts
+    stats = engine.get_processor_stats()
+    assert stats["total_processed"] == 60
+    assert stats["narrative_violations"] == 20
+    assert stats["classification_counts"]["command"] == 20
+
+
+def test_word_boundaries_follow_unicode_letters_with_any_backend():
+    engine = SemanticProcessorEngine()
+    # Non-ASCII letters are word characters, so neither phrase is a whole-word match
+    assert engine.check_narrative_free("ééit seems") == (True, [])
+    assert engine.check_narrative_free("I thinkＩＴ") == (True, [])
+    assert engine.check_narrative_free("it seems fine")[0] is False
@@ -0,0 +1,26 @@
+"""Test shared identifier, timestamp and canonical JSON helpers."""
+
+import datetime
+import json
+
+from shared.utils import canonical_json, from_ns, has_non_finite, new_id
+
+
+def test_new_id_and_from_ns():
+    assert len(new_id()) == 32 and new_id() != new_id()
+    when = from_ns(1_700_000_000_123_456_789)
+    assert when.tzinfo is datetime.timezone.utc
+    assert when.microsecond == 123_456
+
+
+def test_canonical_json_sorts_keys_and_falls_back_to_stdlib():
+    assert canonical_json({"b": 1, "a": [1.5, None]}) == b'{"a":[1.5,null],"b":1}'
+    assert canonical_json({"big": 2**70}) == json.dumps({"big": 2**70}).encode("utf-8")
+    assert canonical_json({"d": datetime.date(2020, 1, 1)}, default=str) == b'{"d":"2020-01-01"}'
+
+
+def test_canonical_json_keeps_non_finite_floats_distinct_from_null():
+    assert has_non_finite({"v": [1.0, {"w": float("-inf")}]})
+    assert not has_non_finite({"v": [1.0, None]})
+    encoded = {canonical_json({"v": v}) for v in (None, float("nan"), float("inf"))}
+    assert len(encoded) == 3
@@ -8,17 +8,26 @@ for severity-based analysis.
 from __future__ import annotations
 
 import enum
+import logging
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
-from pydantic import BaseModel, Field
 
 from domain.value_objects.severity import Severity
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 logger = structlog.get_logger(__name__)
+# Hot-path debug events are only built when the stdlib logger for this module
+# is at DEBUG; ``isEnabledFor`` is cached by ``logging``, so the check is cheap.
+_stdlib_logger = logging.getLogger(__name__)
+
+# Severities whose open findings block a gate, resolved once at import
+_BLOCKING_SEVERITIES: frozenset[Severity] = frozenset(s for s in Severity if s.is_blocking)
 
 
 class ScanStatus(str, enum.Enum):
@@ -36,7 +45,7 @@ class Finding:
     """A single issue discovered during a governance scan.
 
     Attributes:
-        finding_id: Unique identifier for this finding.
+        finding_id: Unique identifier for this finding (UUID-4 hex string).
         module_id: Module in which the issue was detected.
         rule_id: The governance rule that was violated.
         severity: Severity classification.
@@ -49,7 +58,7 @@ class Finding:
         metadata: Arbitrary extension data.
     """
 
-    finding_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    finding_id: str = field(default_factory=lambda: uuid.uuid4().hex)
     module_id: str = ""
     rule_id: str = ""
     severity: Severity = Severity.INFO
@@ -64,11 +73,12 @@ class Finding:
     def mark_fixed(self) -> None:
         """Flag this finding as remediated."""
         self.fixed = True
-        logger.debug(
-            "finding_fixed",
-            finding_id=self.finding_id,
-            rule_id=self.rule_id,
-        )
+        if _stdlib_logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "finding_fixed",
+                finding_id=self.finding_id,
+                rule_id=self.rule_id,
+            )
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to a plain dictionary."""
@@ -87,11 +97,15 @@ class Finding:
         }
 
 
-class ScanReport(BaseModel):
+@dataclass(slots=True)
+class ScanReport:
     """Domain entity representing the output of a governance scan.
 
+    Reports are only ever built by trusted scanner code, so this is a plain
+    slotted dataclass (like :class:`Finding`) rather than a validated model.
+
     Attributes:
-        report_id: Unique identifier (UUID-4 string).
+        report_id: Unique identifier (UUID-4 hex string).
         cycle_id: Governance cycle that initiated this scan.
         scanner_type: Identifier of the scanner engine used.
         started_at: UTC timestamp when the scan began.
@@ -103,19 +117,17 @@ class ScanReport(BaseModel):
         status: Current lifecycle status.
     """
 
-    report_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    report_id: str = field(default_factory=lambda: uuid.uuid4().hex)
     cycle_id: str = ""
     scanner_type: str = ""
-    started_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     completed_at: datetime | None = None
     modules_scanned: int = 0
     issues_found: int = 0
     issues_fixed: int = 0
-    findings: list[Finding] = Field(default_factory=list)
+    findings: list[Finding] = field(default_factory=list)
     status: ScanStatus = ScanStatus.PENDING
 
-    model_config = {"frozen": False, "populate_by_name": True, "arbitrary_types_allowed": True}
-
     # -- mutators -----------------------------------------------------------
 
     def add_finding(self, finding: Finding) -> None:
@@ -125,15 +137,29 @@ class ScanReport(BaseModel):
             finding: The Finding to add.
         """
         self.findings.append(finding)
-        self.issues_found = len(self.findings)
-        self.issues_fixed = sum(1 for f in self.findings if f.fixed)
-        logger.debug(
-            "finding_added",
-            report_id=self.report_id,
-            finding_id=finding.finding_id,
-            severity=finding.severity.value,
-            total_findings=self.issues_found,
-        )
+        self.issues_found += 1
+        if finding.fixed:
+            self.issues_fixed += 1
+        if _stdlib_logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "finding_added",
+                report_id=self.report_id,
+                finding_id=finding.finding_id,
+                severity=finding.severity.value,
+                total_findings=self.issues_found,
+            )
+
+    def extend_findings(self, findings: Iterable[Finding]) -> None:
+        """Append many findings at once and update counters in a single pass.
+
+        Args:
+            findings: The Findings to add, in order.
+        """
+        start = len(self.findings)
+        self.findings.extend(findings)
+        added = self.findings[start:]
+        self.issues_found += len(added)
+        self.issues_fixed += sum(1 for f in added if f.fixed)
 
     def mark_running(self) -> None:
         """Transition the report to RUNNING status."""
@@ -163,13 +189,25 @@ class ScanReport(BaseModel):
 
     # -- queries ------------------------------------------------------------
 
-    def severity_counts(self) -> dict[Severity, int]:
-        """Return a mapping of severity -> count of open (unfixed) findings."""
-        counts: dict[Severity, int] = {sev: 0 for sev in Severity}
+    def _aggregate(self) -> tuple[dict[Severity, int], bool]:
+        """Count open findings per severity in a single pass over ``findings``.
+
+        ``findings`` is a public list that callers may edit in place, so the
+        counts behind gate decisions are always taken from it directly.
+
+        Returns:
+            The per-severity open counts and whether any of them is blocking.
+        """
+        counts: dict[Severity, int] = dict.fromkeys(Severity, 0)
         for finding in self.findings:
             if not finding.fixed:
-                counts[finding.severity] = counts.get(finding.severity, 0) + 1
-        return counts
+                counts[finding.severity] += 1
+        has_blockers = any(counts[sev] for sev in _BLOCKING_SEVERITIES)
+        return counts, has_blockers
+
+    def severity_counts(self) -> dict[Severity, int]:
+        """Return a mapping of severity -> count of open (unfixed) findings."""
+        return self._aggregate()[0]
 
     def findings_by_severity(self, severity: Severity) -> list[Finding]:
         """Return all findings matching *severity* (including fixed ones)."""
@@ -185,14 +223,11 @@ class ScanReport(BaseModel):
 
     def has_blocking_findings(self) -> bool:
         """Return True if any unfixed finding is CRITICAL or HIGH."""
-        return any(
-            f.severity.is_blocking and not f.fixed
-            for f in self.findings
-        )
+        return any(f.severity in _BLOCKING_SEVERITIES and not f.fixed for f in self.findings)
 
     def summary(self) -> dict[str, Any]:
         """Return a concise dictionary summary for dashboards and logging."""
-        sev_counts = self.severity_counts()
+        sev_counts, has_blockers = self._aggregate()
         duration_seconds: float | None = None
         if self.completed_at and self.started_at:
             duration_seconds = (self.completed_at - self.started_at).total_seconds()
@@ -207,7 +242,7 @@ class ScanReport(BaseModel):
             "issues_fixed": self.issues_fixed,
             "open_issues": self.issues_found - self.issues_fixed,
             "severity_counts": {s.value: c for s, c in sev_counts.items()},
-            "has_blockers": self.has_blocking_findings(),
+            "has_blockers": has_blockers,
             "duration_seconds": duration_seconds,
         }
 
@@ -217,8 +252,7 @@ class ScanReport(BaseModel):
         Useful when aggregating results from multiple scanner engines into a
         single consolidated report.
         """
-        for finding in other.findings:
-            self.add_finding(finding)
+        self.extend_findings(other.findings)
         self.modules_scanned += other.modules_scanned
         logger.info(
             "scan_reports_merged",
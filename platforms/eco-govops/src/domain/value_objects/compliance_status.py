@@ -7,23 +7,21 @@ quantitative compliance assessment with grade mapping.
 from __future__ import annotations
 
 import enum
+import logging
 from dataclasses import dataclass, field
 from typing import Any
 
 import structlog
 
 logger = structlog.get_logger(__name__)
+# Level gate for the per-construction debug event in ComplianceScore.
+_stdlib_logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
-# Grade boundaries — maps a numeric 0-100 score to a letter grade A-F.
+# Grade table — letter grade indexed by score decile (90+ A, 80+ B, 70+ C,
+# 60+ D, below 60 F).
 # ---------------------------------------------------------------------------
-_GRADE_BOUNDARIES: list[tuple[float, str]] = [
-    (90.0, "A"),
-    (80.0, "B"),
-    (70.0, "C"),
-    (60.0, "D"),
-    (0.0, "F"),
-]
+_GRADE_TABLE = "FFFFFFDCBA"
 
 
 class ComplianceStatus(str, enum.Enum):
@@ -79,10 +77,11 @@ class ComplianceStatus(str, enum.Enum):
 
 def _score_to_grade(score: float) -> str:
     """Map a 0-100 score to a letter grade A-F."""
-    for threshold, grade in _GRADE_BOUNDARIES:
-        if score >= threshold:
-            return grade
-    return "F"
+    if score >= 100.0:
+        return "A"
+    if not score >= 0.0:  # negative or NaN
+        return "F"
+    return _GRADE_TABLE[int(score) // 10]
 
 
 @dataclass(frozen=True, slots=True)
@@ -93,11 +92,17 @@ class ComplianceScore:
         score: Numeric value in the range [0.0, 100.0].
         grade: Letter grade automatically derived from *score* when not given.
         details: Arbitrary breakdown (e.g. per-rule scores, timestamps).
+        status: Categorical ComplianceStatus derived from *score*.
+        is_passing: Whether *status* is considered passing.
     """
 
     score: float
     grade: str = ""
     details: dict[str, Any] = field(default_factory=dict)
+    status: ComplianceStatus = field(
+        default=ComplianceStatus.UNKNOWN, init=False, repr=False, compare=False
+    )
+    is_passing: bool = field(default=False, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         # Validate bounds
@@ -108,24 +113,19 @@ class ComplianceScore:
         # Auto-derive grade when not explicitly provided
         if not self.grade:
             object.__setattr__(self, "grade", _score_to_grade(self.score))
-        logger.debug(
-            "compliance_score_created",
-            score=self.score,
-            grade=self.grade,
-        )
+        # Derived once here; the score is immutable, so these never go stale
+        status = ComplianceStatus.from_score(self.score)
+        object.__setattr__(self, "status", status)
+        object.__setattr__(self, "is_passing", status.is_passing)
+        if _stdlib_logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "compliance_score_created",
+                score=self.score,
+                grade=self.grade,
+            )
 
     # -- derived helpers ----------------------------------------------------
 
-    @property
-    def status(self) -> ComplianceStatus:
-        """Derive the categorical ComplianceStatus from the numeric score."""
-        return ComplianceStatus.from_score(self.score)
-
-    @property
-    def is_passing(self) -> bool:
-        """Shortcut: does this score translate to a passing status?"""
-        return self.status.is_passing
-
     def meets_threshold(self, minimum: float) -> bool:
         """Return True if the score meets or exceeds *minimum*."""
         if not (0.0 <= minimum <= 100.0):
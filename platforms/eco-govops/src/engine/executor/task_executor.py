@@ -1,7 +1,8 @@
 """Task execution engine for the Governance Operations Platform.
 
 Provides priority-ordered, concurrent async task execution with retry logic,
-timeout support, and configurable parallelism via ``asyncio.Semaphore``.
+timeout support, and configurable parallelism via a bounded pool of worker
+coroutines.
 
 @GL-governed
 @GL-layer: GL30-49
@@ -10,9 +11,10 @@ timeout support, and configurable parallelism via ``asyncio.Semaphore``.
 from __future__ import annotations
 
 import asyncio
+import heapq
 import uuid
 from datetime import datetime, timezone
-from enum import StrEnum
+from enum import IntEnum, StrEnum
 from dataclasses import dataclass, field
 from typing import Any, Awaitable, Callable
 
@@ -21,6 +23,13 @@ from pydantic import BaseModel, Field
 
 logger = structlog.get_logger(__name__)
 
+_UTC = timezone.utc
+
+
+def _utcnow() -> datetime:
+    """Return the current UTC time (default factory for result timestamps)."""
+    return datetime.now(_UTC)
+
 
 # ---------------------------------------------------------------------------
 # Enums & data models
@@ -38,22 +47,32 @@ class TaskStatus(StrEnum):
     TIMED_OUT = "timed_out"
 
 
-class TaskPriority(StrEnum):
+class TaskPriority(IntEnum):
     """Priority levels that determine queue ordering.
 
-    Lower numeric weight means higher execution priority.
+    The value is the sort weight: lower means higher execution priority, so
+    members order directly in the task heap.  ``str()`` gives the lowercase
+    name, and lookups by that name (``TaskPriority("high")``) still work.
     """
 
-    CRITICAL = "critical"
-    HIGH = "high"
-    NORMAL = "normal"
-    LOW = "low"
+    CRITICAL = 0
+    HIGH = 1
+    NORMAL = 2
+    LOW = 3
+
+    def __str__(self) -> str:
+        return self.name.lower()
+
+    @classmethod
+    def _missing_(cls, value: object) -> TaskPriority | None:
+        if isinstance(value, str):
+            return cls.__members__.get(value.upper())
+        return None
 
     @property
     def weight(self) -> int:
         """Numeric weight for sorting (lower = higher priority)."""
-        _weights = {"critical": 0, "high": 1, "normal": 2, "low": 3}
-        return _weights[self.value]
+        return self._value_
 
 
 class ExecutorConfig(BaseModel):
@@ -72,7 +91,12 @@ class ExecutorConfig(BaseModel):
     retry_backoff_seconds: float = Field(default=1.0, ge=0)
 
 
-@dataclass
+# Shared default configuration — built once from the field defaults without
+# re-running validation for every ``TaskExecutor()``
+DEFAULT_CONFIG = ExecutorConfig.model_construct()
+
+
+@dataclass(slots=True)
 class TaskResult:
     """Outcome of executing a single task.
 
@@ -92,17 +116,7 @@ class TaskResult:
     duration_seconds: float = 0.0
     error: str = ""
     attempts: int = 0
-    completed_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-
-
-@dataclass(order=True)
-class _QueueEntry:
-    """Internal priority-queue wrapper so that ``asyncio.PriorityQueue``
-    can order tasks by priority weight, then by submission order."""
-
-    priority_weight: int
-    sequence: int
-    task: _TaskSpec = field(compare=False)
+    completed_at: datetime = field(default_factory=_utcnow)
 
 
 @dataclass
@@ -139,13 +153,18 @@ class TaskExecutor:
     """
 
     def __init__(self, config: ExecutorConfig | None = None) -> None:
-        self._config = config or ExecutorConfig()
-        self._semaphore = asyncio.Semaphore(self._config.max_concurrency)
-        self._queue: asyncio.PriorityQueue[_QueueEntry] = asyncio.PriorityQueue()
+        self._config = config or DEFAULT_CONFIG
+        # Heap of (priority, submission sequence, spec); the unique
+        # sequence breaks ties so specs themselves are never compared.
+        # Specs taken out by ``run_one`` stay in the heap and are skipped
+        # when popped — ``_pending`` is the source of truth for queued tasks.
+        self._heap: list[tuple[TaskPriority, int, _TaskSpec]] = []
+        self._pending: dict[str, _TaskSpec] = {}
         self._sequence: int = 0
         self._results: dict[str, TaskResult] = {}
-        self._running: dict[str, asyncio.Task[TaskResult]] = {}
+        self._running: dict[str, asyncio.Task[None]] = {}
         self._cancelled: bool = False
+        self._draining: bool = False
         logger.info(
             "task_executor_init",
             max_concurrency=self._config.max_concurrency,
@@ -179,7 +198,7 @@ class TaskExecutor:
         Returns:
             The unique ``task_id`` assigned to the submitted task.
         """
-        task_id = str(uuid.uuid4())
+        task_id = uuid.uuid4().hex
         spec = _TaskSpec(
             task_id=task_id,
             name=name,
@@ -191,17 +210,13 @@ class TaskExecutor:
             max_retries=max_retries if max_retries is not None else self._config.max_retries,
         )
         self._sequence += 1
-        entry = _QueueEntry(
-            priority_weight=priority.weight,
-            sequence=self._sequence,
-            task=spec,
-        )
-        await self._queue.put(entry)
+        heapq.heappush(self._heap, (priority, self._sequence, spec))
+        self._pending[task_id] = spec
         logger.info(
             "task_submitted",
             task_id=task_id,
             name=name,
-            priority=priority.value,
+            priority=str(priority),
         )
         return task_id
 
@@ -213,17 +228,16 @@ class TaskExecutor:
         Returns a list of :class:`TaskResult` in completion order.
         """
         self._cancelled = False
-        tasks: list[asyncio.Task[TaskResult]] = []
-
-        while not self._queue.empty():
-            entry = await self._queue.get()
-            coro = self._execute_with_semaphore(entry.task)
-            t = asyncio.create_task(coro, name=f"task-{entry.task.name}")
-            self._running[entry.task.task_id] = t
-            tasks.append(t)
+        results: list[TaskResult] = []
+        workers = min(self._config.max_concurrency, len(self._pending))
 
-        results = await asyncio.gather(*tasks, return_exceptions=False)
-        self._running.clear()
+        self._draining = True
+        try:
+            async with asyncio.TaskGroup() as tg:
+                for index in range(workers):
+                    tg.create_task(self._worker(results), name=f"executor-worker-{index}")
+        finally:
+            self._draining = False
 
         logger.info(
             "executor_run_complete",
@@ -231,36 +245,29 @@ class TaskExecutor:
             succeeded=sum(1 for r in results if r.status == TaskStatus.COMPLETED),
             failed=sum(1 for r in results if r.status == TaskStatus.FAILED),
         )
-        return list(results)
+        return results
 
     async def run_one(self, task_id: str) -> TaskResult | None:
         """Execute a single task by ID (if still in the queue).
 
         Returns the result or ``None`` if the task was not found.
         """
-        pending: list[_QueueEntry] = []
-        target: _TaskSpec | None = None
-
-        while not self._queue.empty():
-            entry = await self._queue.get()
-            if entry.task.task_id == task_id:
-                target = entry.task
-            else:
-                pending.append(entry)
-
-        for entry in pending:
-            await self._queue.put(entry)
-
+        target = self._pending.pop(task_id, None)
         if target is None:
             return None
+        if not self._pending:
+            self._heap.clear()
 
-        return await self._execute_with_semaphore(target)
+        return await self._execute_with_retries(target)
 
     # -- cancellation -------------------------------------------------------
 
     async def cancel_all(self) -> int:
         """Cancel all running tasks.
 
+        Tasks still queued behind a ``run_all`` are cancelled as well; the
+        workers drain them as ``CANCELLED`` results.
+
         Returns the number of tasks that were cancelled.
         """
         self._cancelled = True
@@ -270,19 +277,40 @@ class TaskExecutor:
                 task.cancel()
                 cancelled_count += 1
                 logger.warning("task_cancelled", task_id=task_id)
+        if self._draining:
+            for task_id in self._pending:
+                cancelled_count += 1
+                logger.warning("task_cancelled", task_id=task_id)
         return cancelled_count
 
     # -- internal -----------------------------------------------------------
 
-    async def _execute_with_semaphore(self, spec: _TaskSpec) -> TaskResult:
-        """Acquire the semaphore, then execute with retries."""
-        async with self._semaphore:
-            return await self._execute_with_retries(spec)
+    async def _worker(self, results: list[TaskResult]) -> None:
+        """Pop queued tasks in priority order and execute them until the heap is empty.
+
+        ``run_all`` starts at most ``max_concurrency`` workers, which bounds the
+        number of tasks in flight without allocating an ``asyncio.Task`` per
+        queued entry.
+        """
+        heap = self._heap
+        pending = self._pending
+        current = asyncio.current_task()
+        while heap:
+            _, _, spec = heapq.heappop(heap)
+            if pending.pop(spec.task_id, None) is None:
+                continue
+            if current is not None:
+                self._running[spec.task_id] = current
+            try:
+                results.append(await self._execute_with_retries(spec))
+            finally:
+                self._running.pop(spec.task_id, None)
 
     async def _execute_with_retries(self, spec: _TaskSpec) -> TaskResult:
         """Execute a task, retrying on failure up to ``spec.max_retries``."""
         last_error = ""
         attempts = 0
+        now = asyncio.get_running_loop().time
 
         for attempt in range(1, spec.max_retries + 2):  # +2: 1 initial + retries
             if self._cancelled:
@@ -296,20 +324,20 @@ class TaskExecutor:
                 return result
 
             attempts = attempt
-            start = asyncio.get_event_loop().time()
+            start = now()
 
             try:
                 output = await asyncio.wait_for(
                     spec.fn(*spec.args, **spec.kwargs),
                     timeout=spec.timeout_seconds,
                 )
-                duration = asyncio.get_event_loop().time() - start
+                duration = now() - start
 
                 result = TaskResult(
                     task_id=spec.task_id,
                     status=TaskStatus.COMPLETED,
                     output=output,
-                    duration_seconds=round(duration, 4),
+                    duration_seconds=duration,
                     attempts=attempts,
                 )
                 self._results[spec.task_id] = result
@@ -318,13 +346,13 @@ class TaskExecutor:
                     "task_completed",
                     task_id=spec.task_id,
                     name=spec.name,
-                    duration=result.duration_seconds,
+                    duration=round(duration, 4),
                     attempts=attempts,
                 )
                 return result
 
             except asyncio.TimeoutError:
-                duration = asyncio.get_event_loop().time() - start
+                duration = now() - start
                 last_error = f"Task timed out after {spec.timeout_seconds}s"
                 logger.warning(
                     "task_timeout",
@@ -342,10 +370,17 @@ class TaskExecutor:
                     attempts=attempts,
                 )
                 self._results[spec.task_id] = result
+                # Only a cancel_all() is absorbed into the result; any other
+                # cancellation (e.g. a caller timing out run_all) must reach
+                # the worker so it stops draining the queue.
+                current = asyncio.current_task()
+                if not self._cancelled or current is None:
+                    raise
+                current.uncancel()
                 return result
 
             except Exception as exc:
-                duration = asyncio.get_event_loop().time() - start
+                duration = now() - start
                 last_error = f"{type(exc).__name__}: {exc}"
                 logger.warning(
                     "task_attempt_failed",
@@ -384,12 +419,12 @@ class TaskExecutor:
     @property
     def pending_count(self) -> int:
         """Number of tasks still waiting in the queue."""
-        return self._queue.qsize()
+        return len(self._pending)
 
     @property
     def running_count(self) -> int:
         """Number of tasks currently executing."""
-        return sum(1 for t in self._running.values() if not t.done())
+        return len(self._running)
 
     def get_result(self, task_id: str) -> TaskResult | None:
         """Retrieve the result for a previously executed task."""
@@ -16,10 +16,13 @@ from __future__ import annotations
 
 import asyncio
 import hashlib
-import json
+import time
 import uuid
-from datetime import datetime, timezone
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
 from enum import StrEnum
+from functools import reduce
+from operator import or_
 from typing import Any
 
 import structlog
@@ -27,6 +30,12 @@ from pydantic import BaseModel, Field
 
 logger = structlog.get_logger(__name__)
 
+# Field and record separators for binary evidence records (ASCII unit and
+# record separators).  Only the leading cycle ID may contain them; the state
+# values and ISO timestamp never do, so the chained records split unambiguously.
+_EVIDENCE_SEP = b"\x1f"
+_EVIDENCE_END = b"\x1e"
+
 
 # ---------------------------------------------------------------------------
 # Enums
@@ -72,6 +81,19 @@ _TRANSITIONS: dict[WorkflowState, frozenset[WorkflowState]] = {
     WorkflowState.CANCELLED: frozenset(),
 }
 
+# _TRANSITIONS compiled to one bit per state: each state's successors become
+# an int mask, so validating a transition is a single AND.  _TRANSITIONS
+# itself is kept for error messages.
+_STATE_BIT: dict[WorkflowState, int] = {s: 1 << i for i, s in enumerate(WorkflowState)}
+_ALLOWED_MASK: dict[WorkflowState, int] = {
+    s: reduce(or_, (_STATE_BIT[t] for t in targets), 0) for s, targets in _TRANSITIONS.items()
+}
+
+# State values for logging and their encoded form for evidence records,
+# resolved once instead of through the enum on every transition.
+_STATE_VALUE: dict[WorkflowState, str] = {s: s.value for s in WorkflowState}
+_STATE_EVIDENCE: dict[WorkflowState, bytes] = {s: v.encode() for s, v in _STATE_VALUE.items()}
+
 
 class CyclePhase(StrEnum):
     """Individual phases within the analysis workflow."""
@@ -100,6 +122,12 @@ class WorkflowConfig(BaseModel):
         severity_threshold: Minimum severity for enforcement (info|warning|error|critical).
         max_duration_seconds: Hard timeout for the entire cycle.
         tags: Free-form key-value metadata.
+        remediation_concurrency: Maximum number of remediation fixes applied
+            concurrently.
+        record_evidence: Hash every state transition into the evidence chain.
+            Disabling it skips all hashing and leaves ``evidence_chain_hash``
+            empty, so the cycle has no integrity record — intended only for
+            development and test runs.
     """
 
     name: str = Field(..., min_length=1, max_length=200)
@@ -110,6 +138,8 @@ class WorkflowConfig(BaseModel):
     severity_threshold: str = Field(default="warning")
     max_duration_seconds: int = Field(default=3600, ge=60, le=86400)
     tags: dict[str, str] = Field(default_factory=dict)
+    remediation_concurrency: int = Field(default=8, ge=1, le=64)
+    record_evidence: bool = True
 
 
 class PhaseResult(BaseModel):
@@ -134,6 +164,45 @@ class PhaseResult(BaseModel):
     error: str = ""
 
 
+@dataclass(slots=True)
+class _PhaseRecord:
+    """Internal record of one phase, kept while the workflow runs.
+
+    Every field is produced by the workflow itself, so phases are recorded
+    as plain slotted dataclasses and only turned into :class:`PhaseResult`
+    models when exposed.  A record is opened with the transition into its
+    phase and filled in by :meth:`finish` when the phase ends.
+    """
+
+    phase: CyclePhase
+    started_at: datetime
+    status: str = "running"
+    completed_at: datetime | None = None
+    duration_seconds: float = 0.0
+    output: dict[str, Any] = field(default_factory=dict)
+    error: str = ""
+
+    def finish(self, duration: float, status: str, output: dict[str, Any], error: str) -> None:
+        """Close the record with the phase outcome and monotonic *duration*."""
+        self.status = status
+        self.completed_at = self.started_at + timedelta(seconds=duration)
+        self.duration_seconds = duration
+        self.output = output
+        self.error = error
+
+    def to_result(self) -> PhaseResult:
+        """Return the public PhaseResult model for this record."""
+        return PhaseResult.model_construct(
+            phase=self.phase,
+            status=self.status,
+            started_at=self.started_at,
+            completed_at=self.completed_at,
+            duration_seconds=self.duration_seconds,
+            output=self.output,
+            error=self.error,
+        )
+
+
 class WorkflowResult(BaseModel):
     """Aggregated outcome of a completed analysis workflow.
 
@@ -174,7 +243,7 @@ class WorkflowResult(BaseModel):
         return {
             "cycle_id": self.cycle_id,
             "name": self.config.name,
-            "state": self.state.value,
+            "state": _STATE_VALUE[self.state],
             "duration_seconds": self.duration_seconds,
             "modules_scanned": self.modules_scanned,
             "findings_count": self.findings_count,
@@ -219,17 +288,28 @@ class AnalysisWorkflow:
         cycle_id: str | None = None,
     ) -> None:
         self._cycle_id = cycle_id or f"CYCLE-{uuid.uuid4().hex[:12]}"
+        self._cycle_id_bytes = self._cycle_id.encode()
         self._config = config
         self._state = WorkflowState.PENDING
-        self._phases: list[PhaseResult] = []
+        self._phases: list[_PhaseRecord] = []
         self._started_at: datetime | None = None
         self._completed_at: datetime | None = None
+        self._duration_seconds = 0.0
+        # Rolling hash over every transition record.  A copy of its state is
+        # finalized after each transition, so every entry of _evidence_hashes
+        # commits to the whole chain so far and the last one is the chain hash.
+        self._chain_hasher = hashlib.sha256()
         self._evidence_hashes: list[str] = []
         self._scan_output: dict[str, Any] = {}
         self._analysis_output: dict[str, Any] = {}
         self._enforcement_output: dict[str, Any] = {}
         self._remediation_output: dict[str, Any] = {}
         self._report_output: dict[str, Any] = {}
+        # Subsystem capabilities, resolved once per run (None when absent)
+        self._scan_fn: Any = None
+        self._analyze_fn: Any = None
+        self._enforce_fn: Any = None
+        self._enforcer: Any = None
 
         logger.info(
             "workflow_created",
@@ -254,7 +334,7 @@ class AnalysisWorkflow:
 
     @property
     def phases(self) -> list[PhaseResult]:
-        return list(self._phases)
+        return [record.to_result() for record in self._phases]
 
     @property
     def is_terminal(self) -> bool:
@@ -267,36 +347,58 @@ class AnalysisWorkflow:
 
     # -- state transitions --------------------------------------------------
 
-    def _transition(self, target: WorkflowState) -> None:
-        """Validate and perform a state transition, recording evidence."""
-        allowed = _TRANSITIONS.get(self._state, frozenset())
-        if target not in allowed:
+    @staticmethod
+    def _now() -> datetime:
+        """Current UTC time — the single wall-clock source for the workflow."""
+        return datetime.now(timezone.utc)
+
+    def _transition(self, target: WorkflowState, now: datetime | None = None) -> datetime:
+        """Validate and perform a state transition, recording evidence.
+
+        Returns the timestamp recorded in the evidence so phase runners can
+        reuse it as their start time instead of reading the clock again.
+        """
+        if not _ALLOWED_MASK[self._state] & _STATE_BIT[target]:
+            allowed = _TRANSITIONS[self._state]
             raise InvalidTransitionError(
                 f"Cannot transition from {self._state.value} to {target.value}. "
                 f"Allowed: {', '.join(s.value for s in allowed) or 'none'}"
             )
         previous = self._state
         self._state = target
-        # Record evidence hash for the transition
-        evidence_payload = json.dumps(
-            {
-                "cycle_id": self._cycle_id,
-                "from": previous.value,
-                "to": target.value,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "parent_hash": self._evidence_hashes[-1] if self._evidence_hashes else "",
-            },
-            sort_keys=True,
-        )
-        self._evidence_hashes.append(
-            hashlib.sha256(evidence_payload.encode()).hexdigest()
-        )
+        if now is None:
+            now = self._now()
         logger.info(
             "workflow_state_transition",
             cycle_id=self._cycle_id,
-            from_state=previous.value,
-            to_state=target.value,
+            from_state=_STATE_VALUE[previous],
+            to_state=_STATE_VALUE[target],
         )
+        if not self._config.record_evidence:
+            return now
+        # Record evidence hash for the transition
+        evidence_record = _EVIDENCE_SEP.join(
+            (
+                self._cycle_id_bytes,
+                _STATE_EVIDENCE[previous],
+                _STATE_EVIDENCE[target],
+                now.isoformat().encode(),
+            )
+        )
+        chain = self._chain_hasher
+        chain.update(evidence_record + _EVIDENCE_END)
+        self._evidence_hashes.append(chain.copy().hexdigest())
+        return now
+
+    def _begin_phase(self, target: WorkflowState, phase: CyclePhase) -> _PhaseRecord:
+        """Transition into *target* and open the record for *phase*.
+
+        The record starts at the transition's evidence timestamp, so entering
+        a phase reads the wall clock once.
+        """
+        record = _PhaseRecord(phase=phase, started_at=self._transition(target))
+        self._phases.append(record)
+        return record
 
     # -- main execution -----------------------------------------------------
 
@@ -321,11 +423,16 @@ class AnalysisWorkflow:
         Returns:
             A :class:`WorkflowResult` summarising the entire cycle.
         """
-        self._started_at = datetime.now(timezone.utc)
+        self._started_at = self._now()
+        run_clock = time.perf_counter()
+        self._scan_fn = getattr(scanner, "scan_all", None)
+        self._analyze_fn = getattr(analyzer, "generate_report", None)
+        self._enforce_fn = getattr(enforcer, "enforce", None)
+        self._enforcer = enforcer
 
         try:
             await asyncio.wait_for(
-                self._run_phases(scanner=scanner, analyzer=analyzer, enforcer=enforcer),
+                self._run_phases(),
                 timeout=self._config.max_duration_seconds,
             )
             # Terminal
@@ -349,48 +456,43 @@ class AnalysisWorkflow:
                 error=str(exc),
             )
 
-        self._completed_at = datetime.now(timezone.utc)
+        self._duration_seconds = time.perf_counter() - run_clock
+        self._completed_at = self._started_at + timedelta(seconds=self._duration_seconds)
         return self._build_result()
 
-    async def _run_phases(
-        self,
-        *,
-        scanner: Any = None,
-        analyzer: Any = None,
-        enforcer: Any = None,
-    ) -> None:
+    async def _run_phases(self) -> None:
         """Execute all workflow phases in sequence."""
         # Phase 1: Scan
-        await self._run_scan_phase(scanner)
+        await self._run_scan_phase()
 
         # Phase 2: Analyse
-        await self._run_analysis_phase(analyzer)
+        await self._run_analysis_phase()
 
         # Phase 3: Enforce (optional)
         if self._config.auto_enforce:
-            await self._run_enforcement_phase(enforcer)
+            await self._run_enforcement_phase()
 
         # Phase 4: Remediate (optional)
         if self._config.auto_remediate and self._enforcement_output.get("violations", 0) > 0:
-            await self._run_remediation_phase(enforcer)
+            await self._run_remediation_phase()
 
         # Phase 5: Report
         await self._run_report_phase()
 
     # -- phase runners ------------------------------------------------------
 
-    async def _run_scan_phase(self, scanner: Any) -> None:
+    async def _run_scan_phase(self) -> None:
         """Phase 1: Scan modules for governance compliance."""
-        self._transition(WorkflowState.SCANNING)
-        phase_start = datetime.now(timezone.utc)
+        record = self._begin_phase(WorkflowState.SCANNING, CyclePhase.SCAN)
+        phase_clock = time.perf_counter()
 
         output: dict[str, Any] = {}
         error = ""
         status = "completed"
 
         try:
-            if scanner is not None and hasattr(scanner, "scan_all"):
-                report = await scanner.scan_all()
+            if self._scan_fn is not None:
+                report = await self._scan_fn()
                 output = {
                     "scan_id": report.scan_id,
                     "total_modules": report.total_modules,
@@ -424,31 +526,20 @@ class AnalysisWorkflow:
             raise
 
         finally:
-            phase_end = datetime.now(timezone.utc)
-            self._phases.append(
-                PhaseResult(
-                    phase=CyclePhase.SCAN,
-                    status=status,
-                    started_at=phase_start,
-                    completed_at=phase_end,
-                    duration_seconds=(phase_end - phase_start).total_seconds(),
-                    output=output,
-                    error=error,
-                )
-            )
+            record.finish(time.perf_counter() - phase_clock, status, output, error)
 
-    async def _run_analysis_phase(self, analyzer: Any) -> None:
+    async def _run_analysis_phase(self) -> None:
         """Phase 2: Analyse compliance distribution and risk hotspots."""
-        self._transition(WorkflowState.ANALYSING)
-        phase_start = datetime.now(timezone.utc)
+        record = self._begin_phase(WorkflowState.ANALYSING, CyclePhase.ANALYSE)
+        phase_clock = time.perf_counter()
 
         output: dict[str, Any] = {}
         error = ""
         status = "completed"
 
         try:
-            if analyzer is not None and hasattr(analyzer, "generate_report"):
-                report = await analyzer.generate_report()
+            if self._analyze_fn is not None:
+                report = await self._analyze_fn()
                 output = {
                     "total_modules": report.distribution.total_modules,
                     "compliance_rate": report.distribution.compliance_rate,
@@ -475,35 +566,24 @@ class AnalysisWorkflow:
             raise
 
         finally:
-            phase_end = datetime.now(timezone.utc)
-            self._phases.append(
-                PhaseResult(
-                    phase=CyclePhase.ANALYSE,
-                    status=status,
-                    started_at=phase_start,
-                    completed_at=phase_end,
-                    duration_seconds=(phase_end - phase_start).total_seconds(),
-                    output=output,
-                    error=error,
-                )
-            )
+            record.finish(time.perf_counter() - phase_clock, status, output, error)
 
-    async def _run_enforcement_phase(self, enforcer: Any) -> None:
+    async def _run_enforcement_phase(self) -> None:
         """Phase 3: Enforce governance policies against scan results."""
-        self._transition(WorkflowState.ENFORCING)
-        phase_start = datetime.now(timezone.utc)
+        record = self._begin_phase(WorkflowState.ENFORCING, CyclePhase.ENFORCE)
+        phase_clock = time.perf_counter()
 
         output: dict[str, Any] = {}
         error = ""
         status = "completed"
 
         try:
-            if enforcer is not None and hasattr(enforcer, "enforce"):
+            if self._enforce_fn is not None:
                 context = {
                     "summary": self._scan_output,
                     "analysis": self._analysis_output,
                 }
-                result = await enforcer.enforce(context, cycle_id=self._cycle_id)
+                result = await self._enforce_fn(context, cycle_id=self._cycle_id)
                 output = {
                     "enforcement_id": result.enforcement_id,
                     "total_rules": result.total_rules,
@@ -533,48 +613,31 @@ class AnalysisWorkflow:
             raise
 
         finally:
-            phase_end = datetime.now(timezone.utc)
-            self._phases.append(
-                PhaseResult(
-                    phase=CyclePhase.ENFORCE,
-                    status=status,
-                    started_at=phase_start,
-                    completed_at=phase_end,
-                    duration_seconds=(phase_end - phase_start).total_seconds(),
-                    output=output,
-                    error=error,
-                )
-            )
+            record.finish(time.perf_counter() - phase_clock, status, output, error)
 
-    async def _run_remediation_phase(self, enforcer: Any) -> None:
+    async def _run_remediation_phase(self) -> None:
         """Phase 4: Attempt automatic remediation of fixable violations."""
-        self._transition(WorkflowState.REMEDIATING)
-        phase_start = datetime.now(timezone.utc)
+        record = self._begin_phase(WorkflowState.REMEDIATING, CyclePhase.REMEDIATE)
+        phase_clock = time.perf_counter()
 
         output: dict[str, Any] = {}
         error = ""
         status = "completed"
 
         try:
-            remediations_attempted = 0
-            remediations_applied = 0
-            remediations_failed = 0
-
-            if enforcer is not None and hasattr(enforcer, "rules"):
-                for rule in enforcer.rules:
-                    if rule.auto_fix:
-                        remediations_attempted += 1
-                        try:
-                            if hasattr(rule, "apply_fix"):
-                                await rule.apply_fix()
-                            remediations_applied += 1
-                        except Exception as fix_exc:
-                            remediations_failed += 1
-                            logger.warning(
-                                "remediation_failed",
-                                cycle_id=self._cycle_id,
-                                error=str(fix_exc),
-                            )
+            rules = getattr(self._enforcer, "rules", None) or ()
+            fixes = [getattr(rule, "apply_fix", None) for rule in rules if rule.auto_fix]
+
+            # Fixes are independent and typically I/O-bound, so they run
+            # concurrently up to the configured limit.  Rules without an
+            # ``apply_fix`` hook count as applied.
+            semaphore = asyncio.Semaphore(self._config.remediation_concurrency)
+            outcomes = await asyncio.gather(
+                *(self._apply_fix(fix, semaphore) for fix in fixes if fix is not None)
+            )
+            remediations_attempted = len(fixes)
+            remediations_failed = len(outcomes) - sum(outcomes)
+            remediations_applied = remediations_attempted - remediations_failed
 
             output = {
                 "remediations_attempted": remediations_attempted,
@@ -590,23 +653,26 @@ class AnalysisWorkflow:
             raise
 
         finally:
-            phase_end = datetime.now(timezone.utc)
-            self._phases.append(
-                PhaseResult(
-                    phase=CyclePhase.REMEDIATE,
-                    status=status,
-                    started_at=phase_start,
-                    completed_at=phase_end,
-                    duration_seconds=(phase_end - phase_start).total_seconds(),
-                    output=output,
-                    error=error,
+            record.finish(time.perf_counter() - phase_clock, status, output, error)
+
+    async def _apply_fix(self, apply_fix: Any, semaphore: asyncio.Semaphore) -> bool:
+        """Run one remediation hook under *semaphore*; return whether it succeeded."""
+        async with semaphore:
+            try:
+                await apply_fix()
+            except Exception as fix_exc:
+                logger.warning(
+                    "remediation_failed",
+                    cycle_id=self._cycle_id,
+                    error=str(fix_exc),
                 )
-            )
+                return False
+        return True
 
     async def _run_report_phase(self) -> None:
         """Phase 5: Compile final governance report."""
-        self._transition(WorkflowState.REPORTING)
-        phase_start = datetime.now(timezone.utc)
+        record = self._begin_phase(WorkflowState.REPORTING, CyclePhase.REPORT)
+        phase_clock = time.perf_counter()
 
         output: dict[str, Any] = {}
         error = ""
@@ -639,7 +705,7 @@ class AnalysisWorkflow:
                     "applied": remediation.get("remediations_applied", 0),
                     "failed": remediation.get("remediations_failed", 0),
                 },
-                "generated_at": datetime.now(timezone.utc).isoformat(),
+                "generated_at": self._now().isoformat(),
             }
             self._report_output = output
 
@@ -650,18 +716,7 @@ class AnalysisWorkflow:
             raise
 
         finally:
-            phase_end = datetime.now(timezone.utc)
-            self._phases.append(
-                PhaseResult(
-                    phase=CyclePhase.REPORT,
-                    status=status,
-                    started_at=phase_start,
-                    completed_at=phase_end,
-                    duration_seconds=(phase_end - phase_start).total_seconds(),
-                    output=output,
-                    error=error,
-                )
-            )
+            record.finish(time.perf_counter() - phase_clock, status, output, error)
 
     # -- cancellation -------------------------------------------------------
 
@@ -671,7 +726,7 @@ class AnalysisWorkflow:
             logger.warning(
                 "workflow_cancel_ignored",
                 cycle_id=self._cycle_id,
-                state=self._state.value,
+                state=_STATE_VALUE[self._state],
             )
             return
         raise WorkflowCancelledError(f"Cycle {self._cycle_id} cancelled by user")
@@ -680,29 +735,22 @@ class AnalysisWorkflow:
 
     def _build_result(self) -> WorkflowResult:
         """Assemble the final WorkflowResult from accumulated phase data."""
-        duration = 0.0
-        if self._started_at and self._completed_at:
-            duration = (self._completed_at - self._started_at).total_seconds()
-
         scan = self._scan_output
         enforcement = self._enforcement_output
         remediation = self._remediation_output
         analysis = self._analysis_output
 
-        # Build final evidence chain hash from accumulated transition hashes
-        evidence_chain_hash = ""
-        if self._evidence_hashes:
-            chain_payload = json.dumps(self._evidence_hashes, sort_keys=True)
-            evidence_chain_hash = hashlib.sha256(chain_payload.encode()).hexdigest()
+        # The latest transition hash already covers the whole chain
+        evidence_chain_hash = self._evidence_hashes[-1] if self._evidence_hashes else ""
 
-        return WorkflowResult(
+        return WorkflowResult.model_construct(
             cycle_id=self._cycle_id,
             config=self._config,
             state=self._state,
-            phases=list(self._phases),
+            phases=[record.to_result() for record in self._phases],
             started_at=self._started_at,
             completed_at=self._completed_at,
-            duration_seconds=round(duration, 4),
+            duration_seconds=round(self._duration_seconds, 4),
             modules_scanned=scan.get("total_modules", 0),
             findings_count=(
                 scan.get("findings_count", 0)
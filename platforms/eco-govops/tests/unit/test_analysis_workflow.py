@@ -6,12 +6,14 @@ cancellation, and integration with scanner/analyzer/enforcer subsystems.
 from __future__ import annotations
 
 import asyncio
+import hashlib
 from dataclasses import dataclass
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from pydantic import ValidationError
 
 from engine.orchestrator.analysis_workflow import (
     AnalysisWorkflow,
@@ -22,6 +24,8 @@ from engine.orchestrator.analysis_workflow import (
     WorkflowConfig,
     WorkflowResult,
     WorkflowState,
+    _ALLOWED_MASK,
+    _STATE_BIT,
     _TRANSITIONS,
 )
 
@@ -218,6 +222,12 @@ class TestWorkflowState:
                 f"{from_state.value} → {to_state.value} should be valid"
             )
 
+    def test_allowed_mask_matches_transition_table(self) -> None:
+        for state in WorkflowState:
+            for target in WorkflowState:
+                allowed = bool(_ALLOWED_MASK[state] & _STATE_BIT[target])
+                assert allowed is (target in _TRANSITIONS[state])
+
     def test_every_non_terminal_state_can_fail(self) -> None:
         for state, targets in _TRANSITIONS.items():
             if state in (WorkflowState.COMPLETED, WorkflowState.FAILED, WorkflowState.CANCELLED):
@@ -330,6 +340,29 @@ class TestStateTransitions:
         wf._transition(WorkflowState.SCANNING)
         assert wf.state == WorkflowState.SCANNING
 
+    def test_transition_returns_evidence_timestamp(
+        self, basic_config: WorkflowConfig
+    ) -> None:
+        wf = AnalysisWorkflow(basic_config)
+        stamp = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        assert wf._transition(WorkflowState.SCANNING, now=stamp) is stamp
+        assert wf._transition(WorkflowState.ANALYSING).tzinfo is timezone.utc
+
+    def test_begin_phase_opens_record_at_transition(
+        self, basic_config: WorkflowConfig
+    ) -> None:
+        wf = AnalysisWorkflow(basic_config)
+        record = wf._begin_phase(WorkflowState.SCANNING, CyclePhase.SCAN)
+        assert wf.state == WorkflowState.SCANNING
+        assert wf._phases == [record]
+        assert record.status == "running"
+        assert record.completed_at is None
+
+        record.finish(1.5, "completed", {"findings": 0}, "")
+        [phase] = wf.phases
+        assert phase.completed_at - phase.started_at == timedelta(seconds=1.5)
+        assert phase.output == {"findings": 0}
+
     def test_invalid_transition_raises(self, basic_config: WorkflowConfig) -> None:
         wf = AnalysisWorkflow(basic_config)
         with pytest.raises(InvalidTransitionError, match="Cannot transition"):
@@ -407,6 +440,42 @@ class TestWorkflowRunBasic:
             assert phase.completed_at is not None
             assert phase.duration_seconds >= 0
 
+    @pytest.mark.asyncio
+    async def test_timestamps_agree_with_monotonic_durations(
+        self, basic_config: WorkflowConfig
+    ) -> None:
+        result = await AnalysisWorkflow(basic_config).run()
+
+        for phase in result.phases:
+            elapsed = (phase.completed_at - phase.started_at).total_seconds()
+            assert elapsed == pytest.approx(phase.duration_seconds, abs=1e-6)
+        elapsed = (result.completed_at - result.started_at).total_seconds()
+        assert elapsed == pytest.approx(result.duration_seconds, abs=1e-4)
+
+    @pytest.mark.asyncio
+    async def test_phases_property_exposes_phase_results(
+        self, basic_config: WorkflowConfig
+    ) -> None:
+        wf = AnalysisWorkflow(basic_config)
+        result = await wf.run()
+
+        assert all(isinstance(p, PhaseResult) for p in wf.phases)
+        assert wf.phases == result.phases
+
+    @pytest.mark.asyncio
+    async def test_basic_run_result_round_trips_through_validation(
+        self, basic_config: WorkflowConfig
+    ) -> None:
+        result = await AnalysisWorkflow(basic_config).run()
+
+        restored = WorkflowResult.model_validate(result.model_dump())
+        assert restored == result
+        assert [p.phase for p in restored.phases] == [
+            CyclePhase.SCAN,
+            CyclePhase.ANALYSE,
+            CyclePhase.REPORT,
+        ]
+
 
 # ===================================================================
 # Workflow execution — with mock subsystems
@@ -794,6 +863,37 @@ class TestEvidenceChain:
         # Basic run: PENDING→SCANNING→ANALYSING→REPORTING→COMPLETED = 4 transitions
         assert len(wf._evidence_hashes) == 4
 
+    def test_transition_hashes_chain_binary_records(self) -> None:
+        wf = AnalysisWorkflow(WorkflowConfig(name="binary"), cycle_id="CYCLE-1")
+        stamp = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        wf._transition(WorkflowState.SCANNING, now=stamp)
+        wf._transition(WorkflowState.ANALYSING, now=stamp)
+
+        ts = stamp.isoformat().encode()
+        chain = hashlib.sha256(b"CYCLE-1\x1fpending\x1fscanning\x1f" + ts + b"\x1e")
+        first = chain.hexdigest()
+        chain.update(b"CYCLE-1\x1fscanning\x1fanalysing\x1f" + ts + b"\x1e")
+        assert wf._evidence_hashes == [first, chain.hexdigest()]
+        assert wf._build_result().evidence_chain_hash == chain.hexdigest()
+
+    def test_chain_hash_is_stable_and_tracks_each_transition(self) -> None:
+        wf = AnalysisWorkflow(WorkflowConfig(name="rolling"))
+        assert wf._build_result().evidence_chain_hash == ""
+        wf._transition(WorkflowState.SCANNING)
+        first = wf._build_result().evidence_chain_hash
+        assert wf._build_result().evidence_chain_hash == first
+        wf._transition(WorkflowState.ANALYSING)
+        assert wf._build_result().evidence_chain_hash not in {"", first}
+
+    @pytest.mark.asyncio
+    async def test_evidence_recording_can_be_disabled(self) -> None:
+        wf = AnalysisWorkflow(WorkflowConfig(name="no-evidence", record_evidence=False))
+        result = await wf.run()
+
+        assert result.state == WorkflowState.COMPLETED
+        assert result.evidence_chain_hash == ""
+        assert wf._evidence_hashes == []
+
     @pytest.mark.asyncio
     async def test_failed_workflow_still_has_evidence(self) -> None:
         failing_scanner = AsyncMock()
@@ -947,3 +1047,51 @@ class TestRemediationTracking:
         assert remediate_phase.output["remediations_attempted"] == 1
         assert remediate_phase.output["remediations_applied"] == 1
         assert remediate_phase.output["remediations_failed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_fixes_run_concurrently_up_to_limit(self) -> None:
+        config = WorkflowConfig(
+            name="remed-bounded",
+            auto_enforce=True,
+            auto_remediate=True,
+            remediation_concurrency=2,
+        )
+        in_flight = 0
+        peak = 0
+
+        async def fix() -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+
+        rule = MagicMock()
+        rule.auto_fix = True
+        rule.apply_fix = fix
+
+        enforcer = AsyncMock()
+        enf_result = MagicMock()
+        enf_result.enforcement_id = "E-4"
+        enf_result.total_rules = 5
+        enf_result.passed_rules = []
+        enf_result.violations = [MagicMock()]
+        enf_result.skipped_rules = []
+        enf_result.gate_blocked = False
+        enf_result.enforcement_actions = []
+        enforcer.enforce = AsyncMock(return_value=enf_result)
+        enforcer.rules = [rule] * 5
+
+        wf = AnalysisWorkflow(config)
+        result = await wf.run(enforcer=enforcer)
+
+        remediate_phase = next(p for p in result.phases if p.phase == CyclePhase.REMEDIATE)
+        assert remediate_phase.output["remediations_applied"] == 5
+        assert peak == 2
+
+    def test_remediation_concurrency_bounds(self) -> None:
+        assert WorkflowConfig(name="x").remediation_concurrency == 8
+        with pytest.raises(ValidationError):
+            WorkflowConfig(name="x", remediation_concurrency=0)
+        with pytest.raises(ValidationError):
+            WorkflowConfig(name="x", remediation_concurrency=65)
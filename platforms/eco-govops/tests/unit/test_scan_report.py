@@ -1,5 +1,9 @@
 """Test scan report domain entity."""
 
+import logging
+import uuid
+from unittest.mock import MagicMock
+
 from domain.entities.scan_report import Finding, ScanReport, ScanStatus
 from domain.value_objects.severity import Severity
 
@@ -139,3 +143,109 @@ def test_scan_status_values():
     assert ScanStatus.COMPLETED.value == "completed"
     assert ScanStatus.FAILED.value == "failed"
     assert ScanStatus.CANCELLED.value == "cancelled"
+
+
+def test_scan_report_defaults_are_per_instance():
+    r1 = ScanReport(scanner_type="a")
+    r2 = ScanReport(scanner_type="b")
+    r1.add_finding(Finding(title="only-a"))
+    assert r2.findings == []
+    assert r1.report_id != r2.report_id
+    assert not hasattr(r1, "__dict__")
+
+
+def test_scan_report_extend_findings_updates_counters():
+    r = ScanReport(scanner_type="test")
+    fixed = Finding(severity=Severity.LOW, title="fixed")
+    fixed.mark_fixed()
+    r.add_finding(Finding(severity=Severity.HIGH, title="first"))
+    r.extend_findings(iter([fixed, Finding(severity=Severity.MEDIUM, title="open")]))
+    assert [f.title for f in r.findings] == ["first", "fixed", "open"]
+    assert r.issues_found == 3
+    assert r.issues_fixed == 1
+
+    other = ScanReport(scanner_type="other")
+    other.add_finding(fixed)
+    r.merge(other)
+    assert r.issues_found == 4
+    assert r.issues_fixed == 2
+
+
+def test_scan_report_summary_counts_open_findings_only():
+    r = ScanReport(scanner_type="test")
+    fixed = Finding(severity=Severity.CRITICAL, title="fixed-crit")
+    fixed.mark_fixed()
+    r.add_finding(fixed)
+    r.add_finding(Finding(severity=Severity.MEDIUM, title="open-medium"))
+    s = r.summary()
+    assert s["severity_counts"] == {
+        "critical": 0,
+        "high": 0,
+        "medium": 1,
+        "low": 0,
+        "info": 0,
+    }
+    assert s["has_blockers"] is False
+    assert s["has_blockers"] == r.has_blocking_findings()
+
+    r.add_finding(Finding(severity=Severity.HIGH, title="open-high"))
+    assert r.summary()["has_blockers"] is True
+
+
+def test_scan_report_ids_are_uuid_hex():
+    r = ScanReport(scanner_type="test")
+    f = Finding(title="t")
+    for value in (r.report_id, f.finding_id):
+        assert len(value) == 32
+        assert uuid.UUID(value).version == 4
+
+
+def test_add_finding_debug_event_follows_stdlib_level(monkeypatch, caplog):
+    from domain.entities import scan_report
+
+    recorder = MagicMock()
+    monkeypatch.setattr(scan_report, "logger", recorder)
+    r = ScanReport(scanner_type="test")
+
+    caplog.set_level(logging.INFO, logger=scan_report.__name__)
+    r.add_finding(Finding(title="quiet"))
+    recorder.debug.assert_not_called()
+
+    caplog.set_level(logging.DEBUG, logger=scan_report.__name__)
+    r.add_finding(Finding(title="loud"))
+    assert recorder.debug.call_args.args == ("finding_added",)
+
+
+def test_scan_report_queries_track_changes():
+    r = ScanReport(scanner_type="test")
+    auto = Finding(severity=Severity.HIGH, auto_fixable=True, title="auto")
+    manual = Finding(severity=Severity.HIGH, title="manual")
+    r.add_finding(auto)
+    r.add_finding(Finding(severity=Severity.LOW, title="low"))
+    assert [f.title for f in r.findings_by_severity(Severity.HIGH)] == ["auto"]
+    assert r.auto_fixable_findings() == [auto]
+
+    r.findings.append(manual)
+    auto.mark_fixed()
+    assert [f.title for f in r.findings_by_severity(Severity.HIGH)] == ["auto", "manual"]
+    assert [f.title for f in r.open_findings()] == ["low", "manual"]
+    assert r.auto_fixable_findings() == []
+
+    r.findings = [manual]
+    assert r.open_findings() == [manual]
+    assert r.findings_by_severity(Severity.LOW) == []
+
+
+def test_blocker_queries_see_in_place_edits():
+    r = ScanReport(scanner_type="test")
+    r.add_finding(Finding(severity=Severity.LOW))
+    assert r.has_blocking_findings() is False
+
+    r.findings[0] = Finding(severity=Severity.CRITICAL)
+    assert r.has_blocking_findings() is True
+    assert r.severity_counts()[Severity.CRITICAL] == 1
+    assert r.summary()["has_blockers"] is True
+
+    r.findings.pop()
+    r.findings.append(Finding(severity=Severity.LOW))
+    assert r.summary()["has_blockers"] is False
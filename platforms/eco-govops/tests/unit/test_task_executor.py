@@ -0,0 +1,210 @@
+"""Tests for the TaskExecutor priority queue, retries, worker pool, and single-task runs."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from engine.executor.task_executor import (
+    DEFAULT_CONFIG,
+    ExecutorConfig,
+    TaskExecutor,
+    TaskPriority,
+    TaskStatus,
+)
+
+
+@pytest.fixture
+def executor() -> TaskExecutor:
+    """Serial executor so completion order follows queue order."""
+    return TaskExecutor(ExecutorConfig(max_concurrency=1, retry_backoff_seconds=0))
+
+
+class TestTaskPriority:
+    """Test the integer-valued priority enum."""
+
+    def test_value_is_weight_and_str_is_name(self) -> None:
+        assert sorted(TaskPriority) == [
+            TaskPriority.CRITICAL,
+            TaskPriority.HIGH,
+            TaskPriority.NORMAL,
+            TaskPriority.LOW,
+        ]
+        assert TaskPriority.HIGH.weight == 1
+        assert TaskPriority.HIGH == 1
+        assert str(TaskPriority.LOW) == "low"
+
+    def test_lookup_by_name(self) -> None:
+        assert TaskPriority("critical") is TaskPriority.CRITICAL
+        assert TaskPriority(2) is TaskPriority.NORMAL
+        with pytest.raises(ValueError):
+            TaskPriority("urgent")
+
+
+class TestDefaultConfig:
+    """Test the shared default configuration."""
+
+    def test_default_config_matches_validated_defaults(self) -> None:
+        assert ExecutorConfig() == DEFAULT_CONFIG
+        assert TaskExecutor()._config is DEFAULT_CONFIG
+
+
+class TestTaskOrdering:
+    """Test priority and submission ordering."""
+
+    @pytest.mark.asyncio
+    async def test_runs_by_priority_then_submission_order(
+        self, executor: TaskExecutor
+    ) -> None:
+        order: list[str] = []
+
+        async def record(label: str) -> str:
+            order.append(label)
+            return label
+
+        await executor.submit("low", record, "low", priority=TaskPriority.LOW)
+        await executor.submit("normal-1", record, "normal-1")
+        await executor.submit("critical", record, "critical", priority=TaskPriority.CRITICAL)
+        await executor.submit("normal-2", record, "normal-2")
+        assert executor.pending_count == 4
+
+        results = await executor.run_all()
+        assert order == ["critical", "normal-1", "normal-2", "low"]
+        assert [r.output for r in results] == order
+        assert all(r.status == TaskStatus.COMPLETED for r in results)
+        assert executor.pending_count == 0
+
+
+class TestRunOne:
+    """Test executing a single queued task by ID."""
+
+    @pytest.mark.asyncio
+    async def test_run_one_leaves_other_tasks_queued(self, executor: TaskExecutor) -> None:
+        async def echo(value: int) -> int:
+            return value
+
+        first = await executor.submit("first", echo, 1)
+        second = await executor.submit("second", echo, 2, priority=TaskPriority.HIGH)
+        third = await executor.submit("third", echo, 3, priority=TaskPriority.LOW)
+
+        result = await executor.run_one(first)
+        assert result is not None
+        assert result.output == 1
+        assert executor.pending_count == 2
+        assert await executor.run_one(first) is None
+
+        remaining = await executor.run_all()
+        assert [r.task_id for r in remaining] == [second, third]
+
+    @pytest.mark.asyncio
+    async def test_run_one_drained_queue_runs_nothing_twice(
+        self, executor: TaskExecutor
+    ) -> None:
+        async def echo(value: int) -> int:
+            return value
+
+        ids = [await executor.submit(f"task-{i}", echo, i) for i in range(3)]
+        for task_id in reversed(ids):
+            result = await executor.run_one(task_id)
+            assert result is not None
+        assert executor.pending_count == 0
+        assert await executor.run_all() == []
+
+    @pytest.mark.asyncio
+    async def test_run_one_unknown_task(self, executor: TaskExecutor) -> None:
+        assert await executor.run_one("missing") is None
+
+
+class TestRetries:
+    """Test retry and failure handling."""
+
+    @pytest.mark.asyncio
+    async def test_retries_until_success(self, executor: TaskExecutor) -> None:
+        calls: list[int] = []
+
+        async def flaky() -> str:
+            calls.append(1)
+            if len(calls) < 3:
+                raise RuntimeError("boom")
+            return "ok"
+
+        task_id = await executor.submit("flaky", flaky, max_retries=2)
+        [result] = await executor.run_all()
+        assert result.status == TaskStatus.COMPLETED
+        assert result.attempts == 3
+        assert executor.get_result(task_id) is result
+
+    @pytest.mark.asyncio
+    async def test_exhausted_retries_fail(self, executor: TaskExecutor) -> None:
+        async def broken() -> None:
+            raise ValueError("bad input")
+
+        await executor.submit("broken", broken, max_retries=1)
+        [result] = await executor.run_all()
+        assert result.status == TaskStatus.FAILED
+        assert result.attempts == 2
+        assert result.error == "ValueError: bad input"
+
+
+class TestConcurrency:
+    """Test the bounded worker pool and cancellation."""
+
+    @pytest.mark.asyncio
+    async def test_in_flight_tasks_bounded_by_max_concurrency(self) -> None:
+        executor = TaskExecutor(ExecutorConfig(max_concurrency=2))
+        in_flight = 0
+        peak = 0
+
+        async def work() -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+
+        for i in range(6):
+            await executor.submit(f"work-{i}", work)
+        results = await executor.run_all()
+        assert len(results) == 6
+        assert peak == 2
+        assert executor.running_count == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_all_cancels_running_and_queued(self) -> None:
+        executor = TaskExecutor(ExecutorConfig(max_concurrency=1))
+        started = asyncio.Event()
+
+        async def block() -> None:
+            started.set()
+            await asyncio.sleep(10)
+
+        for i in range(3):
+            await executor.submit(f"block-{i}", block)
+        run = asyncio.create_task(executor.run_all())
+        await started.wait()
+        assert executor.running_count == 1
+        assert await executor.cancel_all() == 3
+
+        results = await run
+        assert [r.status for r in results] == [TaskStatus.CANCELLED] * 3
+
+    @pytest.mark.asyncio
+    async def test_cancelling_run_all_stops_the_workers(self) -> None:
+        executor = TaskExecutor(ExecutorConfig(max_concurrency=2))
+        started: list[int] = []
+
+        async def slow(index: int) -> None:
+            started.append(index)
+            await asyncio.sleep(0.2)
+
+        for i in range(10):
+            await executor.submit(f"slow-{i}", slow, i)
+
+        loop = asyncio.get_running_loop()
+        begin = loop.time()
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(executor.run_all(), timeout=0.05)
+        assert loop.time() - begin < 0.2
+        await asyncio.sleep(0.3)
+        assert started == [0, 1]
+        assert executor.running_count == 0
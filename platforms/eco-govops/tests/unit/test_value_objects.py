@@ -45,6 +45,16 @@ def test_compliance_score_auto_grade():
     assert ComplianceScore(score=50.0).grade == "F"
 
 
+def test_compliance_score_grade_boundaries():
+    assert ComplianceScore(score=100.0).grade == "A"
+    assert ComplianceScore(score=90.0).grade == "A"
+    assert ComplianceScore(score=89.99).grade == "B"
+    assert ComplianceScore(score=80.0).grade == "B"
+    assert ComplianceScore(score=60.0).grade == "D"
+    assert ComplianceScore(score=59.99).grade == "F"
+    assert ComplianceScore(score=0.0).grade == "F"
+
+
 def test_compliance_score_explicit_grade():
     s = ComplianceScore(score=50.0, grade="X")
     assert s.grade == "X"
@@ -68,6 +78,15 @@ def test_compliance_score_is_passing():
     assert ComplianceScore(score=50.0).is_passing is False
 
 
+def test_compliance_score_derived_fields_are_not_init_args():
+    s = ComplianceScore(score=92.0).with_details(rule="R1")
+    assert s.status == ComplianceStatus.COMPLIANT
+    assert s.is_passing is True
+    assert s == ComplianceScore(score=92.0, details={"rule": "R1"})
+    with pytest.raises(TypeError):
+        ComplianceScore(score=92.0, status=ComplianceStatus.EXEMPT)
+
+
 def test_compliance_score_meets_threshold():
     s = ComplianceScore(score=80.0)
     assert s.meets_threshold(75.0) is True